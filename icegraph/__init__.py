@@ -1,18 +1,17 @@
 # Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
 # Developed by Taylor St Jean
 
-from . import console
-from .data import extractor, cache, converter
-from . import data
-from . import config
-from . import render
+from typing import TYPE_CHECKING
 
-__all__ = [
-    "cache",
-    "console",
-    "extractor",
-    "converter",
-    "data",
-    "config",
-    "render",
-]
+from .lazy import attach
+
+# subpackages are imported on first attribute access, so `import icegraph` stays cheap
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=["console", "data", "config", "render", "geometry", "profiling", "benchmark", "cluster", "resources"],
+    attributes={"cache": ".data", "extractor": ".data", "converter": ".data"}
+)
+
+if TYPE_CHECKING:
+    from . import console, data, config, render, geometry, profiling, benchmark, cluster, resources
+    from .data import extractor, cache, converter
@@ -0,0 +1,74 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+import argparse
+import sys
+from pathlib import Path
+
+from icegraph.config import IGConfig
+from icegraph.console import Console
+from icegraph.profiling import Profiler
+
+
+def build(args: argparse.Namespace) -> int:
+    """
+    Extract, convert, index and summarize a dataset ahead of time, and register it in the conversion cache.
+
+    Returns:
+        int: Exit code.
+    """
+    from icegraph.data.builder import DatasetBuilder
+
+    config = IGConfig(args.config)
+
+    # enable instrumentation if requested in the config, the report is written at exit
+    Profiler.configure(config)
+
+    builder = DatasetBuilder(
+        config,
+        extract_workers=args.extract_workers,
+        dask_workers=args.dask_workers,
+        resume=not args.restart
+    )
+    output_dir = builder.run(args.stages)
+    Console.out(f"Build complete: {output_dir}")
+
+    return 0
+
+
+def main() -> int:
+    """
+    IceGraph command line interface.
+
+    Returns:
+        int: Exit code of the command.
+    """
+    from icegraph.data.builder import DatasetBuilder
+
+    parser = argparse.ArgumentParser(prog="python -m icegraph", description="IceGraph command line interface.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = commands.add_parser(
+        "build",
+        help="preprocess a dataset on a batch node",
+        description="Extract, convert, index and summarize a dataset, and register it in the conversion cache."
+    )
+    build_parser.add_argument("config", type=Path, nargs="?", default=Path("config/config.yaml"), help="config file")
+    build_parser.add_argument(
+        "--stages", nargs="+", choices=DatasetBuilder.STAGES, default=None, help="stages to run, defaults to all"
+    )
+    build_parser.add_argument(
+        "--extract-workers", type=int, default=None, help="input files extracted in parallel, defaults to what fits"
+    )
+    build_parser.add_argument(
+        "--dask-workers", type=int, default=None, help="workers of a local Dask cluster for conversion and statistics"
+    )
+    build_parser.add_argument("--restart", action="store_true", help="discard the progress of earlier builds")
+    build_parser.set_defaults(func=build)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,15 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+from typing import TYPE_CHECKING
+
+from icegraph.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={"SyntheticDataset": ".synthetic", "BenchmarkResult": ".models", "BenchmarkSuite": ".models"}
+)
+
+if TYPE_CHECKING:
+    from .synthetic import SyntheticDataset
+    from .models import BenchmarkResult, BenchmarkSuite
@@ -0,0 +1,61 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from icegraph.console import Console
+from .models import BenchmarkSuite
+
+
+def main() -> int:
+    """
+    Run the IceGraph benchmark suite on a synthetic dataset.
+
+    Returns:
+        int: Exit code, 1 if any benchmark regressed past its threshold.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m icegraph.benchmark",
+        description="Run the IceGraph benchmark suite on a synthetic dataset, and compare it against a baseline."
+    )
+    parser.add_argument("--events", type=int, default=1000, help="number of synthetic events")
+    parser.add_argument("--mean-doms", type=float, default=40.0, help="mean number of hit DOMs per event")
+    parser.add_argument("--repeats", type=int, default=5, help="repeats per timing, the median is reported")
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 2, 4], help="DataLoader worker counts")
+    parser.add_argument("--work-dir", type=Path, default=None, help="directory for the synthetic dataset")
+    parser.add_argument("--only", nargs="+", default=None, help="names of the benchmarks to run")
+    parser.add_argument("--output", type=Path, default=Path("benchmark.json"), help="JSON report path")
+    parser.add_argument("--baseline", type=Path, default=None, help="previous JSON report to compare against")
+    parser.add_argument("--thresholds", type=Path, default=None, help="JSON mapping of benchmark name to threshold")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    suite = BenchmarkSuite(
+        work_dir=args.work_dir,
+        num_events=args.events,
+        mean_doms=args.mean_doms,
+        repeats=args.repeats,
+        dataloader_workers=tuple(args.workers),
+        seed=args.seed
+    )
+    results = suite.run(args.only)
+
+    thresholds = json.loads(args.thresholds.read_text()) if args.thresholds else None
+    regressions = BenchmarkSuite.write_report(results, args.output, args.baseline, thresholds)
+    Console.out(f"Benchmark report saved to {args.output}")
+
+    for regression in regressions:
+        Console.out(
+            f"{regression['name']} regressed by {regression['slowdown']:.1%} "
+            f"(threshold {regression['threshold']:.0%})",
+            severity=3
+        )
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,439 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+import sys
+import json
+import math
+import time
+import platform
+import subprocess
+import statistics
+import tempfile
+import yaml
+from pathlib import Path
+from typing import Callable, Union, Optional, Any
+
+import numpy as np
+
+from icegraph.config import IGConfig
+from icegraph.config.hash_utils import hash_directory
+from icegraph.config.schemas import STORAGE_PROFILES
+from icegraph.console import Console
+from .synthetic import SyntheticDataset, SyntheticFrameSource
+
+
+__all__ = ["BenchmarkResult", "BenchmarkSuite", "collate_samples"]
+
+def collate_samples(samples: list) -> list:
+    """
+    Collate function returning the list of samples unchanged.
+
+    Events have a variable number of DOMs, so the default torch collation cannot stack them.
+    Defined at module level so DataLoader workers can pickle it.
+    """
+    return samples
+
+
+class BenchmarkResult:
+    """
+    A single benchmark measurement.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        value: float,
+        unit: str,
+        higher_is_better: bool,
+        timings: list[float],
+        params: Optional[dict] = None
+    ) -> None:
+        """
+        Initialize a benchmark result.
+
+        Args:
+            name (str): Unique benchmark name, used to match results against a baseline.
+            value (float): Headline value of the benchmark.
+            unit (str): Unit of `value`.
+            higher_is_better (bool): Whether larger values are improvements (throughputs) or not (latencies).
+            timings (list[float]): Raw wall times of every repeat, in seconds.
+            params (Optional[dict]): Parameters the benchmark was run with.
+        """
+        self.name = name
+        self.value = value
+        self.unit = unit
+        self.higher_is_better = higher_is_better
+        self.timings = timings
+        self.params = params or {}
+
+    def to_dict(self) -> dict:
+        """
+        Serialize the result for the JSON report.
+
+        Returns:
+            dict: JSON-compatible representation of the result.
+        """
+        return {
+            "name": self.name,
+            "value": self.value,
+            "unit": self.unit,
+            "higher_is_better": self.higher_is_better,
+            "timings": self.timings,
+            "params": self.params,
+        }
+
+    def regression(self, baseline: dict, threshold: float) -> Optional[float]:
+        """
+        Compare against a baseline result.
+
+        Args:
+            baseline (dict): Baseline result, as written by `to_dict`.
+            threshold (float): Maximum allowed relative slowdown (e.g. 0.2 for 20%).
+
+        Returns:
+            Optional[float]: Relative slowdown if it exceeds the threshold, otherwise None.
+        """
+        if baseline.get("value") is None:
+            return None
+        if baseline["value"] == 0:
+            worse = self.value < 0 if self.higher_is_better else self.value > 0
+            return math.inf if worse else None
+
+        change = (self.value - baseline["value"]) / baseline["value"]
+        slowdown = -change if self.higher_is_better else change
+
+        return slowdown if slowdown > threshold else None
+
+
+class BenchmarkSuite:
+    """
+    Benchmarks the IceGraph data path on a synthetic dataset.
+
+    Each benchmark is a method named `bench_*` which returns one or more BenchmarkResult objects.
+    Results are written as JSON, and can be compared against a previous report with per-benchmark
+    regression thresholds.
+    """
+
+    DEFAULT_THRESHOLD = 0.2
+
+    # modules which must not be loaded by a bare `import icegraph`
+    HEAVY_MODULES = ("torch", "pandas", "pyarrow", "matplotlib", "numpy", "icecube", "dask")
+
+    def __init__(
+        self,
+        work_dir: Optional[Union[str, Path]] = None,
+        num_events: int = 1000,
+        mean_doms: float = 40.0,
+        repeats: int = 5,
+        dataloader_workers: tuple[int, ...] = (0, 2, 4),
+        seed: int = 0
+    ) -> None:
+        """
+        Initialize the benchmark suite.
+
+        Args:
+            work_dir (Optional[Union[str, Path]]): Directory for the synthetic dataset. Defaults to a temporary directory.
+            num_events (int): Number of synthetic events.
+            mean_doms (float): Mean number of hit DOMs per event.
+            repeats (int): Number of repeats per timing; the median is reported.
+            dataloader_workers (tuple[int, ...]): DataLoader worker counts to measure throughput for.
+            seed (int): Random seed for the synthetic dataset and sampling.
+        """
+        self._tmp_dir = None if work_dir else tempfile.TemporaryDirectory(prefix="icegraph-bench-")
+        self.work_dir = Path(work_dir or self._tmp_dir.name)
+        self.repeats = repeats
+        self.dataloader_workers = dataloader_workers
+        self.seed = seed
+
+        self.synthetic = SyntheticDataset(self.work_dir, num_events=num_events, mean_doms=mean_doms, seed=seed)
+        self._config: IGConfig | None = None
+
+    @property
+    def config(self) -> IGConfig:
+        """
+        Generates the synthetic dataset on first access and returns its configuration.
+
+        Returns:
+            IGConfig: Configuration object for the synthetic dataset.
+        """
+        if self._config is None:
+            Console.out(f"Generating synthetic dataset: {self.work_dir}")
+            self._config = self.synthetic.generate()
+        return self._config
+
+    def _time(self, func: Callable[[], Any], setup: Optional[Callable[[], Any]] = None) -> list[float]:
+        """
+        Time a callable over the configured number of repeats.
+
+        Args:
+            func (Callable[[], Any]): Callable to time.
+            setup (Optional[Callable[[], Any]]): Untimed callable run before every repeat.
+
+        Returns:
+            list[float]: Wall time of each repeat, in seconds.
+        """
+        timings = []
+        for _ in range(self.repeats):
+            if setup:
+                setup()
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        return timings
+
+    def _split(self, subset: str = "train"):
+        from icegraph.data import TrainingDataset, ValidationDataset, TestDataset
+
+        split_cls = {"train": TrainingDataset, "validation": ValidationDataset, "test": TestDataset}[subset]
+        return split_cls(self.synthetic.parquet_dir, self.config)
+
+    def bench_getitem(self) -> list[BenchmarkResult]:
+        """
+        Per-sample latency of IGData.__getitem__ in random order.
+        """
+        data = self._split()
+        rng = np.random.default_rng(self.seed)
+        indices = rng.integers(0, len(data), min(len(data), 200))
+
+        def run():
+            for idx in indices:
+                data[int(idx)]
+
+        timings = self._time(run)
+        return [BenchmarkResult(
+            "igdata.getitem",
+            statistics.median(timings) / len(indices) * 1e3,
+            "ms/sample",
+            False,
+            timings,
+            {"samples": len(indices)}
+        )]
+
+    def bench_split_selection(self) -> list[BenchmarkResult]:
+        """
+        Time to construct a split, which loads the truth table and applies the selection string.
+        """
+        timings = self._time(lambda: self._split("train"))
+        return [BenchmarkResult("igdata.split_selection", statistics.median(timings), "s", False, timings)]
+
+    def bench_convert(self) -> list[BenchmarkResult]:
+        """
+        Throughput of HDF5ToParquet.convert on the synthetic ml_suite-layout HDF5 file.
+        """
+        from icegraph.data.converter import HDF5ToParquet
+
+        output_dir = self.work_dir / "bench_convert"
+        converter = HDF5ToParquet(self.config, self.synthetic.hdf5_path, output_dir)
+
+        timings = self._time(lambda: converter.convert(resume=False))
+        return [BenchmarkResult(
+            "converter.hdf5_to_parquet",
+            self.synthetic.num_events / statistics.median(timings),
+            "events/s",
+            True,
+            timings
+        )]
+
+    def bench_extract_arrow(self) -> list[BenchmarkResult]:
+        """
+        Throughput of the Arrow-native extraction writer, fed by synthetic frames.
+        """
+        from icegraph.data.extractor import FeatureExtractor
+
+        config = self.config
+        extractor = FeatureExtractor(config, self.synthetic.input_dir)
+        source = SyntheticFrameSource(self.synthetic, config)
+
+        timings = self._time(lambda: extractor.extract_to_parquet(source, self.work_dir / "bench_extract_arrow", resume=False))
+        return [BenchmarkResult(
+            "extractor.arrow_writer",
+            self.synthetic.num_events / statistics.median(timings),
+            "events/s",
+            True,
+            timings
+        )]
+
+    def bench_storage_profiles(self) -> list[BenchmarkResult]:
+        """
+        On-disk size and full-pass read throughput of the converted output for each storage profile.
+
+        Each profile is converted once from the synthetic HDF5 file; only the reads are repeated.
+        """
+        from icegraph.data import TrainingDataset
+        from icegraph.data.converter import HDF5ToParquet
+
+        user_config = yaml.safe_load(self.config.user_config_path.read_text())
+
+        results = []
+        for name in STORAGE_PROFILES:
+            config_path = self.work_dir / f"config.{name}.yaml"
+            config_path.write_text(yaml.safe_dump(
+                {**user_config, "storage": {**user_config.get("storage", {}), "profile": name}}, sort_keys=False
+            ))
+            config = IGConfig(config_path)
+
+            output_dir = HDF5ToParquet(config, self.synthetic.hdf5_path, self.work_dir / "bench_storage" / name).convert(resume=False)
+            size = sum(p.stat().st_size for p in output_dir.rglob("*.parquet"))
+
+            data = TrainingDataset(output_dir, config)
+            timings = self._time(lambda: sum(len(batch) for batch in data.prefetcher(batch_size=64)))
+
+            results += [
+                BenchmarkResult(f"storage.{name}.size", size / 1e6, "MB", False, [], {"bytes": size}),
+                BenchmarkResult(
+                    f"storage.{name}.read",
+                    len(data) / statistics.median(timings),
+                    "events/s",
+                    True,
+                    timings,
+                    {"events": len(data), "bytes": size}
+                ),
+            ]
+        return results
+
+    def bench_hash_directory(self) -> list[BenchmarkResult]:
+        """
+        Throughput of hash_directory over the placeholder input files.
+        """
+        config = self.config
+        total_bytes = sum(p.stat().st_size for p in self.synthetic.input_dir.iterdir())
+
+        timings = self._time(lambda: hash_directory(self.synthetic.input_dir, config.user_config_path, ".i3.zst"))
+        return [BenchmarkResult(
+            "config.hash_directory",
+            total_bytes / statistics.median(timings) / 1e6,
+            "MB/s",
+            True,
+            timings,
+            {"bytes": total_bytes}
+        )]
+
+    def bench_dataloader(self) -> list[BenchmarkResult]:
+        """
+        DataLoader throughput over one epoch for each configured worker count.
+        """
+        from torch.utils.data import DataLoader
+
+        data = self._split()
+        results = []
+        for workers in self.dataloader_workers:
+            loader = DataLoader(data, batch_size=32, shuffle=True, num_workers=workers, collate_fn=collate_samples)
+
+            timings = self._time(lambda: sum(1 for _ in loader))
+            results.append(BenchmarkResult(
+                f"dataloader.throughput.workers={workers}",
+                len(data) / statistics.median(timings),
+                "events/s",
+                True,
+                timings,
+                {"num_workers": workers, "batch_size": 32}
+            ))
+        return results
+
+    def bench_import_time(self) -> list[BenchmarkResult]:
+        """
+        Cold import time of the package in a fresh interpreter, and heavy dependencies loaded by it.
+        """
+        probe = (
+            "import sys, time, json; start = time.perf_counter(); import icegraph; "
+            "elapsed = time.perf_counter() - start; "
+            f"print(json.dumps([elapsed, [m for m in {self.HEAVY_MODULES!r} if m in sys.modules]]))"
+        )
+
+        timings, loaded = [], []
+        for _ in range(self.repeats):
+            output = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True).stdout
+            elapsed, loaded = json.loads(output)
+            timings.append(elapsed)
+
+        return [
+            BenchmarkResult("import.icegraph", statistics.median(timings), "s", False, timings),
+            BenchmarkResult("import.icegraph.heavy_modules", len(loaded), "modules", False, [], {"loaded": loaded}),
+        ]
+
+    def benchmarks(self) -> dict[str, Callable[[], list[BenchmarkResult]]]:
+        """
+        Collect all benchmark methods of the suite.
+
+        Returns:
+            dict[str, Callable]: Mapping from benchmark name (without the `bench_` prefix) to method.
+        """
+        return {
+            name.removeprefix("bench_"): getattr(self, name)
+            for name in dir(self) if name.startswith("bench_")
+        }
+
+    def run(self, selected: Optional[list[str]] = None) -> list[BenchmarkResult]:
+        """
+        Run the selected benchmarks.
+
+        Args:
+            selected (Optional[list[str]]): Benchmark names to run. Defaults to all.
+
+        Returns:
+            list[BenchmarkResult]: Results of every benchmark run.
+        """
+        results = []
+        for name, bench in self.benchmarks().items():
+            if selected and name not in selected:
+                continue
+            Console.out(f"Running benchmark: {name}")
+            for result in bench():
+                Console.out(f"{result.name}: {result.value:.4g} {result.unit}")
+                results.append(result)
+        return results
+
+    @classmethod
+    def write_report(
+        cls,
+        results: list[BenchmarkResult],
+        path: Union[str, Path],
+        baseline: Optional[Union[str, Path]] = None,
+        thresholds: Optional[dict[str, float]] = None
+    ) -> list[dict]:
+        """
+        Write results as a JSON report, flagging regressions against an optional baseline report.
+
+        Args:
+            results (list[BenchmarkResult]): Results to write.
+            path (Union[str, Path]): Output JSON path.
+            baseline (Optional[Union[str, Path]]): Previous JSON report to compare against.
+            thresholds (Optional[dict[str, float]]): Relative regression threshold per benchmark name.
+                Benchmarks missing from the mapping use `DEFAULT_THRESHOLD`, or the threshold stored
+                in the baseline report.
+
+        Returns:
+            list[dict]: Regressions found, one entry per regressed benchmark.
+        """
+        baseline_report = json.loads(Path(baseline).read_text()) if baseline else {}
+        baseline_results = {r["name"]: r for r in baseline_report.get("benchmarks", [])}
+        thresholds = {**baseline_report.get("thresholds", {}), **(thresholds or {})}
+
+        regressions = []
+        for result in results:
+            threshold = thresholds.get(result.name, cls.DEFAULT_THRESHOLD)
+            thresholds[result.name] = threshold
+            if result.name not in baseline_results:
+                continue
+            if (slowdown := result.regression(baseline_results[result.name], threshold)) is not None:
+                regressions.append({
+                    "name": result.name,
+                    "value": result.value,
+                    "baseline": baseline_results[result.name]["value"],
+                    "slowdown": slowdown,
+                    "threshold": threshold,
+                })
+
+        report = {
+            "program": IGConfig.PROGRAM_NAME,
+            "version": IGConfig.PROGRAM_VERSION,
+            "timestamp": time.time(),
+            "platform": {"python": platform.python_version(), "machine": platform.machine(), "system": platform.system()},
+            "benchmarks": [result.to_dict() for result in results],
+            "thresholds": thresholds,
+            "baseline": str(baseline) if baseline else None,
+            "regressions": regressions,
+        }
+        Path(path).write_text(json.dumps(report, indent=2))
+
+        return regressions
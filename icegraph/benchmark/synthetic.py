@@ -0,0 +1,322 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+import yaml
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Callable, Union, Optional
+
+from icegraph.config import IGConfig
+from icegraph.data.extractor.objects import ExtractedEvent
+from icegraph.data.extractor.preselection import EventPreselection
+from icegraph.data.extractor.sources import FrameSource
+
+
+__all__ = ["SyntheticDataset", "SyntheticFrameSource"]
+
+class SyntheticDataset:
+    """
+    Generates a synthetic IceGraph dataset of configurable size without IceCube data or IceTray.
+
+    The generated directory mirrors what the real pipeline produces:
+
+    - `input/`: placeholder `.i3.zst` files, so input hashing has something to read,
+    - `config.yaml`: a copy of the template user config pointing at `input/`,
+    - `extraction/data.hdf5`: `ml_suite`-layout features and truth tables (long format, one row per vector entry),
+    - `parquet/features.parquet` and `parquet/truth.parquet`: the converted, event-keyed wide layout.
+
+    Feature columns are taken from the compiled vector mapping (the same one `generate_vector_mapping`
+    returns), so the data matches the real column mapping.
+    """
+
+    # IceCube in-ice geometry used to draw DOM keys
+    NUM_STRINGS = 86
+    NUM_OMS = 60
+
+    def __init__(
+        self,
+        output_dir: Union[str, Path],
+        num_events: int = 1000,
+        mean_doms: float = 40.0,
+        num_input_files: int = 4,
+        input_file_size: int = 1 << 20,
+        template_config: Optional[Union[str, Path]] = None,
+        row_group_size: Optional[int] = None,
+        seed: int = 0
+    ) -> None:
+        """
+        Initialize the generator. Nothing is written until `generate` is called.
+
+        Args:
+            output_dir (Union[str, Path]): Root directory of the synthetic dataset.
+            num_events (int): Number of events to generate.
+            mean_doms (float): Mean number of hit DOMs per event. DOM counts are drawn from a geometric
+                distribution, so the sizes vary the way real events do.
+            num_input_files (int): Number of placeholder `.i3.zst` input files.
+            input_file_size (int): Size of each placeholder input file, in bytes.
+            template_config (Optional[Union[str, Path]]): User config to copy. Defaults to the repository's
+                `config/config.yaml`.
+            row_group_size (Optional[int]): Row group size of the features file. Defaults to pyarrow's default.
+            seed (int): Random seed.
+        """
+        self.output_dir = Path(output_dir)
+        self.num_events = num_events
+        self.mean_doms = mean_doms
+        self.num_input_files = num_input_files
+        self.input_file_size = input_file_size
+        self.template_config = Path(
+            template_config or Path(__file__).resolve().parent.parent.parent / "config" / "config.yaml"
+        )
+        self.row_group_size = row_group_size
+        self.seed = seed
+
+        self.input_dir = self.output_dir / "input"
+        self.config_path = self.output_dir / "config.yaml"
+        self.hdf5_path = self.output_dir / "extraction" / "data.hdf5"
+        self.parquet_dir = self.output_dir / "parquet"
+
+    def generate(self, hdf5: bool = True, parquet: bool = True) -> IGConfig:
+        """
+        Write the synthetic dataset to disk.
+
+        Args:
+            hdf5 (bool): Whether to write the `ml_suite`-layout HDF5 file.
+            parquet (bool): Whether to write the converted Parquet files.
+
+        Returns:
+            IGConfig: Configuration object for the synthetic dataset.
+        """
+        config = self._write_inputs()
+        rng = np.random.default_rng(self.seed)
+
+        event_ids, dom_keys, values = self._draw_events(rng, len(config.compiled.feature_columns))
+        truth = self._draw_truth(rng, event_ids)
+
+        if hdf5:
+            self._write_hdf5(config, event_ids, dom_keys, values, truth)
+        if parquet:
+            self._write_parquet(config, event_ids, dom_keys, values, truth)
+
+        return config
+
+    def _write_inputs(self) -> IGConfig:
+        """
+        Write the placeholder input files and the user config.
+
+        Returns:
+            IGConfig: Configuration object for the synthetic dataset.
+        """
+        self.input_dir.mkdir(parents=True, exist_ok=True)
+        rng = np.random.default_rng(self.seed)
+        for i in range(self.num_input_files):
+            path = self.input_dir / f"synthetic_{i:04d}.i3.zst"
+            path.write_bytes(rng.integers(0, 256, self.input_file_size, dtype=np.uint8).tobytes())
+
+        with self.template_config.open("r") as file:
+            user_config = yaml.safe_load(file)
+
+        user_config["input_dir"] = str(self.input_dir)
+        user_config["output_dir"] = str(self.output_dir / "plots")
+        self.config_path.write_text(yaml.safe_dump(user_config, sort_keys=False))
+
+        return IGConfig(self.config_path)
+
+    def _draw_events(self, rng: np.random.Generator, num_features: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Draw hit DOMs and feature values for every event.
+
+        Args:
+            rng (np.random.Generator): Random number generator.
+            num_features (int): Length of each DOM's feature vector.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]:
+                - Event numbers, one per DOM row (num_rows,)
+                - DOM keys [string, om, pmt] (num_rows, 3)
+                - Feature values (num_rows, num_features)
+        """
+        num_doms = self.NUM_STRINGS * self.NUM_OMS
+        counts = np.minimum(rng.geometric(1.0 / self.mean_doms, self.num_events), num_doms)
+
+        # draw distinct DOMs per event, sorted so rows follow the converter's (event, dom) ordering
+        flat_doms = np.concatenate([np.sort(rng.choice(num_doms, count, replace=False)) for count in counts])
+        event_ids = np.repeat(np.arange(self.num_events), counts)
+
+        dom_keys = np.column_stack([
+            flat_doms // self.NUM_OMS + 1,
+            flat_doms % self.NUM_OMS + 1,
+            np.zeros_like(flat_doms)
+        ])
+        values = rng.exponential(1.0, (len(flat_doms), num_features))
+
+        return event_ids, dom_keys, values
+
+    @staticmethod
+    def _draw_truth(rng: np.random.Generator, event_ids: np.ndarray) -> pd.DataFrame:
+        """
+        Draw truth quantities for every event.
+
+        Args:
+            rng (np.random.Generator): Random number generator.
+            event_ids (np.ndarray): Event numbers, one per DOM row.
+
+        Returns:
+            pd.DataFrame: Truth table with one row per event.
+        """
+        events = np.unique(event_ids)
+        return pd.DataFrame({
+            "Event": events,
+            "PrimaryNeutrinoEnergy": 10 ** rng.uniform(2, 7, len(events)),
+            "PrimaryNeutrinoZenith": np.arccos(rng.uniform(-1, 1, len(events))),
+            "PrimaryNeutrinoAzimuth": rng.uniform(0, 2 * np.pi, len(events)),
+            "OneWeight": rng.exponential(1.0, len(events)),
+        })
+
+    @staticmethod
+    def _id_frame(config: IGConfig, events: np.ndarray) -> pd.DataFrame:
+        """
+        Build the standard event ID columns for the given event numbers.
+
+        Args:
+            config (IGConfig): Configuration object for the synthetic dataset.
+            events (np.ndarray): Event numbers.
+
+        Returns:
+            pd.DataFrame: Event ID columns in the order of the standard ID column config.
+        """
+        defaults = {"Run": 1, "SubEvent": 0, "SubEventStream": 0, "exists": 1}
+        return pd.DataFrame({
+            col: events if col == "Event" else np.full(len(events), defaults.get(col, 0))
+            for col in config.compiled.event_id_columns
+        })
+
+    def _write_hdf5(
+        self,
+        config: IGConfig,
+        event_ids: np.ndarray,
+        dom_keys: np.ndarray,
+        values: np.ndarray,
+        truth: pd.DataFrame
+    ) -> None:
+        """
+        Write the features and truth tables in the long layout produced by `ml_suite` and `hdfwriter`.
+        """
+        num_rows, num_features = values.shape
+        dom_id_columns = config.compiled.dom_id_columns
+
+        features = self._id_frame(config, np.repeat(event_ids, num_features))
+        for i, col in enumerate(dom_id_columns):
+            features[col] = np.repeat(dom_keys[:, i], num_features)
+        features["vector_index"] = np.tile(np.arange(num_features), num_rows)
+        features["item"] = values.ravel()
+
+        truth_table = pd.concat(
+            [self._id_frame(config, truth["Event"].to_numpy()), truth.drop(columns="Event")], axis=1
+        )
+
+        self.hdf5_path.parent.mkdir(parents=True, exist_ok=True)
+        self.hdf5_path.unlink(missing_ok=True)
+        features.to_hdf(self.hdf5_path, key=config.compiled.table_names.features, format="table")
+        truth_table.to_hdf(self.hdf5_path, key=config.compiled.table_names.truth, format="table")
+
+    def _write_parquet(
+        self,
+        config: IGConfig,
+        event_ids: np.ndarray,
+        dom_keys: np.ndarray,
+        values: np.ndarray,
+        truth: pd.DataFrame
+    ) -> None:
+        """
+        Write the features and truth tables in the wide, event-keyed layout produced by `HDF5ToParquet`.
+        """
+        id_columns = config.compiled.event_id_columns
+        dom_id_columns = config.compiled.dom_id_columns
+
+        def composite(table: pd.DataFrame, columns: list[str]) -> pd.Series:
+            keys = pd.Series("", index=table.index)
+            for i, col in enumerate(columns):
+                keys = keys + ("|" if i else "") + f"{col}=" + table[col].astype(str)
+            return keys
+
+        event_keys = composite(self._id_frame(config, truth["Event"].to_numpy()), id_columns).to_numpy()
+        dom_frame = pd.DataFrame(dom_keys, columns=dom_id_columns)
+
+        features = pd.DataFrame(values, columns=list(config.compiled.feature_columns))
+        features.insert(0, "event_id", event_keys[event_ids])
+        features.insert(0, "dom_id", composite(dom_frame, dom_id_columns).to_numpy())
+
+        truth_table = truth.drop(columns="Event")
+        truth_table.insert(0, "event_id", event_keys)
+
+        self.parquet_dir.mkdir(parents=True, exist_ok=True)
+        features.to_parquet(self.parquet_dir / "features.parquet", row_group_size=self.row_group_size)
+        truth_table.reset_index().to_parquet(self.parquet_dir / "truth.parquet")
+
+
+class SyntheticFrameSource(FrameSource):
+    """
+    Produces the events of a SyntheticDataset as a frame source, so that extraction writers can be
+    tested and benchmarked without IceTray.
+
+    Events are drawn exactly as by `SyntheticDataset.generate`, so the output can be compared against
+    the conversion of the synthetic HDF5 file. The configured pre-selection is applied, as in the tray.
+    """
+
+    def __init__(self, synthetic: SyntheticDataset, config: IGConfig) -> None:
+        """
+        Initialize the source.
+
+        Args:
+            synthetic (SyntheticDataset): Synthetic dataset whose events to produce.
+            config (IGConfig): Configuration object for the synthetic dataset.
+        """
+        self.synthetic = synthetic
+        self._config: IGConfig = config
+
+        self.preselection: EventPreselection | None = None
+        if config.compiled.preselection.active:
+            self.preselection = EventPreselection(config)
+
+    def stream(self, sink: Callable[[ExtractedEvent], None]) -> int:
+        """
+        Pass every synthetic event to the sink.
+
+        Args:
+            sink (Callable[[ExtractedEvent], None]): Called once per event, in order.
+
+        Returns:
+            int: Number of events produced.
+        """
+        rng = np.random.default_rng(self.synthetic.seed)
+        event_ids, dom_keys, values = self.synthetic._draw_events(rng, len(self._config.compiled.feature_columns))
+        truth = self.synthetic._draw_truth(rng, event_ids)
+
+        ids = self.synthetic._id_frame(self._config, truth["Event"].to_numpy()).to_dict("records")
+        truth_records = truth.drop(columns="Event").to_dict("records")
+        bounds = np.searchsorted(event_ids, np.arange(len(ids) + 1))
+
+        energy_key = self._config.compiled.preselection.energy_key
+        count = 0
+        for i, (event_ids_row, truth_row) in enumerate(zip(ids, truth_records)):
+            start, stop = bounds[i], bounds[i + 1]
+            event = ExtractedEvent(
+                ids={col: int(value) for col, value in event_ids_row.items()},
+                doms=dom_keys[start:stop],
+                features=values[start:stop],
+                truth=truth_row
+            )
+
+            if self.preselection is not None:
+                event_key = tuple(event.ids.get(col, 0) for col in ("Run", "Event", "SubEvent"))
+                if not self.preselection.accept(event_key, truth_row.get(energy_key), stop - start):
+                    continue
+
+            sink(event)
+            count += 1
+
+        if self.preselection is not None:
+            self.preselection.report()
+
+        return count
@@ -0,0 +1,92 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+from typing import Optional, TYPE_CHECKING
+
+from icegraph.config import IGConfig
+from icegraph.console import Console
+from icegraph.resources import ResourceGovernor
+
+if TYPE_CHECKING:
+    from distributed import Client, LocalCluster
+
+
+__all__ = ["DaskCluster"]
+
+class DaskCluster:
+    """
+    Provides a Dask client for distributed conversion and dataset-wide reductions.
+
+    Connects to the scheduler configured in `dask.scheduler` (e.g. one started with `dask scheduler`
+    and `dask worker` on several nodes), or starts a LocalCluster on this node when none is configured.
+    Unless set, the size of a local cluster is picked by the ResourceGovernor, and its workers share the
+    memory left under the governor's ceiling, so Dask spills and pauses them before the node runs out.
+    Workers read input and write output directly, so on a multi-node scheduler all paths must be on a
+    shared filesystem.
+
+    Intended to be used as a context manager; a cluster started here is shut down on exit.
+    """
+
+    def __init__(self, config: IGConfig, client: Optional["Client"] = None, n_workers: Optional[int] = None) -> None:
+        """
+        Initialize the cluster handle. Nothing is started until entering the context.
+
+        Args:
+            config (IGConfig): IceGraph configuration object containing user settings.
+            client (Optional[Client]): An existing client to use instead. It is not closed on exit.
+            n_workers (Optional[int]): Number of workers of a local cluster, overriding `dask.n_workers`.
+        """
+        self._config: IGConfig = config
+        self.n_workers = n_workers
+        self.client: Optional["Client"] = client
+        self._owns_client = client is None
+        self._cluster: Optional["LocalCluster"] = None
+
+    def __enter__(self) -> "Client":
+        """
+        Connect to the configured scheduler, or start a local cluster.
+
+        Returns:
+            Client: Dask client.
+
+        Raises:
+            ImportError: If `distributed` is not installed.
+        """
+        if self.client is not None:
+            return self.client
+
+        try:
+            from distributed import Client, LocalCluster
+        except ImportError as e:
+            raise ImportError("The Dask backend requires the 'distributed' package: pip install distributed") from e
+
+        settings = self._config.compiled.dask
+        if settings.scheduler:
+            Console.out(f"Connecting to Dask scheduler: {settings.scheduler}")
+            self.client = Client(settings.scheduler)
+        else:
+            governor = ResourceGovernor(self._config)
+            n_workers = self.n_workers or settings.n_workers or governor.conversion_workers()
+            self._cluster = LocalCluster(
+                n_workers=n_workers,
+                threads_per_worker=settings.threads_per_worker,
+                memory_limit=governor.worker_memory(n_workers),
+                processes=True
+            )
+            self.client = Client(self._cluster)
+            Console.out(f"Started local Dask cluster: {self.client.dashboard_link}")
+
+        return self.client
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """
+        Close the client and shut down the local cluster, if they were created here.
+        """
+        if not self._owns_client:
+            return
+        if self.client is not None:
+            self.client.close()
+            self.client = None
+        if self._cluster is not None:
+            self._cluster.close()
+            self._cluster = None
@@ -2,5 +2,7 @@
 # Developed by Taylor St Jean
 
 from .models import IGConfig
+from .schemas import CompiledConfig
+from .exceptions import ConfigValidationError
 
-__all__ = ["IGConfig"]
+__all__ = ["IGConfig", "CompiledConfig", "ConfigValidationError"]
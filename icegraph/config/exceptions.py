@@ -0,0 +1,10 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+
+class ConfigValidationError(Exception):
+
+    def __init__(self, config_path, errors: list[str]):
+        self.errors = errors
+        message = f"Invalid configuration {config_path}:\n" + "\n".join(f"  - {error}" for error in errors)
+        super().__init__(message)
@@ -5,22 +5,28 @@ import xxhash
 from pathlib import Path
 
 
-__all__ = ["hash_directory"]
+__all__ = ["hash_directory", "hash_input_files"]
 
-def hash_directory(input_dir: Path, config_file: Path, input_file_ext: str) -> str:
+def hash_input_files(input_dir: Path, input_file_ext: str) -> str:
     """
-    Generate a unique hash for a directory of files and a config file.
+    Generate a unique hash for the input files of a directory alone.
 
     Args:
         input_dir (Path): Path to directory containing input files.
-        config_file (Path): Path to the YAML configuration file.
         input_file_ext (str): File extension of input files.
 
     Returns:
         str: A consistent xxHash64 hash string.
     """
     h = xxhash.xxh64()
+    _update_with_files(h, input_dir, input_file_ext)
+    return h.hexdigest()
 
+
+def _update_with_files(h: "xxhash.xxh64", input_dir: Path, input_file_ext: str) -> None:
+    """
+    Feed the names and contents of the input files of a directory to a hash.
+    """
     for file in sorted(input_dir.iterdir()):
         if file.is_file() and file.name.endswith(input_file_ext):
             h.update(file.name.encode())
@@ -28,6 +34,22 @@ def hash_directory(input_dir: Path, config_file: Path, input_file_ext: str) -> s
                 while chunk := f.read(8192):
                     h.update(chunk)
 
+
+def hash_directory(input_dir: Path, config_file: Path, input_file_ext: str) -> str:
+    """
+    Generate a unique hash for a directory of files and a config file.
+
+    Args:
+        input_dir (Path): Path to directory containing input files.
+        config_file (Path): Path to the YAML configuration file.
+        input_file_ext (str): File extension of input files.
+
+    Returns:
+        str: A consistent xxHash64 hash string.
+    """
+    h = xxhash.xxh64()
+    _update_with_files(h, input_dir, input_file_ext)
+
     if not config_file.is_file():
         raise FileNotFoundError(f"Config file not found: {config_file}")
 
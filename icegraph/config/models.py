@@ -5,9 +5,10 @@ import yaml
 from pathlib import Path
 from typing import Union, Any, Optional
 from dotmap import DotMap
-import tempfile
 
-from .hash_utils import hash_directory
+from .hash_utils import hash_directory, hash_input_files
+from .schemas import CompiledConfig
+from icegraph.profiling import Profiler
 
 
 __all__ = ["IGConfig"]
@@ -19,6 +20,10 @@ class IGConfig:
     This class reads user and internal configuration files, provides structured access
     to relevant settings, computes input hashes for caching, and generates
     config files for external tools (e.g., `ml_suite`).
+
+    The configuration is validated and compiled once into a frozen CompiledConfig, available as
+    `IGConfig.compiled`, which hot paths should prefer over the DotMap views. IGConfig objects are
+    picklable and carry the compiled configuration and input hash with them.
     """
 
     # constants
@@ -55,12 +60,45 @@ class IGConfig:
         self._feature_map_config_cache: dict | None = None
         self._standard_id_col_config_cache: dict | None = None
         self._input_hash_cache: str | None = None
+        self._input_files_hash_cache: str | None = None
+        self._compiled_cache: CompiledConfig | None = None
 
-        # fallback GCD file
-        self.gcd_path = Path(
-            self.user_config.gcd_path or
-            "/cvmfs/icecube.opensciencegrid.org/data/GCD/GeoCalibDetectorStatus_IC86.All_Pass2.i3.gz"
-        )
+        # validate and compile up front so configuration errors surface immediately
+        self.validate()
+
+        # GCD file, with fallback already applied at compile time
+        self.gcd_path = self.compiled.gcd_path
+
+    def __getstate__(self) -> dict:
+        """
+        Prepare the config for pickling, e.g. when sent to DataLoader workers.
+
+        DotMaps are stored as plain dictionaries; the compiled config and input hash are kept,
+        so workers never re-read YAML files or re-hash the input directory.
+        """
+        state = self.__dict__.copy()
+        for key in ("_user_config_cache", "_feature_map_config_cache", "_standard_id_col_config_cache"):
+            if isinstance(state[key], DotMap):
+                state[key] = state[key].toDict()
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        for key in ("_user_config_cache", "_feature_map_config_cache", "_standard_id_col_config_cache"):
+            if state[key] is not None:
+                state[key] = DotMap(state[key])
+        self.__dict__.update(state)
+
+    @property
+    def compiled(self) -> CompiledConfig:
+        """
+        Returns the validated, compiled configuration.
+
+        Returns:
+            CompiledConfig: Frozen, typed configuration with cached derived products.
+        """
+        if self._compiled_cache is None:
+            self.validate()
+        return self._compiled_cache
 
     @property
     def user_config(self) -> DotMap:
@@ -104,27 +142,54 @@ class IGConfig:
     @property
     def ml_suite_config_file(self) -> Path:
         """
-        Writes a temporary YAML file containing ml_suite-compatible configuration
-        and returns the path to that file.
+        Returns the path to a YAML file containing ml_suite-compatible configuration.
+
+        ml_suite wants a config file, so the file is written once to the cache directory
+        (named after a hash of its contents) and reused afterwards.
 
         Returns:
-            Path: Path to the temporary YAML config file.
+            Path: Path to the YAML config file.
         """
-        feature_extraction_config: dict = self.user_config.feature_extraction.toDict()
-
-        # ml_suite wants a config file, so we have to save a temp file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as tmp_file:
-            yaml.safe_dump(feature_extraction_config, tmp_file)
-            return Path(tmp_file.name)
+        return self.compiled.ml_suite_config_file
 
     def validate(self) -> bool:
         """
-        Placeholder for input configuration validation logic.
+        Validate the user and internal configuration and compile it into a CompiledConfig.
 
         Returns:
-            bool: Whether the user configuration is valid.
+            bool: True if the configuration is valid.
+
+        Raises:
+            ConfigValidationError: If the configuration is invalid. Lists every problem found.
         """
-        ...
+        self._compiled_cache = CompiledConfig.compile(
+            self._load_config("_user_config_cache", self.user_config_path),
+            self._load_config("_feature_map_config_cache", self.feature_map_config_path),
+            self._load_config("_standard_id_col_config_cache", self.standard_id_col_config_path),
+            self.cache_dir,
+            self.user_config_path
+        )
+        return True
+
+    def _load_config(self, cache_attr: str, path: Path) -> Any:
+        """
+        Load a configuration file once, for both its DotMap view and the compiled configuration.
+
+        Args:
+            cache_attr (str): Attribute caching the DotMap view of the file.
+            path (Path): Path to the YAML file.
+
+        Returns:
+            Any: Parsed YAML content, taken from the DotMap view if the file was already loaded.
+        """
+        cached = getattr(self, cache_attr)
+        if cached is not None:
+            return cached.toDict()
+
+        raw = self._load_file(path)
+        if isinstance(raw, dict):
+            setattr(self, cache_attr, DotMap(raw))
+        return raw
 
     @staticmethod
     def _load_file(path: Path) -> dict:
@@ -148,8 +213,23 @@ class IGConfig:
             str: A hash representing the input state.
         """
         if self._input_hash_cache is None:
-            input_dir = Path(self.user_config.input_dir)
+            input_dir = self.compiled.input_dir
             config_file = Path(self.user_config_path)
-            self._input_hash_cache = hash_directory(input_dir, config_file, ".i3.zst")
+            with Profiler.stage("config.hash_inputs"):
+                self._input_hash_cache = hash_directory(input_dir, config_file, ".i3.zst")
 
         return self._input_hash_cache
+
+    def get_input_files_hash(self) -> str:
+        """
+        Compute a consistent content-based hash of the input files alone, which unlike the input state hash
+        does not change with the configuration.
+
+        Returns:
+            str: A hash representing the input files.
+        """
+        if self._input_files_hash_cache is None:
+            with Profiler.stage("config.hash_input_files"):
+                self._input_files_hash_cache = hash_input_files(self.compiled.input_dir, ".i3.zst")
+
+        return self._input_files_hash_cache
@@ -0,0 +1,958 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+import os
+import json
+import yaml
+import xxhash
+from pathlib import Path
+from functools import cached_property
+from dataclasses import asdict, dataclass, field, fields
+from typing import Any, Iterable, Mapping, Optional
+
+from .exceptions import ConfigValidationError
+
+
+__all__ = [
+    "CompiledConfig",
+    "FrameKeys",
+    "TableNames",
+    "SelectionSettings",
+    "LoadingSettings",
+    "StorageSettings",
+    "StorageProfile",
+    "DatasetSchema",
+    "ExtractionSettings",
+    "PreselectionSettings",
+    "STORAGE_PROFILES",
+    "InstrumentationSettings",
+    "DaskSettings",
+    "StagingSettings",
+    "ResourceSettings",
+    "TransformSpec",
+    "TransformSettings",
+    "SourceSettings",
+    "FrozenDict",
+    "build_vector_mapping",
+    "freeze",
+    "thaw",
+]
+
+DEFAULT_GCD_PATH = "/cvmfs/icecube.opensciencegrid.org/data/GCD/GeoCalibDetectorStatus_IC86.All_Pass2.i3.gz"
+
+class FrozenDict(dict):
+    """
+    A read-only, hashable dictionary, for the mappings held by the frozen settings objects.
+
+    It is still a dict, so it serializes to JSON and pickles like one, but every mutating method raises.
+    """
+
+    def _read_only(self, *args, **kwargs) -> None:
+        raise TypeError(f"{type(self).__name__} is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __hash__(self) -> int:
+        return hash(frozenset(self.items()))
+
+    def __reduce__(self) -> tuple:
+        return type(self), (dict(self),)
+
+
+def freeze(value: Any) -> Any:
+    """
+    Recursively convert mappings to FrozenDicts and lists to tuples, e.g. parsed YAML held by frozen settings.
+
+    Args:
+        value (Any): Value to freeze.
+
+    Returns:
+        Any: The immutable, hashable equivalent of the value.
+    """
+    if isinstance(value, Mapping):
+        return FrozenDict({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """
+    Recursively convert mappings to dicts and tuples to lists, the inverse of freeze, e.g. to dump to YAML.
+
+    Args:
+        value (Any): Value to thaw.
+
+    Returns:
+        Any: The plain dict and list equivalent of the value.
+    """
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+    return value
+
+
+
+def build_vector_mapping(requested_features: list[dict], feature_defs: dict[str, list[str]]) -> dict[int, str]:
+    """
+    Map each index of the ml_suite feature vector to a feature column name.
+
+    Args:
+        requested_features (list[dict]): The `feature_extraction.feature_config.features` list of the user config.
+        feature_defs (dict[str, list[str]]): Base column names of each feature class, from the internal feature map.
+
+    Returns:
+        dict[int, str]: Mapping from vector index to column name.
+    """
+    mapping = {}
+    idx = 0
+
+    for entry in requested_features:
+        base_names = feature_defs[entry["class"]]
+        kwargs = entry.get("kwargs")
+
+        if not kwargs:
+            for name in base_names:
+                mapping[idx] = name
+                idx += 1
+        else:
+            items = next(iter(kwargs.values()))
+            for item in items:
+                for name in base_names:
+                    mapping[idx] = f"{name}_{item}"
+                    idx += 1
+
+    return mapping
+
+
+class _Validator:
+    """
+    Collects validation errors while reading values out of the raw YAML dictionaries.
+    """
+
+    def __init__(self) -> None:
+        self.errors: list[str] = []
+
+    def get(self, section: dict, key: str, expected: type | tuple[type, ...], path: str, default: Any = ...) -> Any:
+        """
+        Read and type-check a single value.
+
+        Args:
+            section (dict): Dictionary to read from.
+            key (str): Key of the value.
+            expected (type | tuple[type, ...]): Accepted type(s).
+            path (str): Dotted path of the value, for error messages.
+            default (Any): Value to use when the key is missing or null. Required if not given.
+
+        Returns:
+            Any: The value, the default, or None if invalid.
+        """
+        value = section.get(key) if isinstance(section, dict) else None
+        if value is None:
+            if default is ...:
+                self.errors.append(f"'{path}' is required")
+            return None if default is ... else default
+        if isinstance(value, bool) and expected in (int, float, (int, float)):
+            self.errors.append(f"'{path}' must be a number, got {value!r}")
+            return None
+        if not isinstance(value, expected):
+            names = " or ".join(t.__name__ for t in (expected if isinstance(expected, tuple) else (expected,)))
+            self.errors.append(f"'{path}' must be {names}, got {type(value).__name__}")
+            return None
+        return value
+
+    def section(self, raw: dict, key: str, path: Optional[str] = None, required: bool = False) -> dict:
+        """
+        Read a nested mapping, returning an empty dictionary when it is missing.
+        """
+        return self.get(raw, key, dict, path or key, ... if required else {}) or {}
+
+    def str_list(self, section: dict, key: str, path: str, default: Any = ...) -> tuple[str, ...]:
+        """
+        Read a non-empty list of strings as a tuple.
+        """
+        values = self.get(section, key, list, path, default)
+        if values is None:
+            return ()
+        if default is ... and not values:
+            self.errors.append(f"'{path}' must not be empty")
+        if not all(isinstance(v, str) for v in values):
+            self.errors.append(f"'{path}' must only contain strings")
+        return tuple(values)
+
+    def positive(self, section: dict, key: str, path: str, default: int) -> int:
+        """
+        Read a positive integer.
+        """
+        value = self.get(section, key, int, path, default)
+        if value is not None and value < 1:
+            self.errors.append(f"'{path}' must be at least 1, got {value}")
+        return value
+
+
+@dataclass(frozen=True)
+class FrameKeys:
+    """
+    Names of the I3Frame objects read during feature extraction.
+    """
+    mctree: str
+    bg_mctree: str
+    weight_dict: str
+    truth_dict: str
+
+
+@dataclass(frozen=True)
+class TableNames:
+    """
+    Table names in the intermediate HDF5 file.
+    """
+    features: str
+    truth: str
+
+
+@dataclass(frozen=True)
+class SelectionSettings:
+    """
+    Selection strings defining the train, validation and test splits.
+    """
+    train: str
+    validation: str
+    test: str
+
+
+@dataclass(frozen=True)
+class LoadingSettings:
+    """
+    Dataset loading settings.
+    """
+    prefetch_batches: int = 4
+    prefetch_threads: int = 4
+    pre_buffer: bool = True
+    feature_dtype: str = "float32"
+    label_dtype: str = "float64"
+    output: str = "doms"
+
+    FEATURE_DTYPES = ("float32", "float16")
+    LABEL_DTYPES = ("float64", "float32", "float16", "int64")
+    OUTPUTS = ("doms", "grid", "sparse_grid")
+
+
+@dataclass(frozen=True)
+class StorageProfile:
+    """
+    Parquet encoding of the converted output: codecs for the ID and feature columns, and the
+    precision features are stored at.
+    """
+    name: str
+    id_compression: str = "snappy"
+    feature_compression: str = "snappy"
+    compression_level: Optional[int] = None
+    feature_dtype: str = "float64"
+    feature_dictionary: bool = True
+    byte_stream_split: bool = False
+
+    # schema metadata key the profile is recorded under in written files
+    METADATA_KEY = b"icegraph.storage_profile"
+
+    def metadata(self) -> dict[bytes, bytes]:
+        """
+        Schema metadata recording this profile.
+
+        Returns:
+            dict[bytes, bytes]: Metadata to merge into the Arrow schema of written tables.
+        """
+        return {self.METADATA_KEY: json.dumps(asdict(self)).encode()}
+
+    def parquet_options(self, columns: list[str], feature_columns: list[str]) -> dict:
+        """
+        Build the per-column pyarrow Parquet writer options of this profile.
+
+        Args:
+            columns (list[str]): All columns of the table to write.
+            feature_columns (list[str]): Columns holding feature values; every other column is treated as an ID.
+
+        Returns:
+            dict: Keyword arguments for pq.write_table or ParquetFileFormat.make_write_options.
+        """
+        feature_set = set(feature_columns)
+        features = [col for col in columns if col in feature_set]
+        ids = [col for col in columns if col not in feature_set]
+        compression = {
+            **{col: self.id_compression for col in ids},
+            **{col: self.feature_compression for col in features},
+        }
+
+        options = {
+            "compression": compression,
+            "use_dictionary": ids + (features if self.feature_dictionary else []),
+            "use_byte_stream_split": features if self.byte_stream_split else False,
+        }
+        if self.compression_level is not None:
+            options["compression_level"] = {
+                col: self.compression_level for col, codec in compression.items() if codec in ("zstd", "gzip", "brotli")
+            }
+        return options
+
+
+# default: pandas' Parquet defaults, features kept at float64
+# fast-read: cheap to decode; features are read as float32 anyway, so storing them as float32 loses nothing
+# compact: smallest lossless output for training. IDs are dictionary-encoded, features are not: feature values
+#   are nearly all distinct, so a dictionary only adds a page per column, and it would take precedence over
+#   byte-stream-split (about 50% larger output and 25% slower reads on the synthetic benchmark data)
+# lossy-compact: features stored as float16
+STORAGE_PROFILES = {profile.name: profile for profile in (
+    StorageProfile("default"),
+    StorageProfile("fast-read", "lz4", "none", feature_dtype="float32", feature_dictionary=False),
+    StorageProfile("compact", "zstd", "zstd", 9, "float32", feature_dictionary=False, byte_stream_split=True),
+    StorageProfile("lossy-compact", "zstd", "zstd", 9, "float16", feature_dictionary=False, byte_stream_split=True),
+)}
+
+
+@dataclass(frozen=True)
+class DatasetSchema:
+    """
+    Self-description of converted data, recorded in the schema metadata of every written file: the feature
+    columns, the ml_suite feature vector mapping and the feature extraction settings they were produced with,
+    and the transforms applied to the stored values at conversion, if any.
+
+    Lets a dataset be opened with a different configuration, as long as the requested features were stored.
+    """
+    feature_columns: tuple[str, ...]
+    vector_mapping: Mapping[int, str] = field(repr=False)
+    feature_extraction: Mapping = field(repr=False)
+    version: int = 1
+    transforms: Optional[Mapping] = None
+
+    # schema metadata key the description is recorded under in written files
+    METADATA_KEY = b"icegraph.schema"
+
+    # version written by this release; files of later versions are not read
+    VERSION = 1
+
+    def __post_init__(self) -> None:
+        for name in ("feature_columns", "vector_mapping", "feature_extraction", "transforms"):
+            object.__setattr__(self, name, freeze(getattr(self, name)))
+
+    def metadata(self) -> dict[bytes, bytes]:
+        """
+        Schema metadata recording this description.
+
+        Returns:
+            dict[bytes, bytes]: Metadata to merge into the Arrow schema of written tables.
+        """
+        return {self.METADATA_KEY: json.dumps(asdict(self)).encode()}
+
+    @classmethod
+    def from_metadata(cls, metadata: Optional[dict[bytes, bytes]]) -> Optional["DatasetSchema"]:
+        """
+        Read the description recorded in schema metadata.
+
+        Args:
+            metadata (Optional[dict[bytes, bytes]]): Arrow schema metadata of a written file.
+
+        Returns:
+            Optional[DatasetSchema]: The description, or None for files written before it was recorded.
+
+        Raises:
+            ValueError: If the file was written with a later schema version.
+        """
+        if not metadata or (raw := metadata.get(cls.METADATA_KEY)) is None:
+            return None
+
+        values = json.loads(raw)
+        if values["version"] > cls.VERSION:
+            raise ValueError(
+                f"Data was written with schema version {values['version']}, this release reads up to {cls.VERSION}"
+            )
+        return cls(
+            feature_columns=tuple(values["feature_columns"]),
+            vector_mapping={int(index): name for index, name in values["vector_mapping"].items()},
+            feature_extraction=values["feature_extraction"],
+            version=values["version"],
+            transforms=values.get("transforms"),
+        )
+
+    def missing(self, columns: Iterable[str]) -> list[str]:
+        """
+        Requested feature columns which were not stored.
+
+        Args:
+            columns (Iterable[str]): Requested feature columns.
+
+        Returns:
+            list[str]: Columns not in this description, in the order given.
+        """
+        stored = set(self.feature_columns)
+        return [col for col in columns if col not in stored]
+
+
+@dataclass(frozen=True)
+class StorageSettings:
+    """
+    Layout and encoding of the converted Parquet output.
+    """
+    layout: str = "file"
+    partition_by: tuple[str, ...] = ("Run",)
+    profile: StorageProfile = STORAGE_PROFILES["default"]
+
+    LAYOUTS = ("file", "partitioned")
+
+
+@dataclass(frozen=True)
+class ExtractionSettings:
+    """
+    Feature extraction output settings.
+    """
+    output: str = "hdf5"
+    batch_events: int = 1024
+
+    OUTPUTS = ("hdf5", "arrow")
+
+
+@dataclass(frozen=True)
+class PreselectionSettings:
+    """
+    Event pre-selection applied in the extraction tray, ahead of feature extraction.
+    """
+    energy_key: str = "PrimaryNeutrinoEnergy"
+    min_energy: Optional[float] = None
+    max_energy: Optional[float] = None
+    min_hit_doms: int = 0
+    subsample: float = 1.0
+    seed: int = 0
+
+    @property
+    def active(self) -> bool:
+        """
+        Whether any pre-selection criterion is set.
+        """
+        return (
+            self.min_energy is not None or self.max_energy is not None
+            or self.min_hit_doms > 0 or self.subsample < 1.0
+        )
+
+
+@dataclass(frozen=True)
+class InstrumentationSettings:
+    """
+    Pipeline instrumentation settings.
+    """
+    enabled: bool = False
+    report: Optional[Path] = None
+
+
+@dataclass(frozen=True)
+class DaskSettings:
+    """
+    Settings of the optional Dask backend.
+    """
+    enabled: bool = False
+    scheduler: str = ""
+    n_workers: int = 0
+    threads_per_worker: int = 1
+    chunk_rows: int = 0
+
+
+@dataclass(frozen=True)
+class StagingSettings:
+    """
+    Settings of the node-local staging cache for converted datasets.
+    """
+    enabled: bool = False
+    directory: Optional[Path] = None
+    max_size_gb: float = 100.0
+    checksum: bool = True
+    fallback: str = "blockcache"
+
+    FALLBACKS = ("blockcache", "none")
+
+
+@dataclass(frozen=True)
+class ResourceSettings:
+    """
+    Limits the resource governor sizes workers and chunks within.
+    """
+    max_rss_gb: Optional[float] = None
+    memory_fraction: float = 0.8
+    pressure: float = 0.9
+    reserve_cores: int = 0
+    extraction_worker_gb: float = 2.0
+
+
+@dataclass(frozen=True)
+class TransformSpec:
+    """
+    A transform applied to some feature or label columns.
+    """
+    name: str
+    columns: tuple[str, ...]
+    kwargs: Mapping[str, float] = field(default_factory=FrozenDict)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "columns", tuple(self.columns))
+        object.__setattr__(self, "kwargs", freeze(self.kwargs))
+
+
+@dataclass(frozen=True)
+class TransformSettings:
+    """
+    Vectorized transforms of the features and labels, applied to whole batches after collation, or once at conversion.
+    """
+    at_conversion: bool = False
+    features: tuple[TransformSpec, ...] = ()
+    labels: tuple[TransformSpec, ...] = ()
+
+    # transform classes and the keyword arguments they accept, see icegraph.data.transforms
+    CLASSES = {
+        "Log1p": (),
+        "Log10": ("offset",),
+        "Clip": ("min", "max"),
+        "Affine": ("scale", "shift"),
+    }
+
+    def __bool__(self) -> bool:
+        return bool(self.features or self.labels)
+
+
+@dataclass(frozen=True)
+class SourceSettings:
+    """
+    A converted dataset used as one source of a composite dataset.
+    """
+    location: str
+    weight: float = 1.0
+
+
+@dataclass(frozen=True)
+class CompiledConfig:
+    """
+    The user and internal configuration, validated and compiled into a frozen, typed object.
+
+    Built once per IGConfig. Hot paths read settings from here instead of going through DotMap lookups,
+    and products derived from the configuration (vector mapping, column lists, the ml_suite config file)
+    are computed on first access and cached on the object. Cached products are kept when pickling,
+    so DataLoader workers receive them without recomputing anything.
+    """
+    input_dir: Path
+    gcd_path: Path
+    output_dir: Optional[Path]
+    cache_dir: Path
+    frame_keys: FrameKeys
+    table_names: TableNames
+    target_labels: tuple[str, ...]
+    selection: SelectionSettings
+    loading: LoadingSettings
+    instrumentation: InstrumentationSettings
+    event_id_columns: tuple[str, ...]
+    dom_id_columns: tuple[str, ...]
+    feature_definitions: Mapping[str, tuple[str, ...]] = field(repr=False)
+    feature_extraction: Mapping = field(repr=False)
+    sources: tuple[SourceSettings, ...] = ()
+    storage: StorageSettings = StorageSettings()
+    dask: DaskSettings = DaskSettings()
+    extraction: ExtractionSettings = ExtractionSettings()
+    preselection: PreselectionSettings = PreselectionSettings()
+    staging: StagingSettings = StagingSettings()
+    resources: ResourceSettings = ResourceSettings()
+    transforms: TransformSettings = TransformSettings()
+
+    def __post_init__(self) -> None:
+        # parsed YAML is frozen too, so no one can change the configuration behind the cached products
+        object.__setattr__(self, "feature_definitions", freeze(self.feature_definitions))
+        object.__setattr__(self, "feature_extraction", freeze(self.feature_extraction))
+
+    @classmethod
+    def compile(
+        cls,
+        user_config: dict,
+        feature_map_config: dict,
+        standard_id_col_config: dict,
+        cache_dir: Path,
+        config_path: Path
+    ) -> "CompiledConfig":
+        """
+        Validate the raw configuration dictionaries and compile them.
+
+        Args:
+            user_config (dict): Parsed user configuration file.
+            feature_map_config (dict): Parsed internal feature mapping configuration.
+            standard_id_col_config (dict): Parsed internal standard ID column configuration.
+            cache_dir (Path): IceGraph cache directory.
+            config_path (Path): Path to the user configuration file, for error messages.
+
+        Returns:
+            CompiledConfig: The compiled configuration.
+
+        Raises:
+            ConfigValidationError: If the configuration is invalid. Lists every problem found.
+        """
+        v = _Validator()
+        if not isinstance(user_config, dict):
+            raise ConfigValidationError(config_path, ["user configuration must be a mapping"])
+
+        input_dir = v.get(user_config, "input_dir", str, "input_dir")
+        gcd_path = v.get(user_config, "gcd_path", str, "gcd_path", "") or DEFAULT_GCD_PATH
+        output_dir = v.get(user_config, "output_dir", str, "output_dir", "")
+
+        frame_keys_raw = v.section(user_config, "frame_keys", required=True)
+        frame_keys = FrameKeys(**{
+            f.name: v.get(frame_keys_raw, f.name, str, f"frame_keys.{f.name}") for f in fields(FrameKeys)
+        })
+
+        table_names_raw = v.section(user_config, "table_names", required=True)
+        table_names = TableNames(**{
+            f.name: v.get(table_names_raw, f.name, str, f"table_names.{f.name}") for f in fields(TableNames)
+        })
+
+        target_labels = v.str_list(user_config, "target_labels", "target_labels")
+
+        selection_raw = v.section(user_config, "selection", required=True)
+        selection = SelectionSettings(**{
+            f.name: v.get(selection_raw, f.name, str, f"selection.{f.name}") for f in fields(SelectionSettings)
+        })
+
+        loading_raw = v.section(user_config, "loading")
+        loading = LoadingSettings(
+            prefetch_batches=v.positive(loading_raw, "prefetch_batches", "loading.prefetch_batches", 4),
+            prefetch_threads=v.positive(loading_raw, "prefetch_threads", "loading.prefetch_threads", 4),
+            pre_buffer=v.get(loading_raw, "pre_buffer", bool, "loading.pre_buffer", True),
+            feature_dtype=v.get(loading_raw, "feature_dtype", str, "loading.feature_dtype", "float32"),
+            label_dtype=v.get(loading_raw, "label_dtype", str, "loading.label_dtype", "float64"),
+            output=v.get(loading_raw, "output", str, "loading.output", "doms"),
+        )
+        for key, allowed in (
+            ("feature_dtype", LoadingSettings.FEATURE_DTYPES),
+            ("label_dtype", LoadingSettings.LABEL_DTYPES),
+            ("output", LoadingSettings.OUTPUTS),
+        ):
+            if getattr(loading, key) not in allowed:
+                v.errors.append(f"'loading.{key}' must be one of {list(allowed)}, got {getattr(loading, key)!r}")
+
+        instrumentation_raw = v.section(user_config, "instrumentation")
+        report = v.get(instrumentation_raw, "report", str, "instrumentation.report", "")
+        instrumentation = InstrumentationSettings(
+            enabled=v.get(instrumentation_raw, "enabled", bool, "instrumentation.enabled", False),
+            report=Path(report) if report else None,
+        )
+
+        sources = cls._compile_sources(v, user_config)
+
+        feature_extraction = v.section(user_config, "feature_extraction", required=True)
+        feature_definitions = {
+            name: tuple(columns)
+            for name, columns in (v.section(feature_map_config or {}, "features", "features_map.features") or {}).items()
+        }
+        cls._validate_features(v, feature_extraction, feature_definitions)
+        transforms = cls._compile_transforms(v, user_config, feature_extraction, feature_definitions, target_labels)
+        if transforms.labels and not transforms.at_conversion and loading.label_dtype == "int64":
+            v.errors.append("'transforms.labels' cannot be applied to labels loaded as 'int64'")
+
+        id_columns = standard_id_col_config or {}
+        event_id_columns = v.str_list(id_columns, "event_id_columns", "standard_id_cols.event_id_columns")
+        dom_id_columns = v.str_list(id_columns, "dom_id_columns", "standard_id_cols.dom_id_columns")
+        if loading.output != "doms" and not {"string", "om"} <= set(dom_id_columns):
+            v.errors.append(f"'loading.output: {loading.output}' requires 'string' and 'om' DOM ID columns")
+
+        storage_raw = v.section(user_config, "storage")
+        profile = v.get(storage_raw, "profile", str, "storage.profile", "default")
+        if profile not in STORAGE_PROFILES:
+            v.errors.append(f"'storage.profile' must be one of {list(STORAGE_PROFILES)}, got {profile!r}")
+        storage = StorageSettings(
+            layout=v.get(storage_raw, "layout", str, "storage.layout", "file"),
+            partition_by=v.str_list(storage_raw, "partition_by", "storage.partition_by", ["Run"]),
+            profile=STORAGE_PROFILES.get(profile, STORAGE_PROFILES["default"]),
+        )
+        if storage.layout not in StorageSettings.LAYOUTS:
+            v.errors.append(f"'storage.layout' must be one of {list(StorageSettings.LAYOUTS)}, got {storage.layout!r}")
+        if unknown := [col for col in storage.partition_by if event_id_columns and col not in event_id_columns]:
+            v.errors.append(f"'storage.partition_by' must only contain event ID columns, got {unknown}")
+
+        extraction_raw = v.section(user_config, "extraction")
+        extraction = ExtractionSettings(
+            output=v.get(extraction_raw, "output", str, "extraction.output", "hdf5"),
+            batch_events=v.positive(extraction_raw, "batch_events", "extraction.batch_events", 1024),
+        )
+        if extraction.output not in ExtractionSettings.OUTPUTS:
+            v.errors.append(
+                f"'extraction.output' must be one of {list(ExtractionSettings.OUTPUTS)}, got {extraction.output!r}"
+            )
+
+        preselection = cls._compile_preselection(v, user_config)
+
+        dask_raw = v.section(user_config, "dask")
+        n_workers = v.get(dask_raw, "n_workers", int, "dask.n_workers", 0)
+        chunk_rows = v.get(dask_raw, "chunk_rows", int, "dask.chunk_rows", 0)
+        for key, value in (("n_workers", n_workers), ("chunk_rows", chunk_rows)):
+            if value is not None and value < 0:
+                v.errors.append(f"'dask.{key}' must not be negative, got {value}")
+        dask = DaskSettings(
+            enabled=v.get(dask_raw, "enabled", bool, "dask.enabled", False),
+            scheduler=v.get(dask_raw, "scheduler", str, "dask.scheduler", ""),
+            n_workers=n_workers,
+            threads_per_worker=v.positive(dask_raw, "threads_per_worker", "dask.threads_per_worker", 1),
+            chunk_rows=chunk_rows,
+        )
+
+        staging_raw = v.section(user_config, "staging")
+        directory = v.get(staging_raw, "directory", str, "staging.directory", "")
+        max_size_gb = v.get(staging_raw, "max_size_gb", (int, float), "staging.max_size_gb", 100.0)
+        if max_size_gb is not None and max_size_gb <= 0:
+            v.errors.append(f"'staging.max_size_gb' must be positive, got {max_size_gb}")
+        staging = StagingSettings(
+            enabled=v.get(staging_raw, "enabled", bool, "staging.enabled", False),
+            directory=Path(directory) if directory else None,
+            max_size_gb=max_size_gb,
+            checksum=v.get(staging_raw, "checksum", bool, "staging.checksum", True),
+            fallback=v.get(staging_raw, "fallback", str, "staging.fallback", "blockcache"),
+        )
+        if staging.fallback not in StagingSettings.FALLBACKS:
+            v.errors.append(
+                f"'staging.fallback' must be one of {list(StagingSettings.FALLBACKS)}, got {staging.fallback!r}"
+            )
+
+        resources_raw = v.section(user_config, "resources")
+        number = (int, float)
+        resources = ResourceSettings(
+            max_rss_gb=v.get(resources_raw, "max_rss_gb", number, "resources.max_rss_gb", None),
+            memory_fraction=v.get(resources_raw, "memory_fraction", number, "resources.memory_fraction", 0.8),
+            pressure=v.get(resources_raw, "pressure", number, "resources.pressure", 0.9),
+            reserve_cores=v.get(resources_raw, "reserve_cores", int, "resources.reserve_cores", 0),
+            extraction_worker_gb=v.get(
+                resources_raw, "extraction_worker_gb", number, "resources.extraction_worker_gb", 2.0
+            ),
+        )
+        for key in ("memory_fraction", "pressure"):
+            if (value := getattr(resources, key)) is not None and not 0 < value <= 1:
+                v.errors.append(f"'resources.{key}' must be in (0, 1], got {value}")
+        for key in ("max_rss_gb", "extraction_worker_gb"):
+            if (value := getattr(resources, key)) is not None and value <= 0:
+                v.errors.append(f"'resources.{key}' must be positive, got {value}")
+        if resources.reserve_cores is not None and resources.reserve_cores < 0:
+            v.errors.append(f"'resources.reserve_cores' must not be negative, got {resources.reserve_cores}")
+
+        if v.errors:
+            raise ConfigValidationError(config_path, v.errors)
+
+        return cls(
+            input_dir=Path(input_dir),
+            gcd_path=Path(gcd_path),
+            output_dir=Path(output_dir) if output_dir else None,
+            cache_dir=Path(cache_dir),
+            frame_keys=frame_keys,
+            table_names=table_names,
+            target_labels=target_labels,
+            selection=selection,
+            loading=loading,
+            instrumentation=instrumentation,
+            event_id_columns=event_id_columns,
+            dom_id_columns=dom_id_columns,
+            feature_definitions=feature_definitions,
+            feature_extraction=feature_extraction,
+            sources=sources,
+            storage=storage,
+            dask=dask,
+            extraction=extraction,
+            preselection=preselection,
+            staging=staging,
+            resources=resources,
+            transforms=transforms,
+        )
+
+    @staticmethod
+    def _compile_sources(v: _Validator, user_config: dict) -> tuple[SourceSettings, ...]:
+        """
+        Compile the optional `sources` list, whose entries are either a location string
+        (converted directory or conversion cache hash) or a mapping with 'path' and 'weight'.
+        """
+        sources = []
+        for i, entry in enumerate(v.get(user_config, "sources", list, "sources", [])):
+            path = f"sources[{i}]"
+            if isinstance(entry, str):
+                sources.append(SourceSettings(entry))
+                continue
+
+            location = v.get(entry, "path", str, f"{path}.path")
+            weight = v.get(entry, "weight", (int, float), f"{path}.weight", 1.0)
+            if weight is not None and weight <= 0:
+                v.errors.append(f"'{path}.weight' must be positive, got {weight}")
+            if location is not None and weight is not None:
+                sources.append(SourceSettings(location, float(weight)))
+
+        return tuple(sources)
+
+    @staticmethod
+    def _compile_preselection(v: _Validator, user_config: dict) -> PreselectionSettings:
+        """
+        Compile the optional `preselection` section.
+        """
+        raw = v.section(user_config, "preselection")
+        number = (int, float)
+
+        min_energy = v.get(raw, "min_energy", number, "preselection.min_energy", None)
+        max_energy = v.get(raw, "max_energy", number, "preselection.max_energy", None)
+        if min_energy is not None and max_energy is not None and min_energy > max_energy:
+            v.errors.append(f"'preselection.min_energy' ({min_energy}) must not exceed 'preselection.max_energy' ({max_energy})")
+
+        min_hit_doms = v.get(raw, "min_hit_doms", int, "preselection.min_hit_doms", 0)
+        if min_hit_doms is not None and min_hit_doms < 0:
+            v.errors.append(f"'preselection.min_hit_doms' must not be negative, got {min_hit_doms}")
+
+        subsample = v.get(raw, "subsample", number, "preselection.subsample", 1.0)
+        if subsample is not None and not 0 < subsample <= 1:
+            v.errors.append(f"'preselection.subsample' must be in (0, 1], got {subsample}")
+
+        return PreselectionSettings(
+            energy_key=v.get(raw, "energy_key", str, "preselection.energy_key", "PrimaryNeutrinoEnergy"),
+            min_energy=None if min_energy is None else float(min_energy),
+            max_energy=None if max_energy is None else float(max_energy),
+            min_hit_doms=min_hit_doms or 0,
+            subsample=float(subsample or 1.0),
+            seed=v.get(raw, "seed", int, "preselection.seed", 0),
+        )
+
+    @staticmethod
+    def _compile_transforms(
+        v: _Validator,
+        user_config: dict,
+        feature_extraction: dict,
+        feature_definitions: dict,
+        target_labels: tuple[str, ...]
+    ) -> TransformSettings:
+        """
+        Compile the optional `transforms` section. Feature transforms must name configured feature columns,
+        and label transforms target labels.
+        """
+        raw = v.section(user_config, "transforms")
+
+        try:
+            features = feature_extraction["feature_config"]["features"]
+            feature_columns = set(build_vector_mapping(features, feature_definitions).values())
+        except (KeyError, TypeError, AttributeError, StopIteration):
+            # invalid features are reported by _validate_features
+            feature_columns = None
+
+        compiled = {}
+        for target, known in (("features", feature_columns), ("labels", set(target_labels))):
+            specs = []
+            for i, entry in enumerate(v.get(raw, target, list, f"transforms.{target}", [])):
+                path = f"transforms.{target}[{i}]"
+                name = v.get(entry, "class", str, f"{path}.class")
+                columns = v.str_list(entry, "columns", f"{path}.columns")
+                kwargs = v.get(entry, "kwargs", dict, f"{path}.kwargs", {})
+                if name is None or kwargs is None:
+                    continue
+
+                if name not in TransformSettings.CLASSES:
+                    v.errors.append(f"'{path}.class' must be one of {list(TransformSettings.CLASSES)}, got {name!r}")
+                    continue
+                if unknown := [key for key in kwargs if key not in TransformSettings.CLASSES[name]]:
+                    v.errors.append(f"'{path}.kwargs' has unknown arguments for {name}: {unknown}")
+                if not all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in kwargs.values()):
+                    v.errors.append(f"'{path}.kwargs' values must be numbers")
+                if known is not None and (unknown := [col for col in columns if col not in known]):
+                    v.errors.append(f"'{path}.columns' must only contain configured {target}, got {unknown}")
+                specs.append(TransformSpec(name, columns, kwargs))
+            compiled[target] = tuple(specs)
+
+        return TransformSettings(
+            at_conversion=v.get(raw, "at_conversion", bool, "transforms.at_conversion", False),
+            **compiled,
+        )
+
+    @staticmethod
+    def _validate_features(v: _Validator, feature_extraction: dict, feature_definitions: dict) -> None:
+        """
+        Validate the requested ml_suite features against the internal feature map.
+        """
+        feature_config = v.section(feature_extraction, "feature_config", "feature_extraction.feature_config", True)
+        features = v.get(feature_config, "features", list, "feature_extraction.feature_config.features")
+
+        for i, entry in enumerate(features or []):
+            path = f"feature_extraction.feature_config.features[{i}]"
+            if not isinstance(entry, dict) or not isinstance(entry.get("class"), str):
+                v.errors.append(f"'{path}' must be a mapping with a 'class' name")
+                continue
+            if entry["class"] not in feature_definitions:
+                v.errors.append(f"'{path}.class' has no column names defined in features_map.yaml: {entry['class']}")
+            kwargs = entry.get("kwargs")
+            if kwargs and not isinstance(next(iter(kwargs.values())), list):
+                v.errors.append(f"'{path}.kwargs' must map its first argument to a list of values")
+
+    @cached_property
+    def vector_mapping(self) -> Mapping[int, str]:
+        """
+        Mapping from ml_suite feature vector index to feature column name.
+        """
+        return FrozenDict(build_vector_mapping(
+            self.feature_extraction["feature_config"]["features"],
+            self.feature_definitions
+        ))
+
+    @cached_property
+    def inverse_vector_mapping(self) -> Mapping[str, int]:
+        """
+        Mapping from feature column name to ml_suite feature vector index.
+        """
+        # values are unique, so inversion shouldn't be a problem
+        return FrozenDict({v: k for k, v in self.vector_mapping.items()})
+
+    @cached_property
+    def feature_columns(self) -> tuple[str, ...]:
+        """
+        Feature column names, in feature vector order.
+        """
+        return tuple(self.vector_mapping.values())
+
+    @cached_property
+    def dataset_schema(self) -> DatasetSchema:
+        """
+        Description of the data this configuration produces, recorded in every converted file.
+        """
+        return DatasetSchema(
+            self.feature_columns,
+            self.vector_mapping,
+            self.feature_extraction,
+            DatasetSchema.VERSION,
+            asdict(self.transforms) if self.transforms.at_conversion else None,
+        )
+
+    @cached_property
+    def extraction_hash(self) -> str:
+        """
+        Hash of the settings that shape the converted data, other than the list of extracted features:
+        converted data with the same hash holds the same events and DOMs, and differs only in its feature columns.
+        """
+        feature_config = {k: v for k, v in self.feature_extraction.get("feature_config", {}).items() if k != "features"}
+        settings = {
+            "feature_extraction": {**self.feature_extraction, "feature_config": feature_config},
+            "gcd_path": str(self.gcd_path),
+            "frame_keys": asdict(self.frame_keys),
+            "table_names": asdict(self.table_names),
+            "event_id_columns": self.event_id_columns,
+            "dom_id_columns": self.dom_id_columns,
+            "storage": asdict(self.storage),
+            "preselection": asdict(self.preselection),
+            # transforms applied at conversion change the stored values
+            "transforms": asdict(self.transforms) if self.transforms.at_conversion else None,
+        }
+        return xxhash.xxh64(json.dumps(settings, sort_keys=True, default=str).encode()).hexdigest()
+
+    @cached_property
+    def ml_suite_config_file(self) -> Path:
+        """
+        Path to a YAML file containing the ml_suite-compatible feature extraction configuration.
+
+        The file is named after a hash of its contents and written to the cache directory once,
+        so repeated accesses and identical configurations share a single file.
+        """
+        content = yaml.safe_dump(thaw(self.feature_extraction))
+        path = self.cache_dir / f"ml_suite_config.{xxhash.xxh64(content.encode()).hexdigest()}.yaml"
+
+        if not path.is_file():
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(content)
+            tmp_path.replace(path)
+
+        return path
@@ -1,13 +1,11 @@
 # Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
 # Developed by Taylor St Jean
 
-from datetime import datetime
-from tqdm import tqdm
-import sys
-import threading
-from typing import Optional
+import time
+from typing import Iterable, Iterator, Optional, Any
 
-from .objects import Spinner
+from .objects import Progress
+from .streams import ConsoleWriter
 from icegraph.config import IGConfig
 
 
@@ -17,12 +15,17 @@ class Console:
     """
     Class to standardize all console outputs across the application.
 
-    Provides unified formatting for standard output, progress bars, and spinners.
+    Provides unified formatting for standard output and progress reporting. All output goes through a
+    single queue-based writer thread, so messages from several threads never interleave and progress
+    status lines stay below regular output.
     """
 
-    _spinner: Optional['Spinner'] = None  # Shared spinner instance
-    _is_internal_write = threading.local()  # Thread-local flag to detect Console-originated output
-    _is_internal_write.value = False
+    writer: ConsoleWriter = ConsoleWriter()  # Shared writer instance
+
+    # formatting caches, the program tag never changes and the time string changes once per second
+    _program_tag: str | None = None
+    _severity_tags: dict[int, str] = {}
+    _time_cache: tuple[int, str] = (-1, "")
 
     @staticmethod
     def color(text: str, color: str) -> str:
@@ -50,13 +53,41 @@ class Console:
 
     @classmethod
     def _severity_tag(cls, severity: int) -> str:
-        mapping = {
-            0: "INFO",
-            1: cls.color("IMPT", "green"),
-            2: cls.color("WARN", "orange"),
-            3: cls.color("CRIT", "red")
-        }
-        return mapping[severity]
+        if not cls._severity_tags:
+            cls._severity_tags = {
+                0: "INFO",
+                1: cls.color("IMPT", "green"),
+                2: cls.color("WARN", "orange"),
+                3: cls.color("CRIT", "red")
+            }
+        return cls._severity_tags[severity]
+
+    @classmethod
+    def _time_string(cls) -> str:
+        now = int(time.time())
+        if cls._time_cache[0] != now:
+            cls._time_cache = (now, time.strftime('%X', time.localtime(now)))
+        return cls._time_cache[1]
+
+    @classmethod
+    def format(cls, text: str, severity: int = 0, include_info: bool = True) -> str:
+        """
+        Format a message with the standard program prefix.
+
+        Args:
+            text (str): The message to format.
+            severity (int): Severity level, integer from 0 to 3 representing INFO, IMPT, WARN, and CRIT. Defaults to 0.
+            include_info (bool): Whether to include timestamp/severity in the output.
+
+        Returns:
+            str: The formatted message.
+        """
+        if cls._program_tag is None:
+            cls._program_tag = f"[{cls.color(IGConfig.PROGRAM_NAME, 'cyan')}]"
+
+        if include_info:
+            return f"{cls._program_tag} {cls._time_string()} {cls._severity_tag(severity)}: {text}"
+        return f"{cls._program_tag}: {text}"
 
     @classmethod
     def out(
@@ -75,57 +106,61 @@ class Console:
             text (str): The message to print.
             severity (int): Severity level, integer from 0 to 3 representing INFO, IMPT, WARN, and CRIT. Defaults to 0.
             control_prefix (str): Optional prefix (e.g., indentation or control characters).
-            flush (bool): Whether to flush stdout immediately.
+            flush (bool): Whether to block until the message has been written.
             newline (bool): Whether to append a newline character.
             include_info (bool): Whether to include timestamp/severity in the output.
         """
-        cls._is_internal_write.value = True  # Mark output as Console-generated
-        try:
-            program_tag = f"[{cls.color(IGConfig.PROGRAM_NAME, 'cyan')}]"
-            program_time = datetime.now().strftime('%X')
-            severity_tag = cls._severity_tag(severity)
-            delimiter = ": "
-
-            parts = [program_tag]
-            if include_info:
-                parts.append(program_time)
-                parts.append(severity_tag)
-
-            print(
-                f"{control_prefix}{' '.join(parts)}{delimiter}{text}",
-                end="\n" if newline else ""
-            )
-
-            if flush:
-                sys.stdout.flush()
-        finally:
-            cls._is_internal_write.value = False  # Reset flag
+        cls.writer.write_line(f"{control_prefix}{cls.format(text, severity, include_info)}", newline=newline)
+
+        if flush:
+            cls.writer.flush()
 
     @classmethod
-    def progress_bar(cls, _iter) -> iter:
+    def progress(
+        cls,
+        desc: str = "",
+        total: Optional[int] = None,
+        unit: str = "items",
+        **kwargs
+    ) -> Progress:
         """
-        Create a standardized progress bar using `tqdm`.
+        Create a progress reporter showing items done, throughput, bytes per second and ETA.
+
+        Usage:
+            with Console.progress("Extracting", unit="events") as progress:
+                for event in events:
+                    ...
+                    progress.update(1, nbytes=size)
 
         Args:
-            _iter (iterable): The iterable to wrap in a progress bar.
+            desc (str): Description of the task.
+            total (Optional[int]): Total number of items, if known.
+            unit (str): Name of the items being counted.
+            **kwargs: Additional arguments to pass to icegraph.console.objects.Progress.
 
         Returns:
-            iterator: The wrapped iterable with progress bar display.
+            Progress: The progress reporter.
         """
-        return tqdm(
-            _iter,
-            desc=f"[{cls.color(IGConfig.PROGRAM_NAME, 'cyan')}] - {datetime.now().strftime('%X')}: ",
-            file=sys.stdout
-        )
+        return Progress(cls, desc=desc, total=total, unit=unit, **kwargs)
 
     @classmethod
-    def spinner(cls) -> 'Spinner':
+    def progress_bar(
+        cls,
+        _iter: Iterable,
+        desc: str = "",
+        total: Optional[int] = None,
+        unit: str = "items"
+    ) -> Iterator[Any]:
         """
-        Access the shared Spinner object.
+        Wrap an iterable with a standardized progress reporter.
+
+        Args:
+            _iter (iterable): The iterable to wrap.
+            desc (str): Description of the task.
+            total (Optional[int]): Total number of items. Defaults to len(_iter) when available.
+            unit (str): Name of the items being iterated over.
 
         Returns:
-            Spinner: The shared spinner instance.
+            iterator: The wrapped iterable with progress display.
         """
-        if Console._spinner is None:
-            Console._spinner = Spinner(cls)
-        return cls._spinner
\ No newline at end of file
+        return cls.progress(desc=desc, total=total, unit=unit).wrap(_iter)
@@ -1,72 +1,279 @@
 # Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
 # Developed by Taylor St Jean
 
-import threading
 import time
-import atexit
+import threading
+import itertools
+import multiprocessing
+from typing import Iterable, Iterator, Optional, Any
 
 
-__all__ = ["Spinner"]
+__all__ = ["Progress", "ProgressHandle"]
 
-class Spinner:
+class Progress:
     """
-    A CLI spinner for displaying ongoing background tasks in the terminal.
+    A throughput-aware progress reporter for long-running tasks.
 
-    Starts a background thread that prints a rotating spinner.
+    Tracks items done, items per second, bytes per second and the estimated time remaining, and
+    renders them as a status line through the console's queue-based writer. Rendering is rate-limited:
+    on a terminal the status line is redrawn at most every `min_interval` seconds, otherwise a log line
+    is printed at most every `log_interval` seconds. Updates are thread-safe, and progress made inside
+    worker processes can be aggregated through `worker_handle`.
     """
 
-    def __init__(self, console) -> None:
+    _ids = itertools.count()
+
+    def __init__(
+        self,
+        console,
+        desc: str = "",
+        total: Optional[int] = None,
+        unit: str = "items",
+        min_interval: float = 0.5,
+        log_interval: float = 30.0
+    ) -> None:
         """
-        Initialize the spinner.
+        Initialize the progress reporter.
 
         Args:
             console: IceGraph console object for standard output.
+            desc (str): Description of the task.
+            total (Optional[int]): Total number of items, if known.
+            unit (str): Name of the items being counted (e.g. 'events', 'files').
+            min_interval (float): Minimum number of seconds between status line redraws on a terminal.
+            log_interval (float): Minimum number of seconds between log lines when not on a terminal.
         """
-        self.spinner_cycle = ['|', '/', '-', '\\']
-        self.delay = 0.2
-        self.running = False
-        self._thread = None
         self.console = console
+        self.desc = desc
+        self.total = total
+        self.unit = unit
+        self.min_interval = min_interval
+        self.log_interval = log_interval
+
+        self.n = 0
+        self.nbytes = 0
+        self.start_time = time.monotonic()
+        self.closed = False
+
+        self._key = f"progress-{next(self._ids)}"
+        self._lock = threading.Lock()
+        self._last_render = 0.0
+
+        # worker pool aggregation, created on first call to worker_handle
+        self._manager = None
+        self._worker_queue = None
+        self._listener: threading.Thread | None = None
+
+    def __enter__(self) -> "Progress":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @property
+    def elapsed(self) -> float:
+        """
+        Seconds since the task started.
+        """
+        return time.monotonic() - self.start_time
+
+    @property
+    def rate(self) -> float:
+        """
+        Items done per second.
+        """
+        return self.n / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def byte_rate(self) -> float:
+        """
+        Bytes processed per second.
+        """
+        return self.nbytes / self.elapsed if self.elapsed > 0 else 0.0
 
-        # Ensure spinner is stopped gracefully on program exit
-        atexit.register(self.stop)
+    @property
+    def eta(self) -> Optional[float]:
+        """
+        Estimated seconds remaining, or None if the total is unknown or nothing has been done yet.
+        """
+        if self.total is None or not self.rate:
+            return None
+        return max(self.total - self.n, 0) / self.rate
 
-    def _spinner_task(self) -> None:
+    def set_total(self, total: Optional[int]) -> None:
         """
-        Internal method that runs in a separate thread to display the spinner animation.
+        Set the total number of items once it becomes known.
 
-        Continuously prints a rotating character until `self.running` is set to False.
+        Args:
+            total (Optional[int]): Total number of items.
         """
-        idx = 0
-        while self.running:
-            self.console.out(
-                f'{self.spinner_cycle[idx % len(self.spinner_cycle)]} Loading...',
-                control_prefix="\r",
-                flush=True,
-                newline=False,
-                include_time=False
-            )
-            time.sleep(self.delay)
-            idx += 1
-        self.console.out('Done!        ', control_prefix="\r")
+        self.total = total
 
-    def start(self) -> None:
+    def update(self, n: int = 1, nbytes: int = 0) -> None:
         """
-        Start the spinner animation in a background thread.
+        Record progress. Cheap enough to call once per item.
 
-        If the spinner is already running, this has no effect.
+        Args:
+            n (int): Number of items completed since the last update.
+            nbytes (int): Number of bytes processed since the last update.
         """
-        if not self.running:
-            self.running = True
-            self._thread = threading.Thread(target=self._spinner_task)
-            self._thread.start()
+        with self._lock:
+            self.n += n
+            self.nbytes += nbytes
+
+            now = time.monotonic()
+            interval = self.min_interval if self.console.writer.is_tty else self.log_interval
+            if now - self._last_render < interval:
+                return
+            self._last_render = now
 
-    def stop(self) -> None:
+        self.console.writer.set_status(self._key, self.render())
+
+    def wrap(self, _iter: Iterable) -> Iterator[Any]:
+        """
+        Iterate over an iterable, recording one item per element and closing the reporter when done.
+
+        Args:
+            _iter (Iterable): The iterable to track.
+
+        Yields:
+            Any: Elements of the iterable.
+        """
+        if self.total is None and hasattr(_iter, "__len__"):
+            self.total = len(_iter)
+        try:
+            for item in _iter:
+                yield item
+                self.update(1)
+        finally:
+            self.close()
+
+    def worker_handle(self) -> "ProgressHandle":
+        """
+        Create a picklable handle through which worker processes report progress to this reporter.
+
+        Returns:
+            ProgressHandle: Handle to pass to worker processes.
+        """
+        with self._lock:
+            if self._worker_queue is None:
+                self._manager = multiprocessing.Manager()
+                self._worker_queue = self._manager.Queue()
+                self._listener = threading.Thread(target=self._listen, name=f"icegraph-{self._key}", daemon=True)
+                self._listener.start()
+        return ProgressHandle(self._worker_queue)
+
+    def _listen(self) -> None:
+        """
+        Aggregate updates sent by worker handles until the reporter is closed.
         """
-        Stop the spinner animation.
+        while (message := self._worker_queue.get()) is not None:
+            self.update(*message)
 
-        Safe to call multiple times; only has an effect if the spinner is running.
+    def render(self) -> str:
+        """
+        Format the current progress as a single line.
+
+        Returns:
+            str: Formatted progress line.
+        """
+        if self.total:
+            done = f"{self.n}/{self.total} {self.unit} ({self.n / self.total:.1%})"
+        else:
+            done = f"{self.n} {self.unit}"
+
+        parts = [f"{self.desc}: {done}" if self.desc else done, f"{self.rate:.1f} {self.unit}/s"]
+        if self.nbytes:
+            parts.append(f"{self._format_bytes(self.byte_rate)}/s")
+        if (eta := self.eta) is not None:
+            parts.append(f"ETA {self._format_duration(eta)}")
+        else:
+            parts.append(f"elapsed {self._format_duration(self.elapsed)}")
+
+        return self.console.format(" | ".join(parts))
+
+    def close(self) -> None:
+        """
+        Stop reporting, remove the status line and print a final summary.
+
+        Safe to call multiple times.
+        """
+        if self.closed:
+            return
+        self.closed = True
+
+        if self._worker_queue is not None:
+            self._worker_queue.put(None)
+            self._listener.join()
+            self._manager.shutdown()
+
+        self.console.writer.set_status(self._key, None)
+        self.console.writer.write_line(self.render())
+
+    @staticmethod
+    def _format_bytes(nbytes: float) -> str:
+        for unit in ("B", "kB", "MB", "GB"):
+            if nbytes < 1000:
+                return f"{nbytes:.1f} {unit}"
+            nbytes /= 1000
+        return f"{nbytes:.1f} TB"
+
+    @staticmethod
+    def _format_duration(seconds: float) -> str:
+        minutes, seconds = divmod(int(seconds), 60)
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours:d}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes:02d}:{seconds:02d}"
+
+
+class ProgressHandle:
+    """
+    A picklable progress handle for worker processes.
+
+    Updates are accumulated locally and sent to the parent Progress at most every `interval` seconds,
+    so per-item updates inside a worker do not cost a round trip each.
+    """
+
+    def __init__(self, worker_queue, interval: float = 0.25) -> None:
+        """
+        Initialize the handle.
+
+        Args:
+            worker_queue: Manager queue of the parent Progress.
+            interval (float): Minimum number of seconds between messages to the parent.
+        """
+        self._queue = worker_queue
+        self.interval = interval
+        self._n = 0
+        self._nbytes = 0
+        self._last_sent = 0.0
+
+    def __getstate__(self) -> dict:
+        return {"_queue": self._queue, "interval": self.interval}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["_queue"], state["interval"])
+
+    def update(self, n: int = 1, nbytes: int = 0) -> None:
+        """
+        Record progress made in this worker.
+
+        Args:
+            n (int): Number of items completed since the last update.
+            nbytes (int): Number of bytes processed since the last update.
+        """
+        self._n += n
+        self._nbytes += nbytes
+
+        now = time.monotonic()
+        if now - self._last_sent >= self.interval:
+            self.flush()
+            self._last_sent = now
+
+    def flush(self) -> None:
+        """
+        Send any progress not yet reported to the parent. Call before the worker task returns.
         """
-        if self.running:
-            self.running = False
-            self._thread.join()
+        if self._n or self._nbytes:
+            self._queue.put((self._n, self._nbytes))
+            self._n = 0
+            self._nbytes = 0
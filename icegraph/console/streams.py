@@ -2,10 +2,15 @@
 # Developed by Taylor St Jean
 
 import os
+import sys
+import queue
+import atexit
+import threading
+from typing import Optional
 from contextlib import contextmanager
 
 
-__all__ = ["suppress_stderr"]
+__all__ = ["suppress_stderr", "ConsoleWriter"]
 
 @contextmanager
 def suppress_stderr():
@@ -19,3 +24,118 @@ def suppress_stderr():
         os.dup2(saved_fd, 2)    # Restore original stderr
         os.close(devnull_fd)
         os.close(saved_fd)
+
+
+class ConsoleWriter:
+    """
+    Serializes all console output through a single background writer thread.
+
+    Producers enqueue complete lines or status updates and return immediately, so output from
+    several threads never interleaves mid-line. Status lines (e.g. progress) are kept at the bottom
+    of the terminal: a regular line clears the current status line, is printed, and the status line
+    is redrawn after it. When stdout is not a terminal, status lines are printed as regular lines.
+    """
+
+    _CLEAR_LINE = "\r\033[K"
+
+    def __init__(self, stream=None) -> None:
+        """
+        Initialize the writer. The writer thread is started on first use.
+
+        Args:
+            stream: Output stream. Defaults to sys.stdout at write time.
+        """
+        self._stream = stream
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+        self._status: dict[str, str] = {}
+        self._pid = os.getpid()
+        atexit.register(self.flush)
+
+    @property
+    def stream(self):
+        return self._stream or sys.stdout
+
+    @property
+    def is_tty(self) -> bool:
+        """
+        Whether the output stream is an interactive terminal.
+        """
+        isatty = getattr(self.stream, "isatty", None)
+        return bool(isatty and isatty())
+
+    def _ensure_started(self) -> None:
+        # threads do not survive a fork, so a forked child starts its own writer
+        if self._thread is not None and self._thread.is_alive() and self._pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive() or self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._queue = queue.Queue()
+                self._thread = threading.Thread(target=self._run, name="icegraph-console", daemon=True)
+                self._thread.start()
+
+    def write_line(self, line: str, newline: bool = True) -> None:
+        """
+        Enqueue a regular line of output.
+
+        Args:
+            line (str): Text to write.
+            newline (bool): Whether to append a newline character.
+        """
+        self._ensure_started()
+        self._queue.put(("line", line + ("\n" if newline else "")))
+
+    def set_status(self, key: str, line: Optional[str]) -> None:
+        """
+        Set, replace or (with `line=None`) remove a status line.
+
+        Args:
+            key (str): Identifier of the status line.
+            line (Optional[str]): Status text, or None to remove the status line.
+        """
+        self._ensure_started()
+        self._queue.put(("status", key, line))
+
+    def flush(self) -> None:
+        """
+        Block until everything enqueued so far has been written.
+        """
+        if self._thread is not None and self._thread.is_alive() and self._pid == os.getpid():
+            self._queue.join()
+
+    def _run(self) -> None:
+        """
+        Writer thread loop.
+        """
+        while True:
+            item = self._queue.get()
+            try:
+                self._handle(item)
+            except Exception:
+                pass  # never let a broken stream kill the writer thread
+            finally:
+                self._queue.task_done()
+
+    def _handle(self, item: tuple) -> None:
+        stream = self.stream
+        tty = self.is_tty
+
+        if item[0] == "line":
+            if tty and self._status:
+                stream.write(self._CLEAR_LINE)
+            stream.write(item[1])
+        else:
+            _, key, line = item
+            if line is None:
+                self._status.pop(key, None)
+            else:
+                self._status[key] = line
+                if not tty:
+                    stream.write(line + "\n")
+
+        # redraw the status line below whatever was just written
+        if tty and (item[0] == "status" or item[1].endswith("\n")):
+            stream.write(self._CLEAR_LINE + " | ".join(self._status.values()))
+        stream.flush()
@@ -1,7 +1,43 @@
 # Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
 # Developed by Taylor St Jean
 
-from .models import TrainingDataset, ValidationDataset, TestDataset
-from .registry import DatasetRegistry
+from typing import TYPE_CHECKING
 
-__all__ = ["TrainingDataset", "ValidationDataset", "TestDataset", "DatasetRegistry"]
+from icegraph.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=["base", "cache", "converter", "extractor"],
+    attributes={
+        "TrainingDataset": ".models",
+        "ValidationDataset": ".models",
+        "TestDataset": ".models",
+        "DatasetRegistry": ".registry",
+        "PrefetchReader": ".prefetch",
+        "CompositeDataset": ".composite",
+        "SourceWeightedSampler": ".composite",
+        "DatasetStatistics": ".statistics",
+        "DomBucketBatchSampler": ".sampler",
+        "ShardCheckpoint": ".checkpoint",
+        "DatasetBuilder": ".builder",
+        "RowGroupSharding": ".sharding",
+        "collate_events": ".collate",
+        "collate_grid": ".collate",
+        "StagingCache": ".staging",
+        "TransformPipeline": ".transforms",
+    }
+)
+
+if TYPE_CHECKING:
+    from .models import TrainingDataset, ValidationDataset, TestDataset
+    from .registry import DatasetRegistry
+    from .prefetch import PrefetchReader
+    from .composite import CompositeDataset, SourceWeightedSampler
+    from .statistics import DatasetStatistics
+    from .sampler import DomBucketBatchSampler
+    from .checkpoint import ShardCheckpoint
+    from .builder import DatasetBuilder
+    from .sharding import RowGroupSharding
+    from .collate import collate_events, collate_grid
+    from .staging import StagingCache
+    from .transforms import TransformPipeline
@@ -2,3 +2,4 @@
 # Developed by Taylor St Jean
 
 from .models import IGData
+from .objects import PartitionedParquet
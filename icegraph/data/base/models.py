@@ -1,19 +1,36 @@
 # Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
 # Developed by Taylor St Jean
 
-from typing import Union
+from typing import Iterator, Optional, Union, TYPE_CHECKING
 from pathlib import Path
 import pyarrow.parquet as pq
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
 import pyarrow as pa
 from torch.utils.data import Dataset, DataLoader
 import torch
 import pandas as pd
 import numpy as np
+import json
+import os
+import time
 from abc import ABC
 
-from icegraph.data.converter import generate_vector_mapping, HDF5ToParquet
 from icegraph.config import IGConfig
+from icegraph.config.schemas import DatasetSchema, StorageProfile
 from icegraph.console import Console
+from icegraph.profiling import Profiler
+from icegraph.data.checkpoint import atomic_path
+from icegraph.data.collate import collate_events, collate_grid
+from icegraph.data.transforms import TransformPipeline
+from .objects import PartitionedParquet
+
+if TYPE_CHECKING:
+    from fsspec import AbstractFileSystem
+    from icegraph.geometry import DetectorGrid
+    from icegraph.data.prefetch import PrefetchReader
+    from icegraph.data.sampler import DomBucketBatchSampler
+    from icegraph.data.sharding import RowGroupSharding
 
 __all__ = ["IGData"]
 
@@ -26,61 +43,176 @@ class IGData(Dataset, ABC):
     for training, validation, or test subsets. Subclasses must set the class attribute `subset`
     to one of: "train", "validation", or "test".
 
+    Both converter output layouts are supported, and detected from the directory contents: single
+    'truth.parquet' and 'features.parquet' files, or 'truth/' and 'features/' directories of
+    (optionally Hive-partitioned) Parquet files. Directory data is read through pyarrow.dataset, and feature files in partitions
+    without any selected event are pruned.
+
+    The mapping from events to row groups is read from 'event_index.parquet' when the directory has one
+    (see IGData.write_event_index), and is otherwise built by scanning the event IDs of every row group.
+
+    Under data-parallel training, a RowGroupSharding restricts the dataset to the events of a contiguous run of row
+    groups assigned to this rank, and only their truth rows are loaded. Events keep their file order, so each rank reads
+    its region of the files sequentially. Call IGData.set_epoch to move to the shards of another epoch.
+
+    Only the feature columns of the configuration are read, which may be a subset of the features stored: data
+    converted with more features is opened as is, and checked against the DatasetSchema recorded in its files.
+
+    With `loading.output: grid` (or `sparse_grid`), samples also hold the detector grid cell of each DOM, and
+    IGData.collate scatters the DOMs of a batch into a dense (or sparse) detector grid tensor, see DetectorGrid.
+
+    Samples are returned untransformed; the transforms of the `transforms` config section are applied to whole
+    batches by IGData.collate. Data converted with `transforms.at_conversion` holds transformed values, and must
+    be opened with the same transforms.
+
+    With `staging.enabled`, the directory is first staged to node-local scratch (see StagingCache), and the
+    dataset is read from the staged copy.
+
     Attributes:
         data_dir (Path): Path to the directory containing the Parquet files.
+        filesystem (AbstractFileSystem | None): Filesystem the features, truth and event index are read through,
+            or None for local files.
+        partitioned (bool): Whether the data uses the Hive-partitioned layout.
         _config (IGConfig): Configuration object with user-defined settings.
         features_columns (list[str]): List of feature column names to extract.
         truth_df (pd.DataFrame): DataFrame storing the truth labels indexed by event_id.
-        features_file (pq.ParquetFile): Parquet file storing DOM-level features.
+        features_file (pq.ParquetFile | PartitionedParquet): Parquet file(s) storing DOM-level features.
         event_ids (list[str]): List of selected event IDs after applying filtering.
         target_labels (list[str]): List of target label keys to extract per event.
         label_map (dict): Mapping from event_id to target labels.
+        label_array (np.ndarray): Target labels of each index, of shape (len(self), num_labels), in `loading.label_dtype`.
+        feature_dtype (np.dtype): Precision of the sample features, `loading.feature_dtype`.
+        transforms (TransformPipeline): Transforms applied to collated batches by IGData.collate.
+        grid (DetectorGrid | None): Detector grid of the grid outputs, or None for lists of DOMs.
         metadata (pa.Metadata): Cached metadata from the feature file.
+        sharding (RowGroupSharding | None): Row group sharding of this rank, or None to load every event.
+        epoch (int): Epoch of the current shard.
         _truth_filtered (bool): Flag to ensure subset filtering is applied only once.
+        _row_group_index (dict[str, list[int]] | None): Lazily built mapping from event_id to row groups.
+        _dom_counts (np.ndarray | None): Lazily built number of hit DOMs of each event, in index order.
+        _features_dataset (PartitionedParquet | None): Discovered feature files of the partitioned layout.
+        _row_group_events (list[list[str]] | None): Events starting in each row group of the unpruned files, for sharding.
     """
 
     subset: str | None = None
 
-    def __init__(self, data_dir: Union[str, Path], config: IGConfig) -> None:
+    INDEX_FILE = "event_index.parquet"
+
+    def __init__(
+        self,
+        data_dir: Union[str, Path],
+        config: IGConfig,
+        sharding: Optional["RowGroupSharding"] = None,
+        epoch: int = 0
+    ) -> None:
         """
         Initialize an IGData object from a directory containing Parquet files.
 
         Args:
-            data_dir (Union[str, Path]): Path to the directory containing 'truth.parquet' and 'features.parquet'.
+            data_dir (Union[str, Path]): Path to the directory containing 'truth.parquet' and 'features.parquet',
+                or the partitioned 'truth/' and 'features/' directories.
             config (IGConfig): IceGraph configuration object containing user settings.
+            sharding (Optional[RowGroupSharding]): Row group sharding of this rank. Loads every event by default.
+            epoch (int): Epoch of the initial shard.
 
         Raises:
             NotImplementedError: If the `subset` class attribute is not defined in a subclass.
         """
         super(IGData, self).__init__()
         self.data_dir = Path(data_dir)
+        self.filesystem: "AbstractFileSystem | None" = None
+        if config.compiled.staging.enabled:
+            from icegraph.data.staging import StagingCache
+
+            staging = StagingCache(config)
+            self.data_dir = staging.stage(self.data_dir)
+            self.filesystem = staging.filesystem(self.data_dir)
+
         self._config: IGConfig = config
+        self.sharding = sharding
+        self.epoch = epoch
 
-        self.features_columns = list(generate_vector_mapping(config).values())
+        self.features_columns = list(config.compiled.feature_columns)
+        self.feature_dtype = np.dtype(config.compiled.loading.feature_dtype)
+        self.transforms = TransformPipeline.from_config(config)
+        self.grid: "DetectorGrid | None" = None
+        if config.compiled.loading.output != "doms":
+            from icegraph.geometry import DetectorGrid
 
-        self.truth_df: pd.DataFrame = pd.read_parquet(self.data_dir / "truth.parquet")
-        self.features_file: pq.ParquetFile = pq.ParquetFile(self.data_dir / "features.parquet")
+            self.grid = DetectorGrid.from_config(config)
+            dom_id_columns = list(config.compiled.dom_id_columns)
+            self._grid_columns = [dom_id_columns.index("string"), dom_id_columns.index("om")]
+        self.partitioned = (self.data_dir / "features").is_dir()
+        self._row_group_events: list[list[str]] | None = None
+
+        self._load()
+
+        # verify self.subset has been specified
+        if not self.subset:
+            raise NotImplementedError(
+                f"Subclasses of IGData must define the class attribute IGData.subset as one of ['train', 'validation', 'test']."
+            )
+
+    def _load(self) -> None:
+        """
+        Load the truth table of the dataset (or of this rank's shard), apply the selection and open the features.
+        """
+        with Profiler.stage("igdata.load_truth"):
+            if self.sharding is None:
+                self.truth_df: pd.DataFrame = self._read_truth()
+            else:
+                self.truth_df = self._read_shard_truth()
 
         # initialize cache attributes
         self._truth_filtered: bool = False
+        self._row_group_index: dict[str, list[int]] | None = None
+        self._dom_counts: np.ndarray | None = None
+        self._features_dataset: PartitionedParquet | None = None
 
         # prepare truth table and mappings
-        self.drop_subset_indices()
+        with Profiler.stage("igdata.selection"):
+            self.drop_subset_indices()
+
+        # opened after the selection, so partitions without selected events can be pruned
+        self.features_file: pq.ParquetFile | PartitionedParquet = self.open_features_file()
+        self._check_features()
 
         self.truth_df.set_index('event_id', inplace=True)
         self.event_ids = list(self.truth_df.index)
 
-        self.target_labels = self._config.user_config.target_labels
+        if self.sharding is not None and self.sharding.is_even(self.subset):
+            # every rank steps the same number of times, repeating events of the smaller shards
+            length = self.sharding.equalize(len(self.event_ids))
+            if length > len(self.event_ids) and self.event_ids:
+                self.event_ids *= -(-length // len(self.event_ids))
+            self.event_ids = self.event_ids[:length]
+
+        self.target_labels = list(self._config.compiled.target_labels)
         self.label_map = self.truth_df[self.target_labels].to_dict()
 
+        # labels of every index in one array, so samples are sliced from it rather than built from Python floats
+        self.label_array = self.truth_df.loc[self.event_ids, self.target_labels].to_numpy(
+            self._config.compiled.loading.label_dtype
+        )
+
         # preload metadata to speed things up later
         self.metadata = self.features_file.metadata
 
-        # verify self.subset has been specified
-        if not self.subset:
-            raise NotImplementedError(
-                f"Subclasses of IGData must define the class attribute IGData.subset as one of ['train', 'validation', 'test']."
-            )
+    def set_epoch(self, epoch: int) -> None:
+        """
+        Move a sharded dataset to the shard of the given epoch, reloading the truth rows of its events.
+
+        DataLoader workers receive a copy of the dataset when an iterator is created, so call this before
+        iterating, and do not use persistent workers.
+
+        Args:
+            epoch (int): Epoch number.
+        """
+        if epoch == self.epoch:
+            return
+        self.epoch = epoch
+        if self.sharding is not None:
+            self._load()
 
     def __len__(self) -> int:
         """
@@ -91,7 +223,7 @@ class IGData(Dataset, ABC):
         """
         return len(self.event_ids)
 
-    def __getitem__(self, idx: int) -> tuple[torch.Tensor, torch.Tensor]:
+    def __getitem__(self, idx: int) -> tuple[torch.Tensor, ...]:
         """
         Retrieve a single sample by index.
 
@@ -99,22 +231,49 @@ class IGData(Dataset, ABC):
             idx (int): Index of the event.
 
         Returns:
-            tuple[torch.Tensor, torch.Tensor]: Tuple of (features, labels) for the selected event.
+            tuple[torch.Tensor, ...]: Tuple of (features, labels) for the selected event, and the grid cell of
+                each DOM with a grid output.
         """
+        start = time.perf_counter() if Profiler.enabled else None
         event_id = self.event_ids[idx]
 
-        labels = []
-        for label in self.label_map:
-            labels.append(self.label_map[label][event_id])
+        row_groups = self.row_group_index.get(event_id)
+        if not row_groups:
+            raise ValueError(f"No features found for event {event_id}")
+
+        table = self.read_row_groups(self.features_file, row_groups)
+        sample = self.sample_from_table(table, idx)
+
+        if start is not None:
+            Profiler.observe("igdata.sample_latency", time.perf_counter() - start)
+        return sample
 
-        feature_array = self._get_features_for_event(event_id)
+    def collate(self, samples: list[tuple[torch.Tensor, ...]]) -> tuple[torch.Tensor, ...]:
+        """
+        Collate samples into one batch and apply the configured transforms to it: with collate_events, or with
+        collate_grid for the grid outputs.
 
-        return torch.tensor(feature_array), torch.tensor(labels)
+        Usage:
+            DataLoader(dataset, batch_size=32, collate_fn=dataset.collate)
+
+        Args:
+            samples (list[tuple[torch.Tensor, ...]]): Samples of this dataset.
+
+        Returns:
+            tuple[torch.Tensor, ...]: Features, event index of each DOM, and labels (see collate_events), or
+                grid features and labels (see collate_grid).
+        """
+        with Profiler.stage("igdata.collate"):
+            if self.grid is None:
+                return collate_events(samples, transforms=self.transforms)
+            sparse = self._config.compiled.loading.output == "sparse_grid"
+            return collate_grid(samples, self.grid, sparse, transforms=self.transforms)
 
-    @property
     def dataloader(self, **kwargs) -> DataLoader:
         """
-        Returns a PyTorch DataLoader for this dataset instance.
+        Returns a PyTorch DataLoader for this dataset instance. Batches are collated, and transformed, by
+        IGData.collate unless another `collate_fn` is given. Pass `num_workers="auto"` to use as many worker
+        processes as fit on the node, see ResourceGovernor.dataloader_workers.
 
         Args:
             **kwargs: Arguments to pass to torch.utils.data.DataLoader.
@@ -122,8 +281,379 @@ class IGData(Dataset, ABC):
         Returns:
             DataLoader: PyTorch DataLoader instance.
         """
+        kwargs.setdefault("collate_fn", self.collate)
+        if kwargs.get("num_workers") == "auto":
+            from icegraph.resources import ResourceGovernor
+
+            kwargs["num_workers"] = ResourceGovernor(self._config).dataloader_workers()
         return DataLoader(self, **kwargs)
 
+    def batch_sampler(self, max_doms: int, **kwargs) -> "DomBucketBatchSampler":
+        """
+        Returns a batch sampler which groups events of similar size into batches capped by their total number of DOMs.
+
+        Args:
+            max_doms (int): Maximum number of DOMs per batch.
+            **kwargs: Additional arguments to pass to icegraph.data.DomBucketBatchSampler.
+
+        Returns:
+            DomBucketBatchSampler: Batch sampler over dataset indices.
+        """
+        from icegraph.data.sampler import DomBucketBatchSampler
+
+        if self.sharding is not None:
+            # the dataset already only holds this rank's events
+            kwargs.setdefault("num_replicas", 1)
+            kwargs.setdefault("rank", 0)
+        return DomBucketBatchSampler(self, max_doms=max_doms, **kwargs)
+
+    def prefetcher(self, sampler=None, batch_size: int = 1, **kwargs) -> "PrefetchReader":
+        """
+        Returns a PrefetchReader which reads row groups ahead of the sampler order on a thread pool.
+
+        Args:
+            sampler (Optional[Iterable[int]]): Order in which to visit dataset indices. Defaults to sequential order.
+            batch_size (int): Number of events per batch.
+            **kwargs: Additional arguments to pass to icegraph.data.PrefetchReader.
+
+        Returns:
+            PrefetchReader: Iterable over prefetched batches.
+        """
+        from icegraph.data.prefetch import PrefetchReader
+
+        return PrefetchReader(self, sampler=sampler, batch_size=batch_size, **kwargs)
+
+    def open_features_file(self) -> pq.ParquetFile | PartitionedParquet:
+        """
+        Open a new handle to the features Parquet file.
+
+        Parquet file handles are not safe to share between threads, so readers running on a thread pool
+        should each open their own handle through this method. With the partitioned layout, the feature
+        files are discovered once and every handle shares the same, pruned, list of files.
+
+        Returns:
+            pq.ParquetFile | PartitionedParquet: Parquet file(s) storing DOM-level features.
+        """
+        pre_buffer = self._config.compiled.loading.pre_buffer
+        if not self.partitioned:
+            return pq.ParquetFile(
+                str(self.data_dir / "features.parquet"), pre_buffer=pre_buffer, filesystem=self.filesystem
+            )
+
+        if self._features_dataset is None:
+            self._features_dataset = PartitionedParquet.discover(
+                self.data_dir / "features",
+                partition_filter=self._partition_filter(),
+                pre_buffer=pre_buffer,
+                filesystem=self.filesystem
+            )
+        return PartitionedParquet(self._features_dataset.fragments, self._features_dataset.schema_arrow, pre_buffer)
+
+    @property
+    def storage_profile(self) -> dict | None:
+        """
+        Storage profile the features were written with, as recorded by the converter.
+
+        Returns:
+            dict | None: Profile settings, or None for data written before profiles were recorded.
+        """
+        metadata = self.features_file.schema_arrow.metadata or {}
+        if (profile := metadata.get(StorageProfile.METADATA_KEY)) is None:
+            return None
+        return json.loads(profile)
+
+    @property
+    def dataset_schema(self) -> DatasetSchema | None:
+        """
+        Description of the stored data, as recorded by the converter.
+
+        Returns:
+            DatasetSchema | None: Stored features and extraction settings, or None for data written before
+                they were recorded.
+        """
+        return DatasetSchema.from_metadata(self.features_file.schema_arrow.metadata)
+
+    def _check_features(self) -> None:
+        """
+        Verify that every requested feature column was stored, with the transforms configured to run at conversion.
+
+        Raises:
+            ValueError: If requested features are missing from the data, or its values were transformed otherwise.
+        """
+        schema = self.dataset_schema
+        transforms = self._config.compiled.dataset_schema.transforms
+        if (schema.transforms if schema else None) != transforms:
+            raise ValueError(
+                f"Data in {self.data_dir} was converted with transforms {schema.transforms if schema else None}, "
+                f"but the configuration applies {transforms} at conversion"
+            )
+
+        if schema is not None:
+            missing = schema.missing(self.features_columns)
+        else:
+            stored = set(self.features_file.schema_arrow.names)
+            missing = [col for col in self.features_columns if col not in stored]
+
+        if missing:
+            raise ValueError(
+                f"Features {missing} are not stored in {self.data_dir}, the data must be extracted again to add them"
+            )
+
+    def _read_truth(self) -> pd.DataFrame:
+        """
+        Read the truth table. With the partitioned layout, the partition columns are included.
+
+        Returns:
+            pd.DataFrame: Truth table with one row per event.
+        """
+        if not self.partitioned:
+            return pq.read_table(str(self.data_dir / "truth.parquet"), filesystem=self.filesystem).to_pandas()
+        return self._truth_dataset().to_table().to_pandas()
+
+    def _read_shard_truth(self) -> pd.DataFrame:
+        """
+        Read the truth rows of the events in this rank's shard, in the order their features are stored.
+
+        Returns:
+            pd.DataFrame: Truth table with one row per event of the shard.
+        """
+        if self._row_group_events is None:
+            self._row_group_events = self._scan_row_group_events()
+
+        weights = np.array([len(events) for events in self._row_group_events])
+        event_ids = [
+            event_id
+            for rg in self.sharding.select(weights, self.epoch)
+            for event_id in self._row_group_events[rg]
+        ]
+
+        condition = ds.field("event_id").isin(pa.array(event_ids, pa.string()))
+        truth = self._truth_dataset().to_table(filter=condition).to_pandas()
+
+        order = np.argsort(pd.Index(event_ids).get_indexer(truth["event_id"]), kind="stable")
+        return truth.iloc[order].reset_index(drop=True)
+
+    def _truth_dataset(self) -> ds.Dataset:
+        """
+        The truth table as a dataset, read through IGData.filesystem.
+        """
+        if not self.partitioned:
+            return ds.dataset(str(self.data_dir / "truth.parquet"), format="parquet", filesystem=self.filesystem)
+        return ds.dataset(str(self.data_dir / "truth"), format="parquet", partitioning="hive", filesystem=self.filesystem)
+
+    def _scan_row_group_events(self) -> list[list[str]]:
+        """
+        Events starting in each row group of the unpruned features files, from the event index if there is one.
+
+        Returns:
+            list[list[str]]: Event IDs first seen in each row group, in row group index order.
+        """
+        if self.partitioned:
+            features_file = PartitionedParquet.discover(self.data_dir / "features", filesystem=self.filesystem)
+        else:
+            features_file = pq.ParquetFile(str(self.data_dir / "features.parquet"), filesystem=self.filesystem)
+
+        row_group_events: list[list[str]] = [[] for _ in range(features_file.num_row_groups)]
+        if (self.data_dir / self.INDEX_FILE).exists():
+            locations = self._row_group_locations(self.data_dir, features_file)
+            global_ids = {location: rg for rg, location in enumerate(locations)}
+            index = pq.read_table(
+                str(self.data_dir / self.INDEX_FILE), columns=["event_id", "file", "row_group"], filesystem=self.filesystem
+            ).to_pandas()
+            index["rg"] = [global_ids[location] for location in zip(index["file"], index["row_group"])]
+            index = index.sort_values("rg", kind="stable").drop_duplicates("event_id")
+            for rg, event_id in zip(index["rg"], index["event_id"]):
+                row_group_events[rg].append(event_id)
+            return row_group_events
+
+        seen: set[str] = set()
+        for rg, event_ids, _ in self._scan_row_groups(features_file):
+            for event_id in event_ids:
+                if event_id not in seen:
+                    seen.add(event_id)
+                    row_group_events[rg].append(event_id)
+        return row_group_events
+
+    def _partition_filter(self) -> ds.Expression | None:
+        """
+        Build an expression matching the partitions which contain at least one selected event.
+
+        Returns:
+            ds.Expression | None: Filter on the partition columns, or None if there is nothing to prune on.
+        """
+        expression = None
+        for col in self._config.compiled.storage.partition_by:
+            if col not in self.truth_df.columns:
+                continue
+            condition = ds.field(col).isin(pa.array(self.truth_df[col].unique()))
+            expression = condition if expression is None else expression & condition
+        return expression
+
+    @property
+    def row_group_index(self) -> dict[str, list[int]]:
+        """
+        Mapping from event_id to the row groups of the features file containing that event.
+
+        Built once on first access, from the event index file if there is one, otherwise by reading only the
+        'event_id' column. The number of hit DOMs of each event is counted in the same pass, see IGData.dom_counts.
+
+        Returns:
+            dict[str, list[int]]: Row group indices for each event_id.
+        """
+        if self._row_group_index is None:
+            with Profiler.stage("igdata.build_index"):
+                if (self.data_dir / self.INDEX_FILE).exists():
+                    index, counts = self._load_event_index()
+                else:
+                    index, counts = {}, {}
+                    for rg, event_ids, rg_counts in self._scan_row_groups(self.features_file):
+                        for event_id, count in zip(event_ids, rg_counts):
+                            index.setdefault(event_id, []).append(rg)
+                            counts[event_id] = counts.get(event_id, 0) + count
+            self._dom_counts = np.array([counts.get(event_id, 0) for event_id in self.event_ids], dtype=np.int64)
+            self._row_group_index = index
+        return self._row_group_index
+
+    def _load_event_index(self) -> tuple[dict[str, list[int]], dict[str, int]]:
+        """
+        Read the row groups and DOM counts of the selected events from the prebuilt event index.
+
+        Row groups of files which were pruned from this dataset are dropped.
+
+        Returns:
+            tuple[dict[str, list[int]], dict[str, int]]: Row group indices and number of hit DOMs of each event_id.
+        """
+        table = pq.read_table(str(self.data_dir / self.INDEX_FILE), filesystem=self.filesystem)
+        table = table.filter(pc.is_in(table.column("event_id"), pa.array(self.event_ids, pa.string())))
+
+        global_ids = {location: rg for rg, location in enumerate(self._row_group_locations(self.data_dir, self.features_file))}
+        df = table.to_pandas()
+        df["rg"] = [global_ids.get(location, -1) for location in zip(df["file"], df["row_group"])]
+        df = df[df["rg"] >= 0]
+
+        index = df.groupby("event_id", sort=False)["rg"].agg(list).to_dict()
+        counts = df.groupby("event_id", sort=False)["num_doms"].sum().to_dict()
+        return index, counts
+
+    @staticmethod
+    def _scan_row_groups(features_file: pq.ParquetFile | PartitionedParquet) -> Iterator[tuple[int, list[str], list[int]]]:
+        """
+        Count the feature rows of every event in each row group, reading only the 'event_id' column.
+
+        Args:
+            features_file (pq.ParquetFile | PartitionedParquet): Parquet file(s) storing DOM-level features.
+
+        Yields:
+            tuple[int, list[str], list[int]]: Row group index, event IDs in the row group and their row counts.
+        """
+        for rg in range(features_file.num_row_groups):
+            ids = features_file.read_row_group(rg, columns=["event_id"]).column("event_id")
+            value_counts = pc.value_counts(ids)
+            yield rg, value_counts.field("values").to_pylist(), value_counts.field("counts").to_pylist()
+
+    @staticmethod
+    def _row_group_locations(data_dir: Path, features_file: pq.ParquetFile | PartitionedParquet) -> list[tuple[str, int]]:
+        """
+        File, relative to the data directory, and row group within that file of every row group index.
+
+        Args:
+            data_dir (Path): Converted directory.
+            features_file (pq.ParquetFile | PartitionedParquet): Parquet file(s) storing DOM-level features.
+
+        Returns:
+            list[tuple[str, int]]: Location of each row group, in row group index order.
+        """
+        if isinstance(features_file, pq.ParquetFile):
+            return [("features.parquet", rg) for rg in range(features_file.num_row_groups)]
+        return [
+            (Path(os.path.relpath(fragment.path, data_dir)).as_posix(), rg)
+            for fragment in features_file.fragments
+            for rg in range(fragment.num_row_groups)
+        ]
+
+    @classmethod
+    def write_event_index(cls, data_dir: Union[str, Path]) -> Path:
+        """
+        Write the event index of a converted directory, so datasets opened on it do not scan the event IDs.
+
+        The index has one row per event and row group, with the file and row group within that file, and the
+        number of the event's feature rows in that row group. It covers all events, whatever the selection.
+
+        Args:
+            data_dir (Union[str, Path]): Converted directory.
+
+        Returns:
+            Path: Path to the index file.
+        """
+        data_dir = Path(data_dir)
+        if (data_dir / "features").is_dir():
+            features_file = PartitionedParquet.discover(data_dir / "features")
+        else:
+            features_file = pq.ParquetFile(data_dir / "features.parquet")
+
+        locations = cls._row_group_locations(data_dir, features_file)
+        columns: dict[str, list] = {"event_id": [], "file": [], "row_group": [], "num_doms": []}
+        for rg, event_ids, rg_counts in cls._scan_row_groups(features_file):
+            file, file_rg = locations[rg]
+            columns["event_id"] += event_ids
+            columns["file"] += [file] * len(event_ids)
+            columns["row_group"] += [file_rg] * len(event_ids)
+            columns["num_doms"] += rg_counts
+
+        table = pa.table({
+            "event_id": pa.array(columns["event_id"], pa.string()),
+            "file": pa.array(columns["file"], pa.string()).dictionary_encode(),
+            "row_group": pa.array(columns["row_group"], pa.int32()),
+            "num_doms": pa.array(columns["num_doms"], pa.int64()),
+        })
+
+        output_path = data_dir / cls.INDEX_FILE
+        with atomic_path(output_path) as tmp:
+            pq.write_table(table, tmp)
+        return output_path
+
+    @property
+    def dom_counts(self) -> np.ndarray:
+        """
+        Number of hit DOMs (feature rows) of each event, in index order.
+
+        Computed once, together with IGData.row_group_index, without decoding any feature column.
+
+        Returns:
+            np.ndarray: Integer array of shape (len(self),).
+        """
+        if self._dom_counts is None:
+            _ = self.row_group_index
+        return self._dom_counts
+
+    def row_groups_for_indices(self, indices: list[int]) -> list[int]:
+        """
+        Determine the sorted set of row groups needed to load the given dataset indices.
+
+        Args:
+            indices (list[int]): Dataset indices.
+
+        Returns:
+            list[int]: Sorted row group indices.
+        """
+        index = self.row_group_index
+        row_groups = set()
+        for idx in indices:
+            row_groups.update(index.get(self.event_ids[idx], ()))
+        return sorted(row_groups)
+
+    def get_labels(self, event_id: str) -> list[float]:
+        """
+        Retrieve the target labels for a given event.
+
+        Args:
+            event_id (str): Event identifier string.
+
+        Returns:
+            list[float]: Target label values, ordered as in the config.
+        """
+        return [self.label_map[label][event_id] for label in self.label_map]
+
     def drop_subset_indices(self) -> None:
         """
         Applies a selection filter to keep only the subset of truth_df that matches the config-defined criteria.
@@ -134,7 +664,7 @@ class IGData(Dataset, ABC):
         if self._truth_filtered:
             return  # Already applied
 
-        selection_str = getattr(self._config.user_config.selection, self.subset)
+        selection_str = getattr(self._config.compiled.selection, self.subset)
         Console.out(f"Using selection string for {self.subset=}: {selection_str}", severity=1)
 
         # Extract 'Event' safely from 'event_id'
@@ -167,32 +697,163 @@ class IGData(Dataset, ABC):
         Raises:
             ValueError: If no features were found for the given event ID.
         """
-        # Scan row groups for matching base_id
-        matching_batches = []
+        row_groups = self.row_group_index.get(event_id)
+        if not row_groups:
+            raise ValueError(f"No features found for event {event_id}")
+
+        table = self.read_row_groups(self.features_file, row_groups)
+        return self.features_from_table(table, event_id, self.features_columns, self.feature_dtype)
+
+    def read_row_groups(self, features_file: pq.ParquetFile | PartitionedParquet, row_groups: list[int]) -> pa.Table:
+        """
+        Read the ID and feature columns of the given row groups in a single call.
+
+        Reading several row groups at once lets pyarrow coalesce the column chunk byte ranges
+        when pre-buffering is enabled.
+
+        Args:
+            features_file (pq.ParquetFile | PartitionedParquet): Handle to the features file(s) to read from.
+            row_groups (list[int]): Row group indices to read.
 
-        for rg in range(self.features_file.num_row_groups):
-            row_group_table = self.features_file.read_row_group(
-                rg, columns=["event_id", "dom_id"] + self.features_columns
+        Returns:
+            pa.Table: Table with 'event_id', 'dom_id' and feature columns.
+        """
+        with Profiler.stage("igdata.read"):
+            table = features_file.read_row_groups(
+                row_groups, columns=["event_id", "dom_id"] + self.features_columns, use_threads=False
             )
-            ids = row_group_table.column("event_id").to_pylist()
-            mask = [i == event_id for i in ids]
 
-            # continue loop if none on this iteration
-            if not any(mask):
-                continue
+        if Profiler.enabled:
+            Profiler.count("igdata.read.bytes", table.nbytes)
+            Profiler.count("igdata.read.rows", table.num_rows)
+            Profiler.count("igdata.read.row_groups", len(row_groups))
+        return table
+
+    def sample_from_table(self, table: pa.Table, idx: int) -> tuple[torch.Tensor, ...]:
+        """
+        Build the (features, labels) sample of an index from a table of row groups containing its event.
+
+        The features are copied once, from the Arrow columns into a contiguous array in `loading.feature_dtype`,
+        and wrapped by torch without another copy. With a grid output, the grid cell of each DOM is added.
+
+        Args:
+            table (pa.Table): Table returned by IGData.read_row_groups.
+            idx (int): Index of the event.
+
+        Returns:
+            tuple[torch.Tensor, ...]: Features of shape (num_DOMs, num_features) and labels of shape (num_labels,),
+                then grid cells of shape (num_DOMs,) with a grid output.
+
+        Raises:
+            ValueError: If no features were found for the event.
+        """
+        event_id = self.event_ids[idx]
+        labels = torch.from_numpy(self.label_array[idx].copy())
+        if self.grid is None:
+            features = self.features_from_table(table, event_id, self.features_columns, self.feature_dtype)
+            return torch.from_numpy(features), labels
+
+        rows = self._event_rows(table, event_id, ["dom_id"] + self.features_columns)
+        features = self._to_contiguous(rows, self.features_columns, self.feature_dtype)
+        cells = self.grid.cells(self.unpack_dom_ids(rows.column("dom_id"))[:, self._grid_columns])
+        return torch.from_numpy(features), labels, torch.from_numpy(cells)
+
+    @staticmethod
+    def features_from_table(
+        table: pa.Table,
+        event_id: str,
+        columns: Optional[list[str]] = None,
+        dtype: np.dtype | str = np.float32
+    ) -> np.ndarray:
+        """
+        Slice the DOM-level feature vectors of a single event out of a table of row groups.
+
+        Args:
+            table (pa.Table): Table returned by IGData.read_row_groups.
+            event_id (str): Event identifier string.
+            columns (Optional[list[str]]): Feature columns, in order. Defaults to every column but the IDs.
+            dtype (np.dtype | str): Precision of the returned array.
+
+        Returns:
+            np.ndarray: C-contiguous 2D array of shape (num_DOMs, num_features) for the event.
+
+        Raises:
+            ValueError: If no features were found for the given event ID.
+        """
+        columns = columns or [col for col in table.column_names if col not in ("event_id", "dom_id")]
+        rows = IGData._event_rows(table, event_id, columns)
+        return IGData._to_contiguous(rows, columns, dtype)
+
+    def event_from_table(self, table: pa.Table, event_id: str) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Slice the feature vectors and DOM IDs of a single event out of a table of row groups.
+
+        Args:
+            table (pa.Table): Table returned by IGData.read_row_groups.
+            event_id (str): Event identifier string.
 
-            # Filter relevant rows
-            mask_array = pa.array(mask)
-            batch = row_group_table.filter(mask_array)
-            matching_batches.append(batch)
+        Returns:
+            tuple[np.ndarray, np.ndarray]:
+                - Feature array (num_DOMs, num_features)
+                - DOM ID array (num_DOMs, num_dom_id_columns), e.g. [string, om, pmt]
 
-        if not matching_batches:
+        Raises:
+            ValueError: If no features were found for the given event ID.
+        """
+        rows = self._event_rows(table, event_id, ["dom_id"] + self.features_columns)
+        features = self._to_contiguous(rows, self.features_columns, np.float32)
+        return features, self.unpack_dom_ids(rows.column("dom_id"))
+
+    @staticmethod
+    def _event_rows(table: pa.Table, event_id: str, columns: list[str]) -> pa.Table:
+        """
+        Rows of a single event, restricted to the given columns. The rows of an event are normally contiguous,
+        in which case the result is a zero-copy slice of the table.
+
+        Raises:
+            ValueError: If no features were found for the given event ID.
+        """
+        rows = np.flatnonzero(pc.equal(table.column("event_id"), event_id).to_numpy(zero_copy_only=False))
+        if not len(rows):
             raise ValueError(f"No features found for event {event_id}")
 
-        # Concatenate all matching batches
-        all_rows = pa.concat_tables(matching_batches)
-        df = all_rows.to_pandas().drop(columns=['event_id', "dom_id"])  # Drop ID, keep only features
-        return df.to_numpy(dtype='float32')
+        table = table.select(columns)
+        if rows[-1] - rows[0] + 1 == len(rows):
+            return table.slice(rows[0], len(rows))
+        return table.take(rows)
+
+    @staticmethod
+    def _to_contiguous(table: pa.Table, columns: list[str], dtype: np.dtype | str) -> np.ndarray:
+        """
+        Gather columns into a C-contiguous (num_rows, num_columns) array, casting while copying out of Arrow.
+        """
+        out = np.empty((table.num_rows, len(columns)), dtype=dtype)
+        for i, col in enumerate(columns):
+            offset = 0
+            for chunk in table.column(col).chunks:
+                # a view of the Arrow buffer for primitive columns without nulls
+                out[offset:offset + len(chunk), i] = chunk.to_numpy(zero_copy_only=False)
+                offset += len(chunk)
+        return out
+
+    def unpack_dom_ids(self, dom_ids: pa.ChunkedArray | pa.Array) -> np.ndarray:
+        """
+        Unpack composite DOM ID strings ('col=value|col=value|...') into integers, in a single vectorized pass.
+
+        Args:
+            dom_ids (pa.ChunkedArray | pa.Array): Packed DOM ID strings.
+
+        Returns:
+            np.ndarray: Integer array of shape (len(dom_ids), num_dom_id_columns).
+        """
+        columns = self._config.compiled.dom_id_columns
+        pattern = "^" + r"\|".join(rf"{col}=(?P<c{i}>-?\d+)" for i, col in enumerate(columns)) + "$"
+        parts = pc.extract_regex(dom_ids, pattern)
+        if isinstance(parts, pa.ChunkedArray):
+            parts = parts.combine_chunks()
+        return np.column_stack(
+            [pc.cast(parts.field(f"c{i}"), pa.int64()).to_numpy(zero_copy_only=False) for i in range(len(columns))]
+        ).reshape(len(dom_ids), len(columns))
 
     def get_with_dom_id(self, idx: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
@@ -207,22 +868,22 @@ class IGData(Dataset, ABC):
             tuple[np.ndarray, np.ndarray, np.ndarray]:
                 - Feature array (num_DOMs, num_features)
                 - Labels array (num_labels,)
-                - DOM ID array (num_DOMs, 2) with [string, om]
+                - DOM ID array (num_DOMs, num_dom_id_columns), e.g. [string, om, pmt]
+
+        Raises:
+            ValueError: If no features were found for the given event.
         """
         event_id = self.event_ids[idx]
+        labels = self.get_labels(event_id)
 
-        labels = []
-        for label in self.label_map:
-            labels.append(self.label_map[label][event_id])
-
-        feature_array = self._get_features_for_event(event_id)
+        row_groups = self.row_group_index.get(event_id)
+        if not row_groups:
+            raise ValueError(f"No features found for event {event_id}")
 
-        dom_ids = np.array(self.features_file.read(columns=["dom_id"]).to_pandas())
-        unpacked_dom_ids = []
-        for _id in dom_ids:
-            unpacked_dom_ids.append(self._unpack_id(_id[0]))
+        table = self.read_row_groups(self.features_file, row_groups)
+        feature_array, dom_ids = self.event_from_table(table, event_id)
 
-        return np.array(feature_array), np.array(labels), np.array(unpacked_dom_ids)
+        return feature_array, np.array(labels), dom_ids
 
     @staticmethod
     def _unpack_id(_id: str) -> list[int]:
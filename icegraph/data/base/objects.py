@@ -0,0 +1,159 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+from pathlib import Path
+from typing import Optional, Union, TYPE_CHECKING
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+if TYPE_CHECKING:
+    from fsspec import AbstractFileSystem
+
+
+__all__ = ["PartitionedParquet"]
+
+class PartitionedParquet:
+    """
+    Read-only view of a Hive-partitioned Parquet dataset, exposing the subset of the pq.ParquetFile
+    interface used by IGData.
+
+    The row groups of all files are numbered consecutively in path order, so row group indices can be
+    used exactly as with a single file. Reads spanning several files are issued as one pyarrow.dataset
+    scan, which reads the files in parallel. The view holds no open file handles and can be shared
+    between threads.
+
+    Attributes:
+        fragments (list[ds.ParquetFileFragment]): Files of the dataset, in path order.
+        schema_arrow (pa.Schema): Schema of the dataset, including the partition columns.
+    """
+
+    def __init__(
+        self,
+        fragments: list[ds.ParquetFileFragment],
+        schema: pa.Schema,
+        pre_buffer: bool = True
+    ) -> None:
+        """
+        Initialize the view over already discovered files.
+
+        Args:
+            fragments (list[ds.ParquetFileFragment]): Files of the dataset.
+            schema (pa.Schema): Schema of the dataset.
+            pre_buffer (bool): Whether to pre-buffer (and coalesce) column chunk reads.
+        """
+        self.fragments = sorted(fragments, key=lambda fragment: fragment.path)
+        self.schema_arrow = schema
+        self._format = ds.ParquetFileFormat(
+            default_fragment_scan_options=ds.ParquetFragmentScanOptions(pre_buffer=pre_buffer)
+        )
+
+        # (file, row group within the file) of every global row group index
+        self._row_groups: list[tuple[int, int]] = [
+            (i, rg) for i, fragment in enumerate(self.fragments) for rg in range(fragment.num_row_groups)
+        ]
+
+    @classmethod
+    def discover(
+        cls,
+        path: Union[str, Path],
+        partition_filter: Optional[ds.Expression] = None,
+        pre_buffer: bool = True,
+        filesystem: Optional["AbstractFileSystem"] = None
+    ) -> "PartitionedParquet":
+        """
+        Discover the files of a Hive-partitioned Parquet directory.
+
+        Args:
+            path (Union[str, Path]): Root directory of the dataset.
+            partition_filter (Optional[ds.Expression]): Expression on the partition columns. Files in
+                partitions that cannot match it are pruned without being opened.
+            pre_buffer (bool): Whether to pre-buffer (and coalesce) column chunk reads.
+            filesystem (Optional[AbstractFileSystem]): Filesystem to read the files through. Defaults to local files.
+
+        Returns:
+            PartitionedParquet: View over the matching files.
+        """
+        dataset = ds.dataset(str(path), format="parquet", partitioning="hive", filesystem=filesystem)
+        return cls(list(dataset.get_fragments(filter=partition_filter)), dataset.schema, pre_buffer)
+
+    @property
+    def num_row_groups(self) -> int:
+        """
+        Total number of row groups over all files.
+        """
+        return len(self._row_groups)
+
+    @property
+    def metadata(self) -> Optional[pq.FileMetaData]:
+        """
+        Parquet metadata of the first file, or None if the dataset is empty.
+        """
+        return self.fragments[0].metadata if self.fragments else None
+
+    def read_row_group(self, i: int, columns: Optional[list[str]] = None, use_threads: bool = True) -> pa.Table:
+        """
+        Read a single row group.
+
+        Args:
+            i (int): Global row group index.
+            columns (Optional[list[str]]): Columns to read. Defaults to all columns.
+            use_threads (bool): Whether to decode using multiple threads.
+
+        Returns:
+            pa.Table: Contents of the row group.
+        """
+        return self.read_row_groups([i], columns=columns, use_threads=use_threads)
+
+    def read_row_groups(
+        self,
+        row_groups: list[int],
+        columns: Optional[list[str]] = None,
+        use_threads: bool = True
+    ) -> pa.Table:
+        """
+        Read several row groups, possibly spanning several files, in a single scan.
+
+        Args:
+            row_groups (list[int]): Global row group indices, in the order to return them.
+            columns (Optional[list[str]]): Columns to read. Defaults to all columns.
+            use_threads (bool): Whether to read and decode using multiple threads.
+
+        Returns:
+            pa.Table: Contents of the row groups.
+        """
+        by_file: dict[int, list[int]] = {}
+        for i in row_groups:
+            file_idx, rg = self._row_groups[i]
+            by_file.setdefault(file_idx, []).append(rg)
+
+        return self._scan(
+            [self.fragments[file_idx].subset(row_group_ids=rgs) for file_idx, rgs in by_file.items()],
+            columns,
+            use_threads
+        )
+
+    def read(self, columns: Optional[list[str]] = None, use_threads: bool = True) -> pa.Table:
+        """
+        Read all files.
+
+        Args:
+            columns (Optional[list[str]]): Columns to read. Defaults to all columns.
+            use_threads (bool): Whether to read and decode using multiple threads.
+
+        Returns:
+            pa.Table: Contents of the dataset.
+        """
+        return self._scan(self.fragments, columns, use_threads)
+
+    def _scan(self, fragments: list[ds.ParquetFileFragment], columns: Optional[list[str]], use_threads: bool) -> pa.Table:
+        """
+        Scan the given files or file subsets in order.
+        """
+        if not fragments:
+            schema = self.schema_arrow
+            return schema.empty_table().select(columns) if columns else schema.empty_table()
+
+        dataset = ds.FileSystemDataset(fragments, self.schema_arrow, self._format, filesystem=fragments[0].filesystem)
+        return dataset.to_table(columns=columns, use_threads=use_threads)
@@ -0,0 +1,222 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Optional, Sequence, TYPE_CHECKING
+
+from icegraph.config import IGConfig
+from icegraph.console import Console
+from icegraph.profiling import Profiler
+from icegraph.data.cache import IGConversionCache
+
+if TYPE_CHECKING:
+    from distributed import Client
+    from icegraph.cluster import DaskCluster
+
+
+__all__ = ["DatasetBuilder"]
+
+class DatasetBuilder:
+    """
+    Runs the preprocessing of a dataset as explicit stages, so it can be done ahead of time on batch nodes
+    rather than lazily by DatasetRegistry.from_config on the nodes that train.
+
+    The stages, in order:
+    - `hash`: compute the input state hash which names the outputs and keys the conversion cache,
+    - `extract`: run the feature extraction (FeatureExtractor.extract),
+    - `convert`: convert the extracted HDF5 files to Parquet (skipped with `extraction.output: arrow`),
+    - `index`: write the event index read by IGData (IGData.write_event_index),
+    - `statistics`: store the feature statistics (DatasetStatistics.write),
+    - `register`: register the converted directory in the conversion cache.
+
+    Extraction and conversion are checkpointed, so stages can be run separately, and an interrupted build
+    is resumed. Each stage finds the outputs of earlier stages at their default locations.
+
+    Usage:
+        python -m icegraph build config/config.yaml --extract-workers 8 --dask-workers 8
+    """
+
+    STAGES = ("hash", "extract", "convert", "index", "statistics", "register")
+
+    def __init__(
+        self,
+        config: IGConfig,
+        extract_workers: Optional[int] = None,
+        dask_workers: Optional[int] = None,
+        resume: bool = True
+    ) -> None:
+        """
+        Initialize the builder.
+
+        Args:
+            config (IGConfig): IceGraph configuration object containing user settings.
+            extract_workers (Optional[int]): Number of input files extracted in parallel. Defaults to what fits
+                on the node, see ResourceGovernor.
+            dask_workers (Optional[int]): Number of workers of a local Dask cluster used for conversion and
+                statistics. Defaults to the `dask` settings.
+            resume (bool): Whether to reuse the completed work of earlier builds.
+        """
+        from icegraph.data.extractor import FeatureExtractor
+
+        self._config: IGConfig = config
+        self.extract_workers = extract_workers
+        self.dask_workers = dask_workers
+        self.resume = resume
+
+        self.extractor = FeatureExtractor(config)
+        self.input_hash: Optional[str] = None
+        self._client: Optional["Client"] = None
+
+    @property
+    def arrow(self) -> bool:
+        """
+        Whether extraction writes the converted layout directly.
+        """
+        return self._config.compiled.extraction.output == "arrow"
+
+    @property
+    def extracted_dir(self) -> Path:
+        """
+        Output directory of the extract stage.
+        """
+        return self.extractor.parquet_dir if self.arrow else self.extractor.hdf5_dir
+
+    @property
+    def converted_dir(self) -> Path:
+        """
+        Output directory of the convert stage, 'extraction/parquet/<input state hash>', or the output directory
+        of the extract stage with `extraction.output: arrow`.
+        """
+        if self.arrow:
+            return self.extracted_dir
+        return self.extracted_dir.parent / "parquet" / self._config.get_input_state_hash()
+
+    def run(self, stages: Optional[Sequence[str]] = None) -> Path:
+        """
+        Run the given stages, in build order.
+
+        Args:
+            stages (Optional[Sequence[str]]): Stages to run. Defaults to all stages.
+
+        Returns:
+            Path: The converted directory.
+
+        Raises:
+            ValueError: If a stage is unknown.
+        """
+        stages = self.STAGES if stages is None else stages
+        if unknown := sorted(set(stages) - set(self.STAGES)):
+            raise ValueError(f"Unknown build stages {unknown}, expected any of {list(self.STAGES)}")
+
+        use_dask = self.dask_workers is not None and {"convert", "statistics"} & set(stages)
+        with self._dask_cluster() if use_dask else nullcontext() as client:
+            self._client = client
+            for stage in self.STAGES:
+                if stage in stages:
+                    Console.out(f"Build stage: {stage}")
+                    with Profiler.stage(f"build.{stage}"):
+                        getattr(self, stage)()
+
+        return self.converted_dir
+
+    def _dask_cluster(self) -> "DaskCluster":
+        """
+        Local Dask cluster with the requested number of workers.
+        """
+        from icegraph.cluster import DaskCluster
+
+        return DaskCluster(self._config, n_workers=self.dask_workers)
+
+    def hash(self) -> str:
+        """
+        Compute the input state hash.
+
+        Returns:
+            str: Hash of the input files and the settings affecting the output.
+        """
+        self.input_hash = self._config.get_input_state_hash()
+        Console.out(f"Input state hash: {self.input_hash}")
+
+        if cached := IGConversionCache(self._config).query():
+            Console.out(f"Cached data found: {cached}", severity=1)
+        return self.input_hash
+
+    def extract(self) -> Path:
+        """
+        Run the feature extraction.
+
+        Returns:
+            Path: Directory of extracted HDF5 files, or the converted directory with `extraction.output: arrow`.
+        """
+        return self.extractor.extract(resume=self.resume, num_workers=self.extract_workers)
+
+    def convert(self) -> Path:
+        """
+        Convert the extracted HDF5 files to Parquet.
+
+        Returns:
+            Path: The converted directory.
+
+        Raises:
+            FileNotFoundError: If the extract stage has not completed.
+        """
+        from icegraph.data.converter import HDF5ToParquet
+
+        if self.arrow:
+            Console.out("Extraction writes the converted layout, nothing to convert", severity=1)
+            return self.converted_dir
+
+        if not self.extracted_dir.is_dir():
+            raise FileNotFoundError(f"No completed extraction at {self.extracted_dir}, run the extract stage first")
+
+        converter = HDF5ToParquet(self._config, self.extracted_dir, output_dir=self.converted_dir.parent)
+        if self._client is not None:
+            return converter.convert_distributed(self._client, resume=self.resume)
+        return converter.convert(resume=self.resume)
+
+    def index(self) -> Path:
+        """
+        Write the event index of the converted directory.
+
+        Returns:
+            Path: Path to the index file.
+        """
+        from icegraph.data.base import IGData
+
+        path = IGData.write_event_index(self._converted())
+        Console.out(f"Event index saved to {path}")
+        return path
+
+    def statistics(self) -> Path:
+        """
+        Compute and store the feature statistics of the converted directory.
+
+        Returns:
+            Path: Path to the statistics file.
+        """
+        from icegraph.data.statistics import DatasetStatistics
+
+        path = DatasetStatistics(self._converted(), self._config, self._client).write()
+        Console.out(f"Feature statistics saved to {path}")
+        return path
+
+    def register(self) -> Path:
+        """
+        Register the converted directory in the conversion cache, so DatasetRegistry.from_config opens it directly.
+
+        Returns:
+            Path: The converted directory.
+        """
+        converted = self._converted()
+        IGConversionCache(self._config).register(converted)
+        Console.out(f"Registered {converted} for input state {self._config.get_input_state_hash()}")
+        return converted
+
+    def _converted(self) -> Path:
+        """
+        The converted directory, which must exist.
+        """
+        if not self.converted_dir.is_dir():
+            raise FileNotFoundError(f"No converted data at {self.converted_dir}, run the convert stage first")
+        return self.converted_dir
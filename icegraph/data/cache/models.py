@@ -6,7 +6,13 @@ import time
 from typing import Optional, Union
 from pathlib import Path
 
+from filelock import FileLock
+
 from icegraph.config import IGConfig
+from icegraph.config.schemas import DatasetSchema
+from icegraph.console import Console
+from icegraph.profiling import Profiler
+from icegraph.data.checkpoint import atomic_path
 
 
 __all__ = ["IGConversionCache"]
@@ -39,17 +45,28 @@ class IGConversionCache:
 
     def _save_cache(self, cache: dict) -> None:
         """
-        Save the provided cache dictionary to disk as JSON.
+        Save the provided cache dictionary to disk as JSON, replacing the file atomically so concurrent readers
+        never see it half written.
 
         Args:
             cache (dict): The cache mapping to save.
         """
-        self._cache_file.write_text(json.dumps(cache, indent=2))
+        with atomic_path(self._cache_file) as tmp:
+            tmp.write_text(json.dumps(cache, indent=2))
+
+    def _lock(self) -> FileLock:
+        """
+        Lock serializing updates of the cache file across processes, so concurrent updates are not lost.
+        """
+        return FileLock(self._cache_file.with_name(f"{self._cache_file.name}.lock"), is_singleton=True)
 
     def register(self, output_dir: Union[str, Path]) -> None:
         """
         Register a new conversion output in the cache.
 
+        Along with the input state hash, entries record a hash of the input files alone and of the extraction
+        settings other than the feature list, so outputs of the same inputs with more features can be reused.
+
         Args:
             output_dir (Union[str, Path]): Path to the output directory.
         """
@@ -58,17 +75,40 @@ class IGConversionCache:
         output_dir = Path(output_dir)
 
         dir_hash = self._config.get_input_state_hash()
-        cache = self._load_cache()
-        cache[dir_hash] = {
+        entry = {
             "converted_path": str(output_dir),
-            "timestamp": time.time()
+            "timestamp": time.time(),
+            "input_files": self._config.get_input_files_hash(),
+            "extraction": self._config.compiled.extraction_hash
         }
-        self._save_cache(cache)
+        with self._lock():
+            cache = self._load_cache()
+            cache[dir_hash] = entry
+            self._save_cache(cache)
+
+    def lookup(self, dir_hash: str) -> Optional[Path]:
+        """
+        Look up the converted output registered under a given input hash, regardless of the current config.
+
+        Args:
+            dir_hash (str): Input state hash the output was registered under.
+
+        Returns:
+            Optional[Path]: Path to converted output, or None if not cached or no longer on disk.
+        """
+        entry = self._load_cache().get(dir_hash)
+        if not entry or not Path(entry["converted_path"]).exists():
+            return None
+        return Path(entry["converted_path"])
 
     def query(self) -> Optional[Path]:
         """
         Query the cache for a matching converted output.
 
+        Without an output of the exact input state, an output of the same input files and extraction settings
+        whose stored features include every requested feature is returned; IGData reads only the requested
+        feature columns from it.
+
         Returns:
             Optional[Path]: Path to converted output, or None if not cached or expired.
         """
@@ -78,7 +118,7 @@ class IGConversionCache:
         entry = cache.get(dir_hash)
 
         if not entry:
-            return None
+            return self._query_compatible(cache)
 
         converted_path = Path(entry["converted_path"])
         timestamp = entry["timestamp"]
@@ -88,23 +128,89 @@ class IGConversionCache:
                 or not converted_path.exists()
                 or (time.time() - timestamp > self._expiration_time)
         ):
-            del cache[dir_hash]
-            self._save_cache(cache)
-            return None
+            with self._lock():
+                cache = self._load_cache()
+                cache.pop(dir_hash, None)
+                self._save_cache(cache)
+            return self._query_compatible(cache)
 
+        Profiler.count("cache.hits")
         return converted_path
 
+    def _query_compatible(self, cache: dict) -> Optional[Path]:
+        """
+        Find the most recent output of the same input files and extraction settings storing every requested
+        feature.
+
+        Args:
+            cache (dict): The loaded cache mapping.
+
+        Returns:
+            Optional[Path]: Path to converted output, or None if there is none.
+        """
+        compiled = self._config.compiled
+        now = time.time()
+        candidates = sorted(
+            (
+                entry for entry in cache.values()
+                if entry.get("extraction") == compiled.extraction_hash
+                and Path(entry["converted_path"]).exists()
+                and now - entry["timestamp"] <= self._expiration_time
+            ),
+            key=lambda entry: entry["timestamp"],
+            reverse=True
+        )
+
+        # the input files are only hashed when an output with the same extraction settings exists
+        if candidates:
+            input_files = self._config.get_input_files_hash()
+            features = compiled.dataset_schema.feature_columns
+            for entry in candidates:
+                if entry.get("input_files") != input_files:
+                    continue
+                converted_path = Path(entry["converted_path"])
+                schema = self._stored_schema(converted_path)
+                if schema is not None and not schema.missing(features):
+                    Console.out(f"Reusing converted data with a superset of the requested features: {converted_path}")
+                    Profiler.count("cache.compatible_hits")
+                    return converted_path
+
+        Profiler.count("cache.misses")
+        return None
+
+    @staticmethod
+    def _stored_schema(converted_path: Path) -> Optional[DatasetSchema]:
+        """
+        Dataset schema stored in the features file of a converted output.
+
+        Args:
+            converted_path (Path): Converted directory.
+
+        Returns:
+            Optional[DatasetSchema]: The stored schema, or None for outputs written without one.
+        """
+        import pyarrow.parquet as pq
+
+        features_file = converted_path / "features.parquet"
+        if not features_file.exists():
+            # partitioned output, every file carries the same schema
+            features_file = next(iter(sorted((converted_path / "features").rglob("*.parquet"))), None)
+            if features_file is None:
+                return None
+        return DatasetSchema.from_metadata(pq.read_schema(features_file).metadata)
+
     def clear_expired(self) -> None:
         """
         Remove any expired entries from the cache based on file existence and timestamp.
         """
-        cache = self._load_cache()
-        now = time.time()
-        new_cache = {
-            k: v for k, v in cache.items()
-            if Path(v["converted_path"]).exists() and (now - v["timestamp"] <= self._expiration_time)
-        }
-        self._save_cache(new_cache)
+        with self._lock():
+            cache = self._load_cache()
+            now = time.time()
+            new_cache = {
+                k: v for k, v in cache.items()
+                if Path(v["converted_path"]).exists() and (now - v["timestamp"] <= self._expiration_time)
+            }
+            self._save_cache(new_cache)
 
     def clear_all(self) -> None:
         """
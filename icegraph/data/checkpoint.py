@@ -0,0 +1,233 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+import json
+import os
+import shutil
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Union
+
+from filelock import FileLock, Timeout
+
+from icegraph.console import Console
+from icegraph.profiling import Profiler
+
+
+__all__ = ["ShardCheckpoint", "atomic_path", "is_temporary"]
+
+# marks the temporary paths written by atomic_path, '.<stem>.tmp-<pid><suffix>'
+TMP_INFIX = ".tmp-"
+
+
+def is_temporary(path: Union[str, Path]) -> bool:
+    """
+    Whether a path is hidden or a temporary path of atomic_path, e.g. one left behind by a killed process.
+    Such paths are never inputs or outputs of a build.
+
+    Args:
+        path (Union[str, Path]): Path to check.
+
+    Returns:
+        bool: True for dot-prefixed and atomic_path temporary files and directories.
+    """
+    name = Path(path).name
+    return name.startswith(".") or TMP_INFIX in name
+
+
+@contextmanager
+def atomic_path(path: Union[str, Path]) -> Iterator[Path]:
+    """
+    Context manager yielding a temporary path next to `path`, which is renamed to `path` once the
+    block completes. If the block raises, the temporary file or directory is removed and `path` is untouched.
+
+    Usage:
+        with atomic_path(output / "data.hdf5") as tmp:
+            write(tmp)
+
+    Args:
+        path (Union[str, Path]): Final file or directory path.
+
+    Yields:
+        Path: Temporary path to write to, in the same directory so the rename is atomic.
+    """
+    path = Path(path)
+    # keep the extension, some writers pick their format from it
+    tmp = path.with_name(f".{path.stem}{TMP_INFIX}{os.getpid()}{path.suffix}")
+    try:
+        yield tmp
+        os.replace(tmp, path)
+    finally:
+        if tmp.is_dir():
+            shutil.rmtree(tmp)
+        elif tmp.exists():
+            tmp.unlink()
+
+
+class ShardCheckpoint:
+    """
+    Tracks the progress of a build made of independent shards (e.g. one per input file), so an interrupted
+    build can be resumed.
+
+    Shards are written into a '<name>.partial' work directory next to the final output directory. A completion
+    marker is written for each shard once all of its output is in place, and the work directory is renamed
+    to the final directory once every shard is done. The final directory therefore only ever exists complete,
+    and a restarted build skips the shards with a marker and redoes the others from scratch.
+
+    Processes building the same output (e.g. jobs started with the same config) are serialized by a file lock,
+    '<name>.lock' next to the final directory, held with ShardCheckpoint.lock for the whole build. A process which
+    waited for the lock finds the output published by the other one, and should reuse it.
+
+    Attributes:
+        final_dir (Path): Directory the complete build is published to.
+        work_dir (Path): Directory the build is written to until it is complete.
+        lock_path (Path): Lock file serializing builds of the output across processes.
+    """
+
+    MARKER_DIR = ".shards"
+
+    def __init__(self, final_dir: Union[str, Path]) -> None:
+        """
+        Initialize the checkpoint of a build.
+
+        Args:
+            final_dir (Union[str, Path]): Directory the complete build is published to.
+        """
+        self.final_dir = Path(final_dir)
+        self.work_dir = self.final_dir.with_name(f"{self.final_dir.name}.partial")
+        self.lock_path = self.final_dir.with_name(f"{self.final_dir.name}.lock")
+
+    @property
+    def complete(self) -> bool:
+        """
+        Whether the build has been published.
+        """
+        return self.final_dir.is_dir()
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """
+        Hold the build lock of the output, waiting for another process building it to finish.
+
+        The lock is reentrant within a process, and released by the operating system if the process dies, so a
+        crashed build never blocks the next one, which resumes from its completed shards.
+
+        Usage:
+            with checkpoint.lock():
+                if not checkpoint.complete:
+                    build(checkpoint)
+        """
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        lock = FileLock(self.lock_path, is_singleton=True)
+        try:
+            lock.acquire(timeout=0)
+        except Timeout:
+            Console.out(f"Waiting for another process building {self.final_dir}", severity=1)
+            with Profiler.stage("checkpoint.wait"):
+                lock.acquire()
+        try:
+            yield
+        finally:
+            lock.release()
+
+    def start(self, resume: bool = True) -> Path:
+        """
+        Prepare the work directory, keeping the progress of an earlier, interrupted build if resuming.
+        Temporary files left behind by the processes of that build are removed. Call with the build lock held.
+
+        Args:
+            resume (bool): Whether to keep completed shards of an earlier build. Otherwise, earlier work and any
+                published output are removed.
+
+        Returns:
+            Path: The work directory.
+        """
+        if not resume:
+            self.reset()
+        elif self.work_dir.is_dir():
+            self._remove_stale()
+            if done := self.done():
+                Console.out(f"Resuming build with {len(done)} completed shards: {self.work_dir}")
+
+        (self.work_dir / self.MARKER_DIR).mkdir(parents=True, exist_ok=True)
+        return self.work_dir
+
+    def _remove_stale(self) -> None:
+        """
+        Remove the temporary files and directories of atomic_path left in the work directory by killed processes.
+        """
+        # deepest first, so a temporary directory is removed after anything inside it
+        for path in sorted(self.work_dir.rglob(f"*{TMP_INFIX}*"), reverse=True):
+            Console.out(f"Removing stale temporary file: {path}", severity=1)
+            if path.is_dir():
+                shutil.rmtree(path)
+            else:
+                path.unlink(missing_ok=True)
+
+    def reset(self) -> None:
+        """
+        Remove all progress and published output of the build.
+        """
+        for directory in (self.work_dir, self.final_dir):
+            if directory.is_dir():
+                shutil.rmtree(directory)
+
+    def _marker(self, shard: str) -> Path:
+        return self.work_dir / self.MARKER_DIR / f"{shard}.json"
+
+    def is_done(self, shard: str) -> bool:
+        """
+        Whether a shard has been completed.
+
+        Args:
+            shard (str): Shard name.
+
+        Returns:
+            bool: True if the shard's completion marker exists.
+        """
+        return self._marker(shard).exists()
+
+    def done(self) -> list[str]:
+        """
+        Names of the completed shards.
+
+        Returns:
+            list[str]: Completed shard names.
+        """
+        markers = self.work_dir / self.MARKER_DIR
+        return sorted(p.stem for p in markers.glob("*.json") if not is_temporary(p)) if markers.is_dir() else []
+
+    def pending(self, shards: Iterable[str]) -> list[str]:
+        """
+        Filter out completed shards.
+
+        Args:
+            shards (Iterable[str]): All shard names of the build.
+
+        Returns:
+            list[str]: Shards without a completion marker, in the order given.
+        """
+        return [shard for shard in shards if not self.is_done(shard)]
+
+    def mark_done(self, shard: str, **info: Any) -> None:
+        """
+        Record a shard as complete. Call only once all of the shard's output has been written.
+
+        Args:
+            shard (str): Shard name.
+            **info (Any): JSON-serializable details stored in the marker (e.g. number of events).
+        """
+        with atomic_path(self._marker(shard)) as tmp:
+            tmp.write_text(json.dumps({"shard": shard, "timestamp": time.time(), **info}, indent=2))
+
+    def publish(self) -> Path:
+        """
+        Atomically rename the work directory to the final directory.
+
+        Returns:
+            Path: The final directory.
+        """
+        os.replace(self.work_dir, self.final_dir)
+        shutil.rmtree(self.final_dir / self.MARKER_DIR, ignore_errors=True)
+        return self.final_dir
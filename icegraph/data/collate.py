@@ -0,0 +1,89 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+from typing import Optional, TYPE_CHECKING
+
+import torch
+
+if TYPE_CHECKING:
+    from icegraph.data.transforms import TransformPipeline
+    from icegraph.geometry import DetectorGrid
+
+
+__all__ = ["collate_events", "collate_grid"]
+
+def collate_events(
+    samples: list[tuple[torch.Tensor, torch.Tensor]],
+    dtype: torch.dtype = torch.float32,
+    transforms: Optional["TransformPipeline"] = None
+) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+    """
+    Collate variable-size events into one batch, with the DOMs of all events stacked along the first dimension.
+
+    Features kept in reduced precision by the dataset (`loading.feature_dtype: float16`) are cast to `dtype`
+    here, in the same copy that concatenates them. Configured transforms (see TransformPipeline) are then applied
+    to the whole batch; IGData.collate passes those of its configuration.
+
+    Usage:
+        DataLoader(dataset, batch_size=32, collate_fn=collate_events)
+
+    Args:
+        samples (list[tuple[torch.Tensor, torch.Tensor]]): (features, labels) samples from IGData.
+        dtype (torch.dtype): Precision of the batched features.
+        transforms (Optional[TransformPipeline]): Transforms applied to the batched features and labels.
+
+    Returns:
+        tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+            - Features of all DOMs, of shape (total_DOMs, num_features)
+            - Index of the event each DOM belongs to, of shape (total_DOMs,)
+            - Labels, of shape (num_events, num_labels)
+    """
+    features = [sample[0] for sample in samples]
+    counts = torch.tensor([len(f) for f in features], dtype=torch.int64)
+
+    # a single copy per event, which also casts reduced precision features
+    batch_features = torch.empty((int(counts.sum()), features[0].shape[1]), dtype=dtype)
+    offset = 0
+    for f in features:
+        batch_features[offset:offset + len(f)].copy_(f)
+        offset += len(f)
+
+    batch = torch.repeat_interleave(torch.arange(len(samples)), counts)
+    labels = torch.stack([sample[1] for sample in samples])
+    if transforms:
+        batch_features, labels = transforms(batch_features, labels)
+    return batch_features, batch, labels
+
+
+def collate_grid(
+    samples: list[tuple[torch.Tensor, torch.Tensor, torch.Tensor]],
+    grid: "DetectorGrid",
+    sparse: bool = False,
+    dtype: torch.dtype = torch.float32,
+    transforms: Optional["TransformPipeline"] = None
+) -> tuple[torch.Tensor, torch.Tensor]:
+    """
+    Collate events into one detector grid tensor: the DOMs of all events are stacked as by collate_events, then
+    scattered into the grid of the batch in a single indexed add (see DetectorGrid).
+
+    Usage:
+        DataLoader(dataset, batch_size=32, collate_fn=dataset.collate)  # with `loading.output: grid`
+
+    Args:
+        samples (list[tuple[torch.Tensor, torch.Tensor, torch.Tensor]]): (features, labels, cells) samples from
+            IGData with a grid output.
+        grid (DetectorGrid): Grid the cells refer to.
+        sparse (bool): Whether to return a sparse COO tensor holding only the hit DOMs.
+        dtype (torch.dtype): Precision of the batched features.
+        transforms (Optional[TransformPipeline]): Transforms applied to the features and labels before scattering.
+
+    Returns:
+        tuple[torch.Tensor, torch.Tensor]:
+            - Features, of shape (num_events, num_strings, num_oms, num_features)
+            - Labels, of shape (num_events, num_labels)
+    """
+    features, batch, labels = collate_events([sample[:2] for sample in samples], dtype, transforms)
+    cells = torch.cat([sample[2] for sample in samples])
+    if sparse:
+        return grid.sparse(features, cells, batch, len(samples)), labels
+    return grid.scatter(features, cells, batch, len(samples)), labels
@@ -0,0 +1,259 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+import os
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional, Sequence, Type, Union
+
+import numpy as np
+import torch
+from torch.utils.data import Dataset, DataLoader, Sampler
+
+from icegraph.config import IGConfig
+from icegraph.console import Console
+from icegraph.profiling import Profiler
+from icegraph.data.base import IGData
+from icegraph.data.cache import IGConversionCache
+
+
+__all__ = ["CompositeDataset", "SourceWeightedSampler"]
+
+class CompositeDataset(Dataset):
+    """
+    A dataset split composed of several separately converted datasets (sources), such as simulation
+    sets of different flavors or energy ranges.
+
+    Each source is opened as its own IGData split; a global event index is built from the cumulative
+    source lengths, so no data is copied or concatenated. Sources are opened concurrently on a thread pool.
+
+    Attributes:
+        subset (str): The split name, taken from `split_cls`.
+        sources (list[IGData]): The per-source split datasets, in the order given.
+        locations (list[Path]): Converted directory of each source.
+        weights (np.ndarray): Sampling weight of each source.
+        offsets (np.ndarray): Global index of the first event of each source, plus the total length.
+    """
+
+    def __init__(
+        self,
+        split_cls: Type[IGData],
+        sources: Sequence[Union[str, Path]],
+        config: IGConfig,
+        weights: Optional[Sequence[float]] = None,
+        num_threads: Optional[int] = None
+    ) -> None:
+        """
+        Initialize a composite dataset split.
+
+        Args:
+            split_cls (Type[IGData]): Split class to open each source with (e.g. TrainingDataset).
+            sources (Sequence[Union[str, Path]]): Converted directories, or input state hashes registered
+                in the conversion cache.
+            config (IGConfig): IceGraph configuration object containing user settings.
+            weights (Optional[Sequence[float]]): Relative sampling weight of each source. Defaults to equal weights.
+            num_threads (Optional[int]): Number of threads used to open sources. Defaults to one per source,
+                up to the number of CPUs.
+
+        Raises:
+            ValueError: If no sources are given, or the number of weights does not match the number of sources.
+            FileNotFoundError: If a source is neither a directory nor a cached conversion.
+        """
+        super(CompositeDataset, self).__init__()
+        if not sources:
+            raise ValueError("CompositeDataset requires at least one source.")
+        if weights is not None and len(weights) != len(sources):
+            raise ValueError(f"Got {len(weights)} weights for {len(sources)} sources.")
+
+        self.subset = split_cls.subset
+        self._config: IGConfig = config
+
+        cache = IGConversionCache(config)
+        self.locations: list[Path] = [self.resolve_source(source, cache) for source in sources]
+        self.weights = np.asarray(weights if weights is not None else [1.0] * len(sources), dtype=np.float64)
+
+        num_threads = num_threads or min(len(self.locations), os.cpu_count() or 1)
+        with Profiler.stage("composite.open"), ThreadPoolExecutor(max_workers=num_threads) as pool:
+            self.sources: list[IGData] = list(pool.map(lambda path: split_cls(path, config), self.locations))
+
+        lengths = [len(source) for source in self.sources]
+        self.offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+
+        Console.out(f"Opened {len(self.sources)} sources for {self.subset=} with {len(self)} events")
+
+    @staticmethod
+    def resolve_source(source: Union[str, Path], cache: IGConversionCache) -> Path:
+        """
+        Resolve a source to its converted directory.
+
+        Args:
+            source (Union[str, Path]): Converted directory, or input state hash registered in the conversion cache.
+            cache (IGConversionCache): The conversion cache to look hashes up in.
+
+        Returns:
+            Path: Converted directory of the source.
+
+        Raises:
+            FileNotFoundError: If the source is neither a directory nor a cached conversion.
+        """
+        path = Path(source)
+        if path.is_dir():
+            return path
+        if cached := cache.lookup(str(source)):
+            return cached
+        raise FileNotFoundError(f"Source is neither a converted directory nor a cached conversion: {source}")
+
+    def __len__(self) -> int:
+        """
+        Return the number of events over all sources.
+
+        Returns:
+            int: Number of events.
+        """
+        return int(self.offsets[-1])
+
+    def locate(self, idx: int) -> tuple[int, int]:
+        """
+        Map a global index to a source and an index within that source.
+
+        Args:
+            idx (int): Global index of the event.
+
+        Returns:
+            tuple[int, int]: Source index and local index.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError(f"Index {idx} out of range for CompositeDataset of length {len(self)}")
+
+        source = int(np.searchsorted(self.offsets, idx, side="right")) - 1
+        return source, idx - int(self.offsets[source])
+
+    def __getitem__(self, idx: int) -> tuple[torch.Tensor, torch.Tensor]:
+        """
+        Retrieve a single sample by global index.
+
+        Args:
+            idx (int): Global index of the event.
+
+        Returns:
+            tuple[torch.Tensor, torch.Tensor]: Tuple of (features, labels) for the selected event.
+        """
+        source, local_idx = self.locate(idx)
+        return self.sources[source][local_idx]
+
+    def get_with_dom_id(self, idx: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Retrieve a sample by global index, along with DOM IDs. See IGData.get_with_dom_id.
+        """
+        source, local_idx = self.locate(idx)
+        return self.sources[source].get_with_dom_id(local_idx)
+
+    @property
+    def dom_counts(self) -> np.ndarray:
+        """
+        Number of hit DOMs of each event, in global index order. See IGData.dom_counts.
+
+        Returns:
+            np.ndarray: Integer array of shape (len(self),).
+        """
+        return np.concatenate([source.dom_counts for source in self.sources])
+
+    def collate(self, samples: list[tuple[torch.Tensor, ...]]) -> tuple[torch.Tensor, ...]:
+        """
+        Collate samples into one batch and apply the configured transforms to it. See IGData.collate; sources share
+        the configuration, so every source collates the same way.
+        """
+        return self.sources[0].collate(samples)
+
+    def sampler(self, num_samples: Optional[int] = None, seed: int = 0) -> "SourceWeightedSampler":
+        """
+        Returns a sampler drawing events according to the per-source weights.
+
+        Args:
+            num_samples (Optional[int]): Number of samples per epoch. Defaults to the dataset length.
+            seed (int): Base random seed.
+
+        Returns:
+            SourceWeightedSampler: Sampler over global indices.
+        """
+        return SourceWeightedSampler(self, num_samples=num_samples, seed=seed)
+
+    def dataloader(self, weighted: Optional[bool] = None, **kwargs) -> DataLoader:
+        """
+        Returns a PyTorch DataLoader for this dataset. Training events are sampled by source weight, with
+        replacement; validation and test events are read once each, in order. Batches are collated, and
+        transformed, by CompositeDataset.collate unless another `collate_fn` is given. Pass `num_workers="auto"`
+        to use as many worker processes as fit on the node, see ResourceGovernor.dataloader_workers.
+
+        Args:
+            weighted (Optional[bool]): Whether to sample according to the per-source weights. Defaults to
+                weighted sampling for the training split only.
+            **kwargs: Arguments to pass to torch.utils.data.DataLoader.
+
+        Returns:
+            DataLoader: PyTorch DataLoader instance.
+        """
+        if weighted is None:
+            weighted = self.subset == "train"
+        if weighted and "sampler" not in kwargs and "batch_sampler" not in kwargs:
+            kwargs["sampler"] = self.sampler()
+        kwargs.setdefault("collate_fn", self.collate)
+        if kwargs.get("num_workers") == "auto":
+            from icegraph.resources import ResourceGovernor
+
+            kwargs["num_workers"] = ResourceGovernor(self._config).dataloader_workers()
+        return DataLoader(self, **kwargs)
+
+
+class SourceWeightedSampler(Sampler[int]):
+    """
+    Samples global indices of a CompositeDataset so that each source is drawn in proportion to its weight,
+    independently of how many events it contains.
+
+    Sampling is two-stage (source by weight, then a uniform event within the source), so memory use only
+    depends on the number of sources. The draw is deterministic given the seed and the epoch.
+    """
+
+    def __init__(self, data: CompositeDataset, num_samples: Optional[int] = None, seed: int = 0) -> None:
+        """
+        Initialize the sampler.
+
+        Args:
+            data (CompositeDataset): The composite dataset to sample from.
+            num_samples (Optional[int]): Number of samples per epoch. Defaults to the dataset length.
+            seed (int): Base random seed.
+        """
+        lengths = np.diff(data.offsets)
+        weights = np.where(lengths > 0, data.weights, 0.0)
+        if not weights.sum():
+            raise ValueError("CompositeDataset has no events to sample.")
+
+        self.offsets = data.offsets[:-1]
+        self.lengths = lengths
+        self.probabilities = weights / weights.sum()
+        self.num_samples = num_samples or len(data)
+        self.seed = seed
+        self.epoch = 0
+
+    def set_epoch(self, epoch: int) -> None:
+        """
+        Set the epoch, so each epoch draws a different but reproducible sample.
+
+        Args:
+            epoch (int): Epoch number.
+        """
+        self.epoch = epoch
+
+    def __len__(self) -> int:
+        return self.num_samples
+
+    def __iter__(self) -> Iterator[int]:
+        rng = np.random.default_rng((self.seed, self.epoch))
+        sources = rng.choice(len(self.probabilities), self.num_samples, p=self.probabilities)
+        local = (rng.random(self.num_samples) * self.lengths[sources]).astype(np.int64)
+        return iter((self.offsets[sources] + local).tolist())
@@ -1,7 +1,15 @@
 # Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
 # Developed by Taylor St Jean
 
-from .models import HDF5ToParquet
-from.schemas import generate_vector_mapping
+from typing import TYPE_CHECKING
 
-__all__ = ["HDF5ToParquet", "generate_vector_mapping"]
+from icegraph.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={"HDF5ToParquet": ".models", "generate_vector_mapping": ".schemas"}
+)
+
+if TYPE_CHECKING:
+    from .models import HDF5ToParquet
+    from .schemas import generate_vector_mapping
@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Union, Optional
 
 from icegraph.config import IGConfig
+from icegraph.data.checkpoint import ShardCheckpoint
 
 
 __all__ = ["IGConverter"]
@@ -45,14 +46,17 @@ class IGConverter(ABC):
         output_root = Path(output_dir or base_dir / self.out_extension)
         self.outdir = output_root / input_hash
 
-        # Create output directory if it doesn't exist
-        self.outdir.mkdir(parents=True, exist_ok=True)
+        # Output is written next to the output directory and only renamed to it once complete
+        self.checkpoint = ShardCheckpoint(self.outdir)
 
     @abstractmethod
-    def convert(self) -> Path:
+    def convert(self, resume: bool = True) -> Path:
         """
         Run the conversion process defined by the subclass.
 
+        Args:
+            resume (bool): Whether to reuse the completed work of an earlier run.
+
         Returns:
             Path: Path to the converted output file or directory.
 
@@ -1,15 +1,26 @@
 # Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
 # Developed by Taylor St Jean
 
+import numpy as np
 import pandas as pd
-from typing import cast
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from typing import Callable, Iterator, Optional, cast, TYPE_CHECKING
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
 
 from icegraph.console import Console
 from icegraph.console.streams import suppress_stderr
-from .schemas import generate_vector_mapping
+from icegraph.profiling import Profiler
+from icegraph.resources import ResourceGovernor
+from icegraph.data.checkpoint import atomic_path, is_temporary
+from icegraph.data.transforms import TransformPipeline
 from .base import IGConverter
 
+if TYPE_CHECKING:
+    from distributed import Client
+
 
 __all__ = ["HDF5ToParquet"]
 
@@ -18,53 +29,458 @@ class HDF5ToParquet(IGConverter):
     Converts an HDF5 file generated via `ml_suite` into Parquet format.
 
     The input file is assumed to contain 'features' and 'truth' tables, which are
-    saved as separate Parquet files in the output directory.
+    saved as separate Parquet files in the output directory. With the "partitioned"
+    storage layout, each table is instead written as a Hive-partitioned directory
+    (e.g. 'features/Run=123/<input name>-0.parquet'), partitioned by the configured
+    event ID columns. Files are named after the input file they were converted from. Each
+    conversion writes a new output directory; existing outputs are never appended to.
+
+    Column codecs and feature precision follow the configured storage profile, which is recorded
+    in the schema metadata of every written file under `StorageProfile.METADATA_KEY`, next to the
+    DatasetSchema describing the stored features under `DatasetSchema.METADATA_KEY`. With
+    `transforms.at_conversion`, the configured transforms are applied to the features and labels before
+    they are written (see TransformPipeline).
+
+    With the Dask backend enabled (`dask.enabled`), the input is split into chunks of whole events
+    which are converted in parallel by the Dask workers. Each chunk is written as its own file, so
+    the output consists of 'features/' and 'truth/' directories for either layout.
+
+    Without Dask, an input file whose reshape would not fit in the memory left on the node (see ResourceGovernor)
+    is converted one chunk of whole events at a time. Chunking never changes the output layout: with the file
+    layout, the chunks of a single input are written one after the other into the same 'features.parquet'.
+
+    The input may also be a directory of HDF5 files (e.g. the shards written by FeatureExtractor), which
+    are converted one at a time into the same output directory, each file into the '<name>/' directories.
+    Conversions are checkpointed per input file and published atomically, see HDF5ToParquet.convert.
     """
 
     out_extension = "parquet"
 
-    def convert(self) -> Path:
+    @property
+    def shards(self) -> list[Path]:
+        """
+        HDF5 files to convert: the input file, or every '.hdf5' file of an input directory (e.g. one per extracted input file).
+        """
+        if self.input_file.is_dir():
+            # leaves out the temporary files of an interrupted extraction
+            return sorted(path for path in self.input_file.glob("*.hdf5") if not is_temporary(path))
+        return [self.input_file]
+
+    def convert(self, resume: bool = True) -> Path:
+        """
+        Converts the HDF5 input file(s) to Parquet format.
+
+        Each input file is a shard of the build: output is written to '<output dir>.partial', a completion marker is
+        recorded once a shard is fully written, and the directory is renamed to the output directory once every shard
+        is done. A conversion interrupted part way is resumed from the first incomplete shard. Processes converting
+        to the same output directory run one at a time, and the others reuse the published output.
+
+        Args:
+            resume (bool): Whether to reuse completed shards, or a completed conversion, of an earlier run.
+
+        Returns:
+            Path: Path to the output directory containing converted Parquet files.
+        """
+        if self._config.compiled.dask.enabled:
+            return self.convert_distributed(resume=resume)
+
+        if resume and self.checkpoint.complete:
+            Console.out(f"Found completed conversion: {self.outdir}")
+            return self.outdir
+
+        return self._convert_shards(self._convert_file, resume)
+
+    def convert_distributed(self, client: Optional["Client"] = None, resume: bool = True) -> Path:
+        """
+        Converts the HDF5 input file(s) to Parquet format on a Dask cluster.
+
+        The features table of each input file is split into chunks of about `dask.chunk_rows` rows, or as many as
+        the memory of a worker thread allows, cut only where the event changes, so every event is reshaped by a single task. Rows of an event are assumed to be contiguous,
+        as written by `hdfwriter`. Input files are checkpointed as in HDF5ToParquet.convert.
+
+        Args:
+            client (Optional[Client]): Dask client to use. Defaults to the cluster configured in `dask`.
+            resume (bool): Whether to reuse completed shards, or a completed conversion, of an earlier run.
+
+        Returns:
+            Path: Path to the output directory containing converted Parquet files.
+        """
+        from icegraph.cluster import DaskCluster
+
+        if resume and self.checkpoint.complete:
+            Console.out(f"Found completed conversion: {self.outdir}")
+            return self.outdir
+
+        # taken before starting the cluster, so it is not held idle while another process converts
+        with self.checkpoint.lock():
+            if resume and self.checkpoint.complete:
+                Console.out(f"Found completed conversion: {self.outdir}")
+                return self.outdir
+
+            with DaskCluster(self._config, client) as dask_client:
+                return self._convert_shards(lambda shard: self._convert_file_distributed(shard, dask_client), resume)
+
+    def _convert_shards(self, convert_file: Callable[[Path], int], resume: bool) -> Path:
         """
-        Converts an HDF5 input file to Parquet format.
+        Converts every shard without a completion marker, then publishes the output directory. Holds the build lock
+        of the output throughout, so a conversion published by another process meanwhile is reused.
+
+        Args:
+            convert_file (Callable[[Path], int]): Converts one input file, returning the number of bytes written.
+            resume (bool): Whether to reuse completed shards of an earlier run.
 
         Returns:
             Path: Path to the output directory containing converted Parquet files.
         """
-        Console.out(f"Converting to {self.out_extension}: {self.input_file}")
-        Console.spinner().start()
+        with self.checkpoint.lock():
+            # published by another process while this one waited for the lock
+            if resume and self.checkpoint.complete:
+                Console.out(f"Found completed conversion: {self.outdir}")
+                return self.outdir
+
+            self.checkpoint.start(resume)
+
+            for shard in self.shards:
+                name = self._basename(shard)
+                if self.checkpoint.is_done(name):
+                    Console.out(f"Skipping converted shard: {shard.name}", severity=1)
+                    continue
+
+                nbytes = convert_file(shard)
+                self.checkpoint.mark_done(name, input=str(shard), bytes=nbytes)
+
+            self.checkpoint.publish()
+            Console.out(f"Output files saved to {self.outdir}")
+
+        return self.outdir
+
+    @property
+    def _part(self) -> Optional[int]:
+        """
+        Chunk number of single-process conversions: with several shards, each one is written into
+        the '<name>/' directories rather than to a single file per table.
+        """
+        return None if len(self.shards) == 1 else 0
+
+    def _convert_file(self, shard: Path) -> int:
+        """
+        Converts one HDF5 file in this process.
+
+        Args:
+            shard (Path): HDF5 file to convert.
+
+        Returns:
+            int: Number of bytes written.
+        """
+        nrows, row_bytes = self._table_size(shard)
+        chunk_rows = ResourceGovernor(self._config).chunk_rows(row_bytes)
+        if nrows > chunk_rows:
+            return self._convert_file_chunked(shard, chunk_rows)
+
+        Console.out(f"Converting to {self.out_extension}: {shard}")
+        with Console.progress(f"Converting {shard.name}", unit="rows") as progress:
+            # Load data to DataFrames
+            # IDE might complain these aren't DataFrames; they are.
+            # Suppressing very loud HDF5 mismatched header warning
+            with Profiler.stage("converter.read_hdf5"), suppress_stderr():
+                features_table = cast(pd.DataFrame, pd.read_hdf(
+                    shard,
+                    key=self._config.compiled.table_names.features
+                ))
+                truth_table = cast(pd.DataFrame, pd.read_hdf(
+                    shard,
+                    key=self._config.compiled.table_names.truth
+                ))
+
+            progress.update(len(features_table) + len(truth_table), nbytes=shard.stat().st_size)
+
+            if Profiler.enabled:
+                Profiler.count("converter.read_hdf5.rows", len(features_table) + len(truth_table))
+                Profiler.count("converter.read_hdf5.bytes", shard.stat().st_size)
+
+            # Run reshaping
+            with Profiler.stage("converter.reshape"):
+                features_table = self._reshape("features", features_table)
+                truth_table = self._reshape("truth", truth_table)
+
+            # Export to Parquet
+            basename = self._basename(shard)
+            with Profiler.stage("converter.write_parquet"):
+                nbytes = self._to_parquet(features_table.reset_index(), "features", basename, self._part)
+                nbytes += self._to_parquet(truth_table.reset_index(), "truth", basename, self._part)
+
+        return nbytes
+
+    def _convert_file_chunked(self, shard: Path, chunk_rows: int) -> int:
+        """
+        Converts one HDF5 file in this process, one chunk of whole events at a time.
+
+        Args:
+            shard (Path): HDF5 file to convert.
+            chunk_rows (int): Target number of rows per chunk.
+
+        Returns:
+            int: Number of bytes written.
+        """
+        with Profiler.stage("converter.plan_chunks"):
+            chunks = self._plan_chunks(shard, chunk_rows)
+
+        Console.out(f"Converting to {self.out_extension} in {len(chunks)} chunks: {shard}")
+        self._remove_stale_chunks(shard)
+
+        # a single-file output stays a single file, its chunks written one after the other into it
+        single_file = self._part is None and self._config.compiled.storage.layout == "file"
+
+        total_bytes = 0
+        with Console.progress(f"Converting {shard.name}", total=len(chunks) + 1, unit="chunks") as progress:
+            with self._single_file_writer("features") if single_file else nullcontext() as write:
+                for part, (start, stop) in enumerate(chunks):
+                    with Profiler.stage("converter.convert_chunk"):
+                        if write is None:
+                            rows, nbytes = self._convert_chunk(shard, "features", start, stop, part)
+                        else:
+                            table = self._read_chunk(shard, "features", start, stop)
+                            rows, nbytes = len(table), write(table)
+                    total_bytes += nbytes
+                    progress.update(1, nbytes=nbytes)
+                    if Profiler.enabled:
+                        Profiler.count("converter.write_parquet.rows", rows)
+
+            if single_file:
+                # written sizes are only known once the file is closed
+                total_bytes = (self.checkpoint.work_dir / f"features.{self.out_extension}").stat().st_size
+
+            with Profiler.stage("converter.convert_chunk"):
+                rows, nbytes = self._convert_chunk(shard, "truth", 0, None, None if single_file else 0)
+            total_bytes += nbytes
+            progress.update(1, nbytes=nbytes)
+            if Profiler.enabled:
+                Profiler.count("converter.write_parquet.rows", rows)
+
+        if Profiler.enabled:
+            Profiler.count("converter.write_parquet.bytes", total_bytes)
+        return total_bytes
+
+    @contextmanager
+    def _single_file_writer(self, name: str) -> Iterator[Callable[[pd.DataFrame], int]]:
+        """
+        Writes the chunks of a table one after the other into its single '<name>.parquet' file, which is only
+        put in place once every chunk has been written.
+
+        Args:
+            name (str): Table to write ('features' or 'truth').
+
+        Yields:
+            Callable[[pd.DataFrame], int]: Writes one reshaped chunk, returning its size in memory.
+        """
+        writer: Optional[pq.ParquetWriter] = None
+
+        with atomic_path(self.checkpoint.work_dir / f"{name}.{self.out_extension}") as tmp:
+            def write(table: pd.DataFrame) -> int:
+                nonlocal writer
+                arrow_table = self._to_arrow(table)
+                if writer is None:
+                    writer = pq.ParquetWriter(tmp, arrow_table.schema, **self._parquet_options(arrow_table))
+                writer.write_table(arrow_table.cast(writer.schema))
+                return arrow_table.nbytes
+
+            try:
+                yield write
+            finally:
+                if writer is not None:
+                    writer.close()
+
+    def _table_size(self, shard: Path) -> tuple[int, int]:
+        """
+        Number of rows of the features table of an HDF5 file, and the size of one row in memory.
+
+        Args:
+            shard (Path): HDF5 file.
+
+        Returns:
+            tuple[int, int]: Number of rows and bytes per row.
+        """
+        with suppress_stderr(), pd.HDFStore(shard, mode="r") as store:
+            storer = store.get_storer(self._config.compiled.table_names.features)
+            nrows = int(storer.nrows or 0)
+            table = getattr(storer, "table", None)
+            row_bytes = table.rowsize if table is not None else shard.stat().st_size // max(1, nrows)
+        return nrows, int(row_bytes)
+
+    def _remove_stale_chunks(self, shard: Path) -> None:
+        """
+        Removes chunks of the given input file left by an earlier attempt.
+        """
+        basename = self._basename(shard)
+        for name in ("features", "truth"):
+            for stale in (self.checkpoint.work_dir / name).rglob(f"{basename}-*.{self.out_extension}"):
+                stale.unlink()
+
+    def _convert_file_distributed(self, shard: Path, dask_client: "Client") -> int:
+        """
+        Converts one HDF5 file on a Dask cluster. Outputs of earlier attempts at the same file are replaced.
+
+        Args:
+            shard (Path): HDF5 file to convert.
+            dask_client (Client): Dask client to submit the chunks to.
+
+        Returns:
+            int: Number of bytes written.
+        """
+        from distributed import as_completed
 
-        # Load data to DataFrames
-        # IDE might complain these aren't DataFrames; they are.
-        # Suppressing very loud HDF5 mismatched header warning
+        Console.out(f"Converting to {self.out_extension} with Dask: {shard}")
+
+        with Profiler.stage("converter.plan_chunks"):
+            chunks = self._plan_chunks(shard, self._worker_chunk_rows(shard, dask_client))
+
+        self._remove_stale_chunks(shard)
+
+        futures = [
+            dask_client.submit(self._convert_chunk, shard, "features", start, stop, part, pure=False)
+            for part, (start, stop) in enumerate(chunks)
+        ]
+        futures.append(dask_client.submit(self._convert_chunk, shard, "truth", 0, None, 0, pure=False))
+
+        total_bytes = 0
+        with Console.progress(f"Converting {shard.name}", total=len(futures), unit="chunks") as progress:
+            for future in as_completed(futures):
+                rows, nbytes = future.result()
+                total_bytes += nbytes
+                progress.update(1, nbytes=nbytes)
+
+                if Profiler.enabled:
+                    Profiler.count("converter.write_parquet.rows", rows)
+                    Profiler.count("converter.write_parquet.bytes", nbytes)
+
+        return total_bytes
+
+    def _worker_chunk_rows(self, shard: Path, dask_client: "Client") -> int:
+        """
+        Rows per conversion task: `dask.chunk_rows`, or as many as fit in the memory of a worker thread.
+
+        Args:
+            shard (Path): HDF5 file to convert.
+            dask_client (Client): Dask client the chunks are submitted to.
+
+        Returns:
+            int: Target number of rows per chunk.
+        """
+        if chunk_rows := self._config.compiled.dask.chunk_rows:
+            return chunk_rows
+
+        governor = ResourceGovernor(self._config)
+        workers = list(dask_client.scheduler_info()["workers"].values())
+        # workers without a memory limit share the memory available on this node
+        shared = governor.worker_memory(len(workers))
+        memory = min(
+            ((worker.get("memory_limit") or shared) // max(1, worker.get("nthreads", 1)) for worker in workers),
+            default=None
+        )
+        return governor.chunk_rows(self._table_size(shard)[1], memory)
+
+    def _plan_chunks(self, shard: Path, chunk_rows: int) -> list[tuple[int, int]]:
+        """
+        Splits the rows of the features table into chunks of whole events.
+
+        Only the event ID columns are read.
+
+        Args:
+            shard (Path): HDF5 file to split.
+            chunk_rows (int): Target number of rows per chunk.
+
+        Returns:
+            list[tuple[int, int]]: (start, stop) row ranges of each chunk.
+        """
         with suppress_stderr():
-            features_table = cast(pd.DataFrame, pd.read_hdf(
-                self.input_file,
-                key=self._config.user_config.table_names.features
-            ))
-            truth_table = cast(pd.DataFrame, pd.read_hdf(
-                self.input_file,
-                key=self._config.user_config.table_names.truth
+            ids = cast(pd.DataFrame, pd.read_hdf(
+                shard,
+                key=self._config.compiled.table_names.features,
+                columns=list(self._config.compiled.event_id_columns)
+            )).to_numpy()
+
+        # rows at which a new event starts
+        boundaries = np.flatnonzero((ids[1:] != ids[:-1]).any(axis=1)) + 1
+        targets = np.arange(chunk_rows, len(ids), chunk_rows)
+
+        cuts = []
+        if len(boundaries):
+            cuts = np.unique(boundaries[np.minimum(np.searchsorted(boundaries, targets), len(boundaries) - 1)]).tolist()
+
+        edges = [0] + cuts + [len(ids)]
+        return [(start, stop) for start, stop in zip(edges[:-1], edges[1:]) if stop > start]
+
+    def _convert_chunk(self, shard: Path, name: str, start: int, stop: Optional[int], part: Optional[int]) -> tuple[int, int]:
+        """
+        Reads, reshapes and writes one chunk of a table. Runs on a Dask worker, or in this process for chunked conversions.
+
+        Args:
+            shard (Path): HDF5 file the chunk belongs to.
+            name (str): Table to convert ('features' or 'truth').
+            start (int): First row of the chunk.
+            stop (Optional[int]): Row after the last row of the chunk, or None for the end of the table.
+            part (Optional[int]): Chunk number, used in the output file names, or None for a single-file output.
+
+        Returns:
+            tuple[int, int]: Number of rows and bytes written.
+        """
+        table = self._read_chunk(shard, name, start, stop)
+        return len(table), self._to_parquet(table, name, self._basename(shard), part)
+
+    def _read_chunk(self, shard: Path, name: str, start: int, stop: Optional[int]) -> pd.DataFrame:
+        """
+        Reads and reshapes one chunk of a table.
+
+        Args:
+            shard (Path): HDF5 file the chunk belongs to.
+            name (str): Table to read ('features' or 'truth').
+            start (int): First row of the chunk.
+            stop (Optional[int]): Row after the last row of the chunk, or None for the end of the table.
+
+        Returns:
+            pd.DataFrame: The reshaped chunk.
+        """
+        with suppress_stderr():
+            table = cast(pd.DataFrame, pd.read_hdf(
+                shard,
+                key=getattr(self._config.compiled.table_names, name),
+                start=start,
+                stop=stop
             ))
 
-        # Run reshaping
-        features_table = self._reshape_features_table(features_table)
-        truth_table = self._reshape_truth_table(truth_table)
+        return self._reshape(name, table).reset_index()
 
-        # Apply feature vector mapping
-        vector_map = generate_vector_mapping(self._config)
-        self._apply_column_map(features_table, vector_map)
+    def _reshape(self, name: str, table: pd.DataFrame) -> pd.DataFrame:
+        """
+        Reshapes a features or truth table into the event-keyed layout.
+
+        Args:
+            name (str): Table being reshaped ('features' or 'truth').
+            table (pd.DataFrame): Input table.
 
-        features_table.sort_values("event_id")
-        truth_table.sort_values("event_id")
+        Returns:
+            pd.DataFrame: Reshaped table.
+        """
+        if name == "features":
+            table = self._reshape_features_table(table)
 
-        # Export to Parquet
-        self._to_parquet(features_table.reset_index(), "features")
-        self._to_parquet(truth_table.reset_index(), "truth")
+            # Apply feature vector mapping
+            self._apply_column_map(table, self._config.compiled.vector_mapping)
+            TransformPipeline.from_config(self._config, at_conversion=True).transform_frame(table, "features")
+        else:
+            table = self._reshape_truth_table(table)
+            TransformPipeline.from_config(self._config, at_conversion=True).transform_frame(table, "labels")
 
-        Console.spinner().stop()
-        Console.out(f"Output files saved to {self.outdir}")
+        table.sort_values("event_id")
+        return table
 
-        return self.outdir
+    @staticmethod
+    def _basename(shard: Path) -> str:
+        """
+        Input file name without its '.hdf5' extension, used to name output files and shards. Other dots are kept,
+        so the shards of inputs such as 'Level2_IC86.2016_..._00000001' keep distinct names.
+        """
+        return shard.stem
 
     def _reshape_features_table(self, table: pd.DataFrame) -> pd.DataFrame:
         """
@@ -77,8 +493,8 @@ class HDF5ToParquet(IGConverter):
         Returns:
             pd.DataFrame: Reshaped features table.
         """
-        event_id_columns = self._config.standard_id_col_config.event_id_columns
-        dom_id_columns = self._config.standard_id_col_config.dom_id_columns
+        event_id_columns = list(self._config.compiled.event_id_columns)
+        dom_id_columns = list(self._config.compiled.dom_id_columns)
 
         table = self._replace_with_composite_keys(table, event_id_columns, "event_id")
         table = self._replace_with_composite_keys(table, dom_id_columns, "dom_id")
@@ -101,7 +517,7 @@ class HDF5ToParquet(IGConverter):
         Returns:
             pd.DataFrame: Reshaped truth table.
         """
-        event_id_columns = self._config.standard_id_col_config.event_id_columns
+        event_id_columns = list(self._config.compiled.event_id_columns)
         table = self._replace_with_composite_keys(table, event_id_columns, "event_id")
 
         # Move ids to first columns for readability
@@ -128,16 +544,110 @@ class HDF5ToParquet(IGConverter):
         table.drop(columns=id_columns, inplace=True)
         return table
 
-    def _to_parquet(self, table: pd.DataFrame, name: str) -> None:
+    def _to_parquet(self, table: pd.DataFrame, name: str, basename: str, part: Optional[int] = None) -> int:
         """
-        Writes the given DataFrame to a Parquet file in the output directory.
+        Writes the given DataFrame to a Parquet file, or a partitioned Parquet directory, in the work directory.
 
         Args:
             table (pd.DataFrame): Data to write.
             name (str): Output file name (e.g., 'features', 'truth').
+            basename (str): Name of the input file, used in the names of files written into '<name>/' directories.
+            part (Optional[int]): Chunk number when writing one of several chunks into a '<name>/' directory.
+
+        Returns:
+            int: Number of bytes written.
+        """
+        if self._config.compiled.storage.layout == "partitioned":
+            nbytes = self._to_partitioned_parquet(table, self.checkpoint.work_dir / name, basename, part)
+        else:
+            if part is None:
+                output_path = self.checkpoint.work_dir / f"{name}.{self.out_extension}"
+            else:
+                output_path = self.checkpoint.work_dir / name / f"{basename}-{part:05d}.{self.out_extension}"
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+
+            arrow_table = self._to_arrow(table)
+            with atomic_path(output_path) as tmp:
+                pq.write_table(arrow_table, tmp, **self._parquet_options(arrow_table))
+            nbytes = output_path.stat().st_size
+
+        if Profiler.enabled and part is None:
+            Profiler.count("converter.write_parquet.rows", len(table))
+            Profiler.count("converter.write_parquet.bytes", nbytes)
+
+        return nbytes
+
+    def _to_partitioned_parquet(self, table: pd.DataFrame, output_path: Path, basename: str, part: Optional[int] = None) -> int:
         """
-        output_path = self.outdir / f"{name}.{self.out_extension}"
-        table.to_parquet(output_path)
+        Writes the given DataFrame as a Hive-partitioned Parquet dataset.
+
+        Partition values are parsed back out of the composite 'event_id' key, so the partition
+        columns are only stored in the directory names.
+
+        Args:
+            table (pd.DataFrame): Data to write, with an 'event_id' column.
+            output_path (Path): Root directory of the partitioned dataset.
+            basename (str): Name of the input file, used in the file names.
+            part (Optional[int]): Chunk number, included in the file names when given.
+
+        Returns:
+            int: Number of bytes written.
+        """
+        partition_by = list(self._config.compiled.storage.partition_by)
+
+        for col in partition_by:
+            table[col] = table["event_id"].str.extract(rf"(?:^|\|){col}=(-?\d+)", expand=False).astype("int64")
+
+        basename = basename if part is None else f"{basename}-{part:05d}"
+        written: list[int] = []
+
+        arrow_table = self._to_arrow(table)
+        ds.write_dataset(
+            arrow_table,
+            output_path,
+            format="parquet",
+            file_options=ds.ParquetFileFormat().make_write_options(**self._parquet_options(arrow_table)),
+            partitioning=partition_by,
+            partitioning_flavor="hive",
+            basename_template=f"{basename}-{{i}}.{self.out_extension}",
+            existing_data_behavior="overwrite_or_ignore",
+            file_visitor=lambda written_file: written.append(written_file.size)
+        )
+        return sum(written)
+
+    def _to_arrow(self, table: pd.DataFrame) -> pa.Table:
+        """
+        Converts a DataFrame to an Arrow table, casting feature columns to the storage profile's precision
+        and recording the profile and dataset schema in the schema metadata.
+
+        Args:
+            table (pd.DataFrame): Data to convert.
+
+        Returns:
+            pa.Table: Arrow table ready to be written.
+        """
+        profile = self._config.compiled.storage.profile
+        arrow_table = pa.Table.from_pandas(table, preserve_index=False)
+
+        feature_columns = set(self._config.compiled.feature_columns)
+        feature_type = pa.from_numpy_dtype(profile.feature_dtype)
+        schema = pa.schema([
+            field.with_type(feature_type) if field.name in feature_columns else field for field in arrow_table.schema
+        ])
+        schema = schema.with_metadata({
+            **(arrow_table.schema.metadata or {}),
+            **profile.metadata(),
+            **self._config.compiled.dataset_schema.metadata()
+        })
+        return arrow_table.cast(schema)
+
+    def _parquet_options(self, table: pa.Table) -> dict:
+        """
+        Returns the Parquet writer options of the storage profile for the given table.
+        """
+        return self._config.compiled.storage.profile.parquet_options(
+            table.column_names, list(self._config.compiled.feature_columns)
+        )
 
     @staticmethod
     def _apply_column_map(table: pd.DataFrame, mapping: dict) -> None:
@@ -7,28 +7,18 @@ from icegraph.config import IGConfig
 __all__ = ["generate_vector_mapping"]
 
 def generate_vector_mapping(config: IGConfig, invert: bool=False) -> dict[int, str] | dict[str, int]:
-    requested_features = config.user_config.feature_extraction.feature_config.features
-    feature_defs = config.feature_map_config.features.toDict()
+    """
+    Map each index of the ml_suite feature vector to a feature column name.
 
-    mapping = {}
-    idx = 0
+    The mapping is computed once and cached on the compiled config; this returns a copy.
 
-    for entry in requested_features:
-        base_names = feature_defs[entry["class"]]
-        kwargs = entry.get("kwargs")
+    Args:
+        config (IGConfig): IceGraph configuration object containing user settings.
+        invert (bool): Whether to return the mapping from column name to vector index instead.
 
-        if not kwargs:
-            for name in base_names:
-                mapping[idx] = name
-                idx += 1
-        else:
-            items = next(iter(kwargs.values()))
-            for item in items:
-                for name in base_names:
-                    mapping[idx] = f"{name}_{item}"
-                    idx += 1
-
-    # values are unique, so inversion shouldn't be a problem
+    Returns:
+        dict[int, str] | dict[str, int]: The (inverted) vector mapping.
+    """
     if invert:
-        return {v: k for k, v in mapping.items()}
-    return mapping
+        return dict(config.compiled.inverse_vector_mapping)
+    return dict(config.compiled.vector_mapping)
@@ -1,6 +1,25 @@
 # Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
 # Developed by Taylor St Jean
 
-from .models import FeatureExtractor
+from typing import TYPE_CHECKING
 
-__all__ = ["FeatureExtractor"]
+from icegraph.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "FeatureExtractor": ".models",
+        "ExtractedEvent": ".objects",
+        "FrameSource": ".sources",
+        "I3TraySource": ".sources",
+        "ArrowEventWriter": ".writers",
+        "EventPreselection": ".preselection",
+    }
+)
+
+if TYPE_CHECKING:
+    from .models import FeatureExtractor
+    from .objects import ExtractedEvent
+    from .sources import FrameSource, I3TraySource
+    from .writers import ArrowEventWriter
+    from .preselection import EventPreselection
@@ -1,30 +1,27 @@
 # Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
 # Developed by Taylor St Jean
 
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from pathlib import Path
+from typing import Callable, Optional
 
 from icegraph.console import Console
+from icegraph.console.objects import Progress, ProgressHandle
+from icegraph.profiling import Profiler
+from icegraph.resources import ResourceGovernor
+from icegraph.data.checkpoint import ShardCheckpoint, atomic_path
 from .base import IGExtractor
+from .sources import FrameSource, I3TraySource
+from .writers import ArrowEventWriter
 
 # have to wrap in try/except block so sphinx can properly generate docs
 try:
-    from icecube.icetray import I3Tray
-    from icecube import dataclasses, icetray, dataio, hdfwriter, ml_suite
-    from icecube.sim_services.label_events import (
-        MCLabeler,
-        ClassificationConverter,
-        MuonLabels
-    )
+    from icecube import icetray, hdfwriter
+    from icecube.sim_services.label_events import ClassificationConverter
 except ImportError:
-    I3Tray = None
-    dataclasses = None
     icetray = None
-    dataio = None
     hdfwriter = None
-    ml_suite = None
-    MCLabeler = None
     ClassificationConverter = None
-    MuonLabels = None
 
 
 __all__ = ["FeatureExtractor"]
@@ -35,67 +32,323 @@ class FeatureExtractor(IGExtractor):
 
     This class sets up an IceTray pipeline that:
     - Loads input i3 files (including the GCD file),
+    - Drops events failing the configured pre-selection,
     - Labels Monte Carlo events,
     - Runs the `ml_suite` feature extraction module,
     - Outputs results to an HDF5 file with relevant classification and extracted data.
+
+    Input files are extracted one at a time into separate output files, and the extraction is
+    checkpointed per input file so an interrupted run can be resumed.
+
+    With `extraction.output: arrow`, the last step is replaced by an ArrowEventWriter which
+    writes features and truth straight into the converted Parquet layout, so no HDF5 file is
+    written and no conversion is needed.
     """
 
+    # i3 file extensions, removed from input file names to name their shards
+    INPUT_SUFFIXES = (".i3.zst", ".i3.gz", ".i3.bz2", ".i3")
+
     if ClassificationConverter is not None:
         cls_converter = ClassificationConverter()
     else:
         cls_converter = None
 
-    def extract(self) -> Path:
+    @property
+    def input_files(self) -> list[Path]:
+        """
+        Input i3 files, without the GCD file.
+        """
+        return sorted(self.input_dir.glob("*.i3.zst"))
+
+    @property
+    def hdf5_dir(self) -> Path:
+        """
+        Directory the HDF5 extraction is published to, 'extraction/<input state hash>'.
+        """
+        return self.output_dir / self._config.get_input_state_hash()
+
+    @property
+    def parquet_dir(self) -> Path:
+        """
+        Directory the Arrow-native extraction is published to by default, 'parquet/<input state hash>'
+        next to the input, where HDF5ToParquet would write to.
+        """
+        return self.output_dir.parent / "parquet" / self._config.get_input_state_hash()
+
+    def extract(self, resume: bool = True, num_workers: Optional[int] = None) -> Path:
         """
         Executes the IceTray feature extraction pipeline on the input directory.
 
+        Each input file is extracted by its own tray into its own HDF5 file, a shard of the extraction. Shards are
+        written to '<output dir>.partial' and the directory is renamed to 'extraction/<input state hash>' once every
+        input file is done, so an interrupted extraction is resumed from the first incomplete input file. Processes
+        extracting the same inputs with the same settings run one at a time, and the others reuse the published output.
+
+        Args:
+            resume (bool): Whether to reuse extracted shards, or a completed extraction, of an earlier run.
+            num_workers (Optional[int]): Number of input files extracted in parallel, each by its own process.
+                Defaults to what fits on the node, see ResourceGovernor.extraction_workers.
+
         Returns:
-            Path: Path to the generated HDF5 output file.
+            Path: Path to the directory of extracted HDF5 files, or to the converted Parquet directory
+                with `extraction.output: arrow`.
         """
-        Console.out(f"Running feature extraction: {self.input_dir}")
-        Console.spinner().start()
+        if self._config.compiled.extraction.output == "arrow":
+            return self.extract_to_parquet(resume=resume, num_workers=num_workers)
+
+        checkpoint = ShardCheckpoint(self.hdf5_dir)
+        if resume and checkpoint.complete:
+            Console.out(f"Found completed extraction: {checkpoint.final_dir}")
+            return checkpoint.final_dir
+
+        with checkpoint.lock():
+            # published by another process while this one waited for the lock
+            if resume and checkpoint.complete:
+                Console.out(f"Found completed extraction: {checkpoint.final_dir}")
+                return checkpoint.final_dir
+
+            Console.out(f"Running feature extraction: {self.input_dir}")
+            checkpoint.start(resume)
 
-        tray = I3Tray()
+            input_bytes = sum(Path(f).stat().st_size for f in [self._config.gcd_path] + self.input_files)
+            if Profiler.enabled:
+                Profiler.count("extractor.extract.input_bytes", input_bytes)
 
-        # Read the i3 files to memory
-        input_files = [str(self._config.gcd_path)] + [
-            str(p) for p in sorted(self.input_dir.glob("*.i3.zst"))
-        ]
-        tray.Add('I3Reader', Filenamelist=input_files)
+            shards = {
+                name: (path, checkpoint.work_dir / f"{name}.hdf5")
+                for name, path in self._shard_names(self.input_files).items()
+            }
+            events = self._run_shards(checkpoint, shards, self._extract_hdf5_shard, num_workers)
 
-        # This module labels MC events based on their topology
-        tray.Add(
-            MCLabeler,
-            event_properties_name=None,
-            mctree_name=self._config.user_config.frame_keys.mctree,
-            weight_dict_name=self._config.user_config.frame_keys.weight_dict,
-            bg_mctree_name=self._config.user_config.frame_keys.bg_mctree
-        )
+            Console.out(f"Extracted {events} events from {len(self.input_files)} files ({input_bytes / 1e6:.1f} MB)")
 
-        # This module performs the feature calculation
-        tray.Add(
-            ml_suite.EventFeatureExtractorModule,
-            cfg_file=str(self._config.ml_suite_config_file)
-        )
+            return checkpoint.publish()
 
-        # Path to output file
-        outfile = self.output_dir / 'data.hdf5'
+    def _extract_hdf5_shard(self, input_file: Path, output_file: Path, progress: Optional[Progress | ProgressHandle] = None) -> dict:
+        """
+        Extracts one input file to an HDF5 file, written under a temporary name until complete.
+
+        Args:
+            input_file (Path): Input i3 file.
+            output_file (Path): HDF5 file to write.
+            progress (Optional[Progress]): Progress bar to update as events leave the tray.
+
+        Returns:
+            dict: Details of the shard, stored in its completion marker.
+        """
+        source = I3TraySource(self._config, [input_file])
+        tray = source.build_tray()
+        events = 0
+
+        # Report extracted events as they leave the tray
+        def report_progress(frame) -> bool:
+            nonlocal events
+            events += 1
+            if progress is not None:
+                progress.update(1)
+            return True
 
         # Serialize labels and features to HDF5
-        tray.AddSegment(
-            hdfwriter.I3HDFWriter,
-            Output=str(outfile),
-            Keys=[
-                "ml_suite_features",
-                ("classification", self.cls_converter),
-                "classification_emuon_entry",
-                "classification_emuon_deposited",
-                self._config.user_config.frame_keys.truth_dict
-            ],
-            SubEventStreams=["InIceSplit"]
-        )
-
-        tray.Execute()
-        Console.spinner().stop()
-
-        return outfile
\ No newline at end of file
+        with atomic_path(output_file) as outfile:
+            tray.AddSegment(
+                hdfwriter.I3HDFWriter,
+                Output=str(outfile),
+                Keys=[
+                    I3TraySource.FEATURES_KEY,
+                    ("classification", self.cls_converter),
+                    "classification_emuon_entry",
+                    "classification_emuon_deposited",
+                    self._config.compiled.frame_keys.truth_dict
+                ],
+                SubEventStreams=I3TraySource.SUB_EVENT_STREAMS
+            )
+            tray.Add(report_progress, "icegraph_progress", Streams=[icetray.I3Frame.Physics])
+            tray.Execute()
+
+        if source.preselection is not None:
+            source.preselection.report()
+
+        return {"input": str(input_file), "events": events}
+
+    def extract_to_parquet(
+        self,
+        source: Optional[FrameSource] = None,
+        output_dir: Optional[Path] = None,
+        resume: bool = True,
+        num_workers: Optional[int] = None
+    ) -> Path:
+        """
+        Extracts features and truth straight into the converted Parquet layout.
+
+        Without an explicit source, each input file is extracted by its own tray and written to its own files, a
+        shard of the extraction, which is checkpointed and published as in FeatureExtractor.extract. An explicit
+        source is written as a single shard.
+
+        Args:
+            source (Optional[FrameSource]): Source of events. Defaults to the IceTray pipeline over the input directory.
+            output_dir (Optional[Path]): Output directory. Defaults to FeatureExtractor.parquet_dir.
+            resume (bool): Whether to reuse extracted shards, or a completed extraction, of an earlier run.
+            num_workers (Optional[int]): Number of input files extracted in parallel, each by its own process.
+                Defaults to what fits on the node, see ResourceGovernor.extraction_workers.
+
+        Returns:
+            Path: Path to the directory containing the converted Parquet files.
+        """
+        output_dir = Path(output_dir or self.parquet_dir)
+        checkpoint = ShardCheckpoint(output_dir)
+        if resume and checkpoint.complete:
+            Console.out(f"Found completed extraction: {output_dir}")
+            return output_dir
+
+        if source is not None:
+            sources = {"data": source}
+        else:
+            sources = {name: I3TraySource(self._config, [path]) for name, path in self._shard_names(self.input_files).items()}
+
+        with checkpoint.lock():
+            # published by another process while this one waited for the lock
+            if resume and checkpoint.complete:
+                Console.out(f"Found completed extraction: {output_dir}")
+                return output_dir
+
+            Console.out(f"Running feature extraction to parquet: {self.input_dir}")
+            checkpoint.start(resume)
+
+            shards = {
+                name: (name, shard_source, checkpoint.work_dir, len(sources) > 1)
+                for name, shard_source in sources.items()
+            }
+            self._run_shards(checkpoint, shards, self._extract_parquet_shard, num_workers)
+
+            return checkpoint.publish()
+
+    def _extract_parquet_shard(
+        self,
+        name: str,
+        source: FrameSource,
+        work_dir: Path,
+        sharded: bool,
+        progress: Optional[Progress | ProgressHandle] = None
+    ) -> dict:
+        """
+        Extracts the events of one source into the converted Parquet layout.
+
+        Args:
+            name (str): Shard name, used to name the output files.
+            source (FrameSource): Source of events.
+            work_dir (Path): Directory to write to.
+            sharded (bool): Whether other shards share the directory, see ArrowEventWriter.
+            progress (Optional[Progress]): Progress bar to update as events are written.
+
+        Returns:
+            dict: Details of the shard, stored in its completion marker.
+        """
+        if Profiler.enabled and isinstance(source, I3TraySource):
+            Profiler.count("extractor.extract.input_bytes", sum(p.stat().st_size for p in source.input_files))
+
+        with ArrowEventWriter(self._config, work_dir, basename=name, sharded=sharded) as writer:
+            def sink(event) -> None:
+                writer.write(event)
+                if progress is not None:
+                    progress.update(1)
+
+            source.stream(sink)
+
+        return {"events": writer.events_written, "rows": writer.rows_written}
+
+    def _run_shards(
+        self,
+        checkpoint: ShardCheckpoint,
+        shards: dict[str, tuple],
+        extract_shard: Callable[..., dict],
+        num_workers: Optional[int]
+    ) -> int:
+        """
+        Extracts every shard without a completion marker, marking each one done as it completes.
+
+        With more than one worker, shards are extracted by a pool of processes, which report their progress
+        through worker handles. No new shard is started while memory is under pressure (see ResourceGovernor),
+        unless nothing else is running.
+
+        Args:
+            checkpoint (ShardCheckpoint): Checkpoint of the extraction.
+            shards (dict[str, tuple]): Arguments of `extract_shard` for each shard name.
+            extract_shard (Callable[..., dict]): Extracts one shard, returning the details of its marker,
+                including the number of 'events'.
+            num_workers (Optional[int]): Number of worker processes. Defaults to what fits on the node.
+
+        Returns:
+            int: Number of events extracted by this run.
+        """
+        pending = {}
+        for name, args in shards.items():
+            if checkpoint.is_done(name):
+                Console.out(f"Skipping extracted shard: {name}", severity=1)
+            else:
+                pending[name] = args
+
+        governor = ResourceGovernor(self._config)
+        if num_workers is None:
+            num_workers = governor.extraction_workers(len(pending))
+            Console.out(f"Extracting with {num_workers} workers")
+
+        events = 0
+        progress = Console.progress("Extracting features", unit="events")
+        with Profiler.stage("extractor.extract"), progress:
+            if num_workers <= 1 or len(pending) <= 1:
+                for name, args in pending.items():
+                    info = extract_shard(*args, progress=progress)
+                    checkpoint.mark_done(name, **info)
+                    events += info["events"]
+            else:
+                handle = progress.worker_handle()
+                queue = list(pending.items())
+                running = {}
+                with ProcessPoolExecutor(max_workers=min(num_workers, len(pending))) as executor:
+                    while queue or running:
+                        while queue and len(running) < num_workers and not (running and governor.under_pressure()):
+                            name, args = queue.pop(0)
+                            running[executor.submit(_extract_in_worker, extract_shard, args, handle)] = name
+
+                        done, _ = wait(running, timeout=governor.PRESSURE_INTERVAL, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            info = future.result()
+                            checkpoint.mark_done(running.pop(future), **info)
+                            events += info["events"]
+        return events
+
+    @classmethod
+    def _shard_name(cls, input_file: Path) -> str:
+        """
+        Shard name of an input file, its name without the i3 file extension. Other dots are kept, since input
+        names such as 'Level2_IC86.2016_..._00000001.i3.zst' differ only after the first one.
+        """
+        name = input_file.name
+        for suffix in cls.INPUT_SUFFIXES:
+            if name.endswith(suffix):
+                return name[:-len(suffix)]
+        return name
+
+    @classmethod
+    def _shard_names(cls, input_files: list[Path]) -> dict[str, Path]:
+        """
+        Shard name of each input file.
+
+        Raises:
+            ValueError: If input files share a shard name, so one would overwrite the other's output.
+        """
+        names = {}
+        for path in input_files:
+            if (name := cls._shard_name(path)) in names:
+                raise ValueError(f"Input files {names[name]} and {path} have the same shard name: {name}")
+            names[name] = path
+        return names
+
+
+def _extract_in_worker(extract_shard: Callable[..., dict], args: tuple, progress: ProgressHandle) -> dict:
+    """
+    Extracts one shard in a worker process, reporting its progress to the parent.
+    """
+    info = extract_shard(*args, progress=progress)
+    progress.flush()
+    return info
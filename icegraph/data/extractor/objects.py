@@ -0,0 +1,63 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+__all__ = ["ExtractedEvent"]
+
+@dataclass
+class ExtractedEvent:
+    """
+    The ml_suite features and truth of a single event, as produced by a FrameSource.
+
+    Attributes:
+        ids (dict[str, int]): Value of each event ID column (e.g. Run, Event, SubEvent).
+        doms (np.ndarray): DOM ID column values of each hit DOM (num_DOMs, num_dom_id_columns).
+        features (np.ndarray): ml_suite feature vector of each hit DOM (num_DOMs, num_features).
+        truth (dict[str, float]): Truth quantities of the event.
+    """
+    ids: dict[str, int]
+    doms: np.ndarray
+    features: np.ndarray
+    truth: dict[str, float]
+
+    @staticmethod
+    def composite_key(columns: tuple[str, ...] | list[str], values) -> str:
+        """
+        Build a composite key in the format used by the converter ('col=value|col=value|...').
+
+        Args:
+            columns (tuple[str, ...] | list[str]): ID column names.
+            values: ID values, in column order.
+
+        Returns:
+            str: Composite key.
+        """
+        return "|".join(f"{col}={value}" for col, value in zip(columns, values))
+
+    def event_key(self, columns: tuple[str, ...] | list[str]) -> str:
+        """
+        Composite event ID of this event.
+
+        Args:
+            columns (tuple[str, ...] | list[str]): Event ID column names, in key order.
+
+        Returns:
+            str: Composite event ID.
+        """
+        return self.composite_key(columns, (self.ids[col] for col in columns))
+
+    def dom_keys(self, columns: tuple[str, ...] | list[str]) -> list[str]:
+        """
+        Composite DOM ID of each hit DOM.
+
+        Args:
+            columns (tuple[str, ...] | list[str]): DOM ID column names, in the column order of `doms`.
+
+        Returns:
+            list[str]: Composite DOM IDs.
+        """
+        return [self.composite_key(columns, dom) for dom in self.doms.tolist()]
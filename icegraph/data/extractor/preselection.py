@@ -0,0 +1,154 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+import math
+from typing import Optional
+
+import xxhash
+
+from icegraph.config import IGConfig
+from icegraph.console import Console
+from icegraph.profiling import Profiler
+
+# have to wrap in try/except block so sphinx can properly generate docs
+try:
+    from icecube import dataclasses
+except ImportError:
+    dataclasses = None
+
+
+__all__ = ["EventPreselection"]
+
+class EventPreselection:
+    """
+    Cheap event cuts applied ahead of feature extraction, configured in the `preselection` section:
+
+    - an energy range, read from the truth dictionary,
+    - a minimum number of hit DOMs, counted in the configured pulse series,
+    - a deterministic subsample, decided by a hash of the event ID, so the same events are kept
+      regardless of file order or how the input is split.
+
+    Instances are IceTray-compatible filter functions: added to a tray, they drop physics frames
+    that fail the cuts, so those never reach `ml_suite` or the output writer.
+
+    Attributes:
+        kept (int): Number of events kept so far.
+        dropped (dict[str, int]): Number of events dropped so far, by the first cut they failed.
+    """
+
+    def __init__(self, config: IGConfig, sub_event_streams: Optional[list[str]] = None) -> None:
+        """
+        Initialize the pre-selection.
+
+        Args:
+            config (IGConfig): IceGraph configuration object containing user settings.
+            sub_event_streams (Optional[list[str]]): Sub-event streams the cuts apply to. Physics frames of
+                other streams pass through uncounted. Defaults to all streams.
+        """
+        self._config: IGConfig = config
+        self.sub_event_streams = sub_event_streams
+        self.settings = config.compiled.preselection
+        self.pulse_key: str = config.compiled.feature_extraction.get("pulse_key", "")
+
+        self.kept = 0
+        self.dropped: dict[str, int] = {"energy": 0, "hit_doms": 0, "subsample": 0}
+
+    def __call__(self, frame) -> bool:
+        """
+        IceTray filter: decide whether a physics frame is kept.
+
+        Args:
+            frame (I3Frame): Physics frame.
+
+        Returns:
+            bool: Whether to keep the frame.
+        """
+        header = frame["I3EventHeader"]
+        if self.sub_event_streams is not None and header.sub_event_stream not in self.sub_event_streams:
+            return True
+
+        energy = None
+        truth_key = self._config.compiled.frame_keys.truth_dict
+        if (self.settings.min_energy is not None or self.settings.max_energy is not None) and truth_key in frame:
+            truth = frame[truth_key]
+            if self.settings.energy_key in truth:
+                energy = truth[self.settings.energy_key]
+
+        num_doms = None
+        if self.settings.min_hit_doms > 0:
+            pulses = dataclasses.I3RecoPulseSeriesMap.from_frame(frame, self.pulse_key)
+            num_doms = sum(1 for series in pulses.values() if len(series))
+
+        return self.accept((header.run_id, header.event_id, header.sub_event_id), energy, num_doms)
+
+    def accept(self, event_key: tuple[int, ...], energy: Optional[float], num_doms: Optional[int]) -> bool:
+        """
+        Decide whether an event is kept, and count the outcome.
+
+        Args:
+            event_key (tuple[int, ...]): Values identifying the event, e.g. (run, event, sub-event).
+            energy (Optional[float]): Event energy. When an energy range is configured, events without an
+                energy (None or NaN) fail the energy cut.
+            num_doms (Optional[int]): Number of hit DOMs. Only required when a minimum is configured.
+
+        Returns:
+            bool: Whether to keep the event.
+        """
+        reason = self._failed_cut(event_key, energy, num_doms)
+        if reason is None:
+            self.kept += 1
+            return True
+
+        self.dropped[reason] += 1
+        return False
+
+    def _failed_cut(self, event_key: tuple[int, ...], energy: Optional[float], num_doms: Optional[int]) -> Optional[str]:
+        """
+        Returns the name of the first cut the event fails, or None if it passes all of them.
+        """
+        settings = self.settings
+        if settings.min_energy is not None or settings.max_energy is not None:
+            # an event without a known energy cannot be shown to be in range
+            if energy is None or math.isnan(energy):
+                return "energy"
+            if settings.min_energy is not None and energy < settings.min_energy:
+                return "energy"
+            if settings.max_energy is not None and energy > settings.max_energy:
+                return "energy"
+        if settings.min_hit_doms > 0 and num_doms < settings.min_hit_doms:
+            return "hit_doms"
+        if settings.subsample < 1.0 and self.subsample_value(event_key) >= settings.subsample:
+            return "subsample"
+        return None
+
+    def subsample_value(self, event_key: tuple[int, ...]) -> float:
+        """
+        Deterministic pseudo-random value in [0, 1) of an event.
+
+        Args:
+            event_key (tuple[int, ...]): Values identifying the event.
+
+        Returns:
+            float: Value compared against the subsample fraction.
+        """
+        digest = xxhash.xxh64_intdigest(":".join(map(str, event_key)).encode(), seed=self.settings.seed)
+        return digest / 2 ** 64
+
+    @property
+    def seen(self) -> int:
+        """
+        Number of events seen so far.
+        """
+        return self.kept + sum(self.dropped.values())
+
+    def report(self) -> None:
+        """
+        Print and record the kept and dropped counts.
+        """
+        dropped = ", ".join(f"{reason}: {count}" for reason, count in self.dropped.items() if count) or "none"
+        Console.out(f"Pre-selection kept {self.kept} of {self.seen} events (dropped by {dropped})")
+
+        if Profiler.enabled:
+            Profiler.count("preselection.kept", self.kept)
+            for reason, count in self.dropped.items():
+                Profiler.count(f"preselection.dropped.{reason}", count)
@@ -0,0 +1,175 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from icegraph.config import IGConfig
+from .objects import ExtractedEvent
+from .preselection import EventPreselection
+
+# have to wrap in try/except block so sphinx can properly generate docs
+try:
+    from icecube.icetray import I3Tray
+    from icecube import dataclasses, icetray, dataio, ml_suite
+    from icecube.sim_services.label_events import MCLabeler
+except ImportError:
+    I3Tray = None
+    dataclasses = None
+    icetray = None
+    dataio = None
+    ml_suite = None
+    MCLabeler = None
+
+
+__all__ = ["FrameSource", "I3TraySource"]
+
+class FrameSource(ABC):
+    """
+    Abstract source of extracted events.
+
+    Sources push events into a sink, which lets IceTray drive the iteration while writers
+    stay independent of IceTray.
+    """
+
+    @abstractmethod
+    def stream(self, sink: Callable[[ExtractedEvent], None]) -> int:
+        """
+        Produce every event of the source, passing each one to the sink.
+
+        Args:
+            sink (Callable[[ExtractedEvent], None]): Called once per event, in order.
+
+        Returns:
+            int: Number of events produced.
+        """
+        ...
+
+
+class I3TraySource(FrameSource):
+    """
+    Runs the IceTray feature extraction pipeline and produces the ml_suite features and truth
+    of every physics frame of the configured sub-event stream.
+
+    The pipeline reads the GCD and input files, applies the configured pre-selection, labels
+    Monte Carlo events, and runs `ml_suite`.
+
+    Attributes:
+        preselection (EventPreselection | None): Pre-selection stage, or None if no cut is configured.
+    """
+
+    FEATURES_KEY = "ml_suite_features"
+    SUB_EVENT_STREAMS = ["InIceSplit"]
+
+    def __init__(self, config: IGConfig, input_files: list[Path]) -> None:
+        """
+        Initialize the source.
+
+        Args:
+            config (IGConfig): IceGraph configuration object containing user settings.
+            input_files (list[Path]): Input i3 files, without the GCD file.
+        """
+        self._config: IGConfig = config
+        self.input_files = input_files
+
+        self.preselection: EventPreselection | None = None
+        if config.compiled.preselection.active:
+            self.preselection = EventPreselection(config, self.SUB_EVENT_STREAMS)
+
+    def build_tray(self) -> "I3Tray":
+        """
+        Build the IceTray pipeline up to and including feature calculation.
+
+        Returns:
+            I3Tray: Tray to which output modules can be added.
+        """
+        tray = I3Tray()
+
+        # Read the i3 files to memory
+        tray.Add('I3Reader', Filenamelist=[str(self._config.gcd_path)] + [str(p) for p in self.input_files])
+
+        # Drop events failing the cheap cuts before any expensive module sees them
+        if self.preselection is not None:
+            tray.Add(self.preselection, "icegraph_preselection", Streams=[icetray.I3Frame.Physics])
+
+        # This module labels MC events based on their topology
+        tray.Add(
+            MCLabeler,
+            event_properties_name=None,
+            mctree_name=self._config.compiled.frame_keys.mctree,
+            weight_dict_name=self._config.compiled.frame_keys.weight_dict,
+            bg_mctree_name=self._config.compiled.frame_keys.bg_mctree
+        )
+
+        # This module performs the feature calculation
+        tray.Add(
+            ml_suite.EventFeatureExtractorModule,
+            cfg_file=str(self._config.ml_suite_config_file)
+        )
+
+        return tray
+
+    def stream(self, sink: Callable[[ExtractedEvent], None]) -> int:
+        """
+        Run the pipeline, passing the features and truth of every physics frame to the sink.
+
+        Args:
+            sink (Callable[[ExtractedEvent], None]): Called once per event, in order.
+
+        Returns:
+            int: Number of events produced.
+        """
+        tray = self.build_tray()
+        count = 0
+
+        def emit(frame) -> bool:
+            nonlocal count
+            if frame["I3EventHeader"].sub_event_stream in self.SUB_EVENT_STREAMS:
+                sink(self.frame_to_event(frame))
+                count += 1
+            return True
+
+        tray.Add(emit, "icegraph_emit", Streams=[icetray.I3Frame.Physics])
+        tray.Execute()
+
+        if self.preselection is not None:
+            self.preselection.report()
+
+        return count
+
+    def frame_to_event(self, frame) -> ExtractedEvent:
+        """
+        Read the features and truth of a physics frame.
+
+        ID values follow hdfwriter's conventions, so event and DOM IDs match those of the HDF5 output.
+
+        Args:
+            frame (I3Frame): Physics frame which went through `ml_suite`.
+
+        Returns:
+            ExtractedEvent: Features and truth of the event.
+        """
+        header = frame["I3EventHeader"]
+        ids = {
+            "Run": header.run_id,
+            "Event": header.event_id,
+            "SubEvent": header.sub_event_id,
+            "SubEventStream": self.SUB_EVENT_STREAMS.index(header.sub_event_stream),
+            "exists": 1,
+        }
+
+        features = frame[self.FEATURES_KEY]
+        doms = np.array([(key.string, key.om, key.pmt) for key in features.keys()], dtype=np.int64).reshape(-1, 3)
+        values = np.array([list(vector) for vector in features.values()], dtype=np.float64)
+
+        truth = {key: float(value) for key, value in frame[self._config.compiled.frame_keys.truth_dict].items()}
+
+        return ExtractedEvent(
+            ids={col: ids[col] for col in self._config.compiled.event_id_columns},
+            doms=doms,
+            features=values.reshape(len(doms), -1),
+            truth=truth
+        )
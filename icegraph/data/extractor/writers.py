@@ -0,0 +1,216 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from icegraph.config import IGConfig
+from icegraph.console import Console
+from icegraph.profiling import Profiler
+from icegraph.data.transforms import TransformPipeline
+from .objects import ExtractedEvent
+
+
+__all__ = ["ArrowEventWriter"]
+
+class ArrowEventWriter:
+    """
+    Writes extracted events straight into the converted, event-keyed Parquet layout read by IGData,
+    without an HDF5 intermediate.
+
+    Events are buffered and written in batches of `extraction.batch_events` events, one row group per
+    batch, following the configured storage layout and profile. With the "partitioned" layout one file
+    is kept open per partition. The truth columns are fixed by the first event; truth quantities missing
+    from later events are written as nulls. With `transforms.at_conversion`, the configured transforms are applied
+    to the features and labels of every batch before it is written.
+
+    With `sharded`, several writers can share an output directory: each one writes its own files,
+    '<name>/<basename>.parquet' (or '<basename>-0.parquet' in every partition), so IGData reads their union.
+    """
+
+    def __init__(
+        self,
+        config: IGConfig,
+        output_dir: Union[str, Path],
+        basename: str = "data",
+        batch_events: Optional[int] = None,
+        sharded: bool = False
+    ) -> None:
+        """
+        Initialize the writer. Files are created when the first batch is written.
+
+        Args:
+            config (IGConfig): IceGraph configuration object containing user settings.
+            output_dir (Union[str, Path]): Directory to write the features and truth data to.
+            basename (str): File name prefix used by the partitioned layout, and by the file layout with `sharded`.
+            batch_events (Optional[int]): Number of events per batch. Defaults to `extraction.batch_events`.
+            sharded (bool): Whether other writers share the output directory, so the file layout writes
+                '<name>/<basename>.parquet' rather than '<name>.parquet'.
+        """
+        self._config: IGConfig = config
+        self.output_dir = Path(output_dir)
+        self.basename = basename
+        self.sharded = sharded
+        self.batch_events = batch_events or config.compiled.extraction.batch_events
+
+        compiled = config.compiled
+        self.profile = compiled.storage.profile
+        self.partition_by = list(compiled.storage.partition_by) if compiled.storage.layout == "partitioned" else []
+        self.event_id_columns = list(compiled.event_id_columns)
+        self.dom_id_columns = list(compiled.dom_id_columns)
+        self.feature_columns = list(compiled.feature_columns)
+        self.metadata = {**self.profile.metadata(), **compiled.dataset_schema.metadata()}
+        self.transforms = TransformPipeline.from_config(config, at_conversion=True)
+
+        self.features_schema = pa.schema(
+            [("event_id", pa.string()), ("dom_id", pa.string())]
+            + [(col, pa.from_numpy_dtype(self.profile.feature_dtype)) for col in self.feature_columns],
+            metadata=self.metadata
+        )
+        self.truth_schema: Optional[pa.Schema] = None
+
+        self.events_written = 0
+        self.rows_written = 0
+        self._buffer: list[ExtractedEvent] = []
+        self._writers: dict[tuple, pq.ParquetWriter] = {}
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+    def __enter__(self) -> "ArrowEventWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def write(self, event: ExtractedEvent) -> None:
+        """
+        Add an event, writing a batch once enough events are buffered.
+
+        Args:
+            event (ExtractedEvent): Event to write.
+
+        Raises:
+            ValueError: If the event's feature vectors do not match the configured features.
+        """
+        if len(event.features) and event.features.shape[1] != len(self.feature_columns):
+            raise ValueError(
+                f"Expected {len(self.feature_columns)} features per DOM, got {event.features.shape[1]} "
+                f"for event {event.event_key(self.event_id_columns)}"
+            )
+
+        self._buffer.append(event)
+        if len(self._buffer) >= self.batch_events:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Write all buffered events.
+        """
+        if not self._buffer:
+            return
+
+        with Profiler.stage("extractor.write"):
+            if self.partition_by:
+                groups: dict[tuple, list[ExtractedEvent]] = {}
+                for event in self._buffer:
+                    groups.setdefault(tuple(event.ids[col] for col in self.partition_by), []).append(event)
+            else:
+                groups = {(): self._buffer}
+
+            for partition, events in groups.items():
+                features = self._features_table(events)
+                truth = self._truth_table(events)
+                self._writer("features", partition, features.schema).write_table(features, row_group_size=len(features))
+                self._writer("truth", partition, truth.schema).write_table(truth)
+
+                self.rows_written += features.num_rows
+                if Profiler.enabled:
+                    Profiler.count("extractor.write.rows", features.num_rows)
+                    Profiler.count("extractor.write.bytes", features.nbytes + truth.nbytes)
+
+        self.events_written += len(self._buffer)
+        self._buffer = []
+
+    def close(self) -> Path:
+        """
+        Write remaining events and close all files.
+
+        Returns:
+            Path: The output directory.
+        """
+        self.flush()
+        for writer in self._writers.values():
+            writer.close()
+        self._writers = {}
+
+        Console.out(f"Wrote {self.events_written} events ({self.rows_written} DOMs) to {self.output_dir}")
+        return self.output_dir
+
+    def _features_table(self, events: list[ExtractedEvent]) -> pa.Table:
+        """
+        Build the wide features table of a batch, one row per hit DOM.
+        """
+        counts = [len(event.doms) for event in events]
+        event_keys = np.repeat(np.array([event.event_key(self.event_id_columns) for event in events], dtype=object), counts)
+        dom_keys = [key for event in events for key in event.dom_keys(self.dom_id_columns)]
+
+        if sum(counts):
+            values = np.concatenate([event.features for event in events if len(event.doms)])
+        else:
+            values = np.empty((0, len(self.feature_columns)))
+        if self.transforms.features:
+            # transformed at full precision, in place in the concatenated copy of the events' features
+            values = self.transforms.transform_features(values.astype(np.float64, copy=False))
+        values = values.astype(self.profile.feature_dtype, copy=False)
+
+        columns = [pa.array(event_keys, pa.string()), pa.array(dom_keys, pa.string())]
+        columns += [pa.array(values[:, i]) for i in range(len(self.feature_columns))]
+        return pa.Table.from_arrays(columns, schema=self.features_schema)
+
+    def _truth_table(self, events: list[ExtractedEvent]) -> pa.Table:
+        """
+        Build the truth table of a batch, one row per event.
+        """
+        if self.truth_schema is None:
+            self.truth_schema = pa.schema(
+                [("event_id", pa.string())] + [(key, pa.float64()) for key in events[0].truth],
+                metadata=self.metadata
+            )
+
+        columns = {"event_id": [event.event_key(self.event_id_columns) for event in events]}
+        for key in self.truth_schema.names[1:]:
+            columns[key] = [event.truth.get(key) for event in events]
+
+        if self.transforms.labels:
+            # missing quantities become NaN in the transformed columns, and are written back as nulls
+            frame = self.transforms.transform_frame(pd.DataFrame(columns), "labels")
+            return pa.Table.from_pandas(frame, schema=self.truth_schema, preserve_index=False)
+        return pa.Table.from_pydict(columns, schema=self.truth_schema)
+
+    def _writer(self, name: str, partition: tuple, schema: pa.Schema) -> pq.ParquetWriter:
+        """
+        Return the open file of a table and partition, creating it on first use.
+        """
+        if (writer := self._writers.get((name, partition))) is None:
+            if self.partition_by:
+                directory = self.output_dir / name
+                for col, value in zip(self.partition_by, partition):
+                    directory = directory / f"{col}={value}"
+                directory.mkdir(parents=True, exist_ok=True)
+                path = directory / f"{self.basename}-0.parquet"
+            elif self.sharded:
+                (self.output_dir / name).mkdir(parents=True, exist_ok=True)
+                path = self.output_dir / name / f"{self.basename}.parquet"
+            else:
+                path = self.output_dir / f"{name}.parquet"
+
+            writer = pq.ParquetWriter(
+                path, schema, **self.profile.parquet_options(schema.names, self.feature_columns)
+            )
+            self._writers[(name, partition)] = writer
+        return writer
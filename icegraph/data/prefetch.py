@@ -0,0 +1,201 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Callable, Iterable, Iterator, Optional, Any, TYPE_CHECKING
+
+import pyarrow.parquet as pq
+import torch
+
+from icegraph.console import Console
+from icegraph.profiling import Profiler
+from icegraph.resources import ResourceGovernor
+
+if TYPE_CHECKING:
+    from icegraph.data.base import IGData, PartitionedParquet
+
+
+__all__ = ["PrefetchReader"]
+
+class PrefetchReader:
+    """
+    Iterates over batches of an IGData split while reading Parquet row groups ahead of the sampler order.
+
+    Batch loads are submitted to a thread pool so that up to `num_batches` decoded batches are kept ready
+    while the consumer (typically the model) is busy. Each worker thread reads through its own pre-buffered
+    Parquet handle, and all row groups needed by a batch are requested in a single call so that pyarrow can
+    coalesce the column chunk byte ranges. While memory is under pressure (see ResourceGovernor), only one
+    batch is read ahead.
+    """
+
+    def __init__(
+        self,
+        data: "IGData",
+        sampler: Optional[Iterable[int]] = None,
+        batch_size: int = 1,
+        num_batches: Optional[int] = None,
+        num_threads: Optional[int] = None,
+        collate_fn: Optional[Callable[[list[tuple[torch.Tensor, torch.Tensor]]], Any]] = None,
+        drop_last: bool = False,
+        progress: bool = False,
+        batch_sampler: Optional[Iterable[list[int]]] = None
+    ) -> None:
+        """
+        Initialize the prefetching reader.
+
+        Args:
+            data (IGData): The dataset split to read from.
+            sampler (Optional[Iterable[int]]): Order in which to visit dataset indices. Re-iterated on every
+                epoch, so a torch Sampler can be passed directly. Defaults to sequential order.
+            batch_size (int): Number of events per batch.
+            num_batches (Optional[int]): Number of decoded batches to keep ready. Defaults to
+                `loading.prefetch_batches` from the config, or 4.
+            num_threads (Optional[int]): Number of reader threads. Defaults to `loading.prefetch_threads`
+                from the config, or 4.
+            collate_fn (Optional[Callable]): Function applied to each list of (features, labels) samples.
+                Defaults to returning the list unchanged, since events have a variable number of DOMs.
+            drop_last (bool): Whether to drop the final batch if it is smaller than `batch_size`.
+            progress (bool): Whether to report events loaded, throughput and ETA for every epoch.
+            batch_sampler (Optional[Iterable[list[int]]]): Yields the dataset indices of each batch, such as a
+                DomBucketBatchSampler. Re-iterated on every epoch. Mutually exclusive with `sampler`, `batch_size`
+                and `drop_last`.
+
+        Raises:
+            ValueError: If `batch_sampler` is combined with `sampler`, `batch_size` or `drop_last`.
+        """
+        if batch_sampler is not None and (sampler is not None or batch_size != 1 or drop_last):
+            raise ValueError("batch_sampler is mutually exclusive with sampler, batch_size and drop_last")
+
+        loading_config = data._config.compiled.loading
+
+        self._data: "IGData" = data
+        self.sampler = sampler
+        self.batch_sampler = batch_sampler
+        self.batch_size = batch_size
+        self.num_batches = num_batches or loading_config.prefetch_batches
+        self.num_threads = num_threads or loading_config.prefetch_threads
+        self.collate_fn = collate_fn or (lambda samples: samples)
+        self.drop_last = drop_last
+        self.progress = progress
+
+        # parquet handles are not thread safe, so each reader thread opens its own
+        self._local = threading.local()
+        self._governor = ResourceGovernor(data._config)
+
+    def __len__(self) -> int:
+        """
+        Return the number of batches per epoch.
+
+        Returns:
+            int: Number of batches.
+        """
+        if self.batch_sampler is not None:
+            return len(self.batch_sampler)
+
+        num_indices = len(self.sampler) if self.sampler is not None else len(self._data)
+        if self.drop_last:
+            return num_indices // self.batch_size
+        return -(-num_indices // self.batch_size)
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Iterate over collated batches in sampler order.
+
+        Yields:
+            Any: Output of `collate_fn` for each batch.
+        """
+        pending: deque[Future] = deque()
+        batches = self._batch_indices()
+
+        # build the event index up front rather than racing to build it on the reader threads
+        _ = self._data.row_group_index
+
+        progress = None
+        if self.progress:
+            if self.batch_sampler is not None:
+                num_events = None
+            else:
+                num_events = len(self.sampler) if self.sampler is not None else len(self._data)
+            progress = Console.progress(f"Loading {self._data.subset}", total=num_events, unit="events")
+
+        with ThreadPoolExecutor(max_workers=self.num_threads, thread_name_prefix="icegraph-prefetch") as pool:
+            try:
+                # fill the queue, then submit one new batch for each one handed out
+                for indices in batches:
+                    pending.append(pool.submit(self._load_batch, indices))
+                    if len(pending) >= self.num_batches:
+                        break
+
+                while pending:
+                    # time spent blocked here is storage latency that was not hidden behind compute
+                    with Profiler.stage("prefetch.wait"):
+                        batch, num_events, nbytes = pending.popleft().result()
+
+                    # read fewer batches ahead while memory is under pressure
+                    depth = 1 if self._governor.under_pressure() else self.num_batches
+                    while len(pending) < depth and (indices := next(batches, None)) is not None:
+                        pending.append(pool.submit(self._load_batch, indices))
+                    if progress:
+                        progress.update(num_events, nbytes=nbytes)
+                    yield batch
+            finally:
+                # consumer stopped early, don't wait on batches that will never be used
+                for future in pending:
+                    future.cancel()
+                if progress:
+                    progress.close()
+
+    def _batch_indices(self) -> Iterator[list[int]]:
+        """
+        Group the sampler order into lists of dataset indices.
+
+        Yields:
+            list[int]: Dataset indices of one batch.
+        """
+        if self.batch_sampler is not None:
+            yield from (list(map(int, batch)) for batch in self.batch_sampler)
+            return
+
+        order = self.sampler if self.sampler is not None else range(len(self._data))
+
+        batch: list[int] = []
+        for idx in order:
+            batch.append(int(idx))
+            if len(batch) == self.batch_size:
+                yield batch
+                batch = []
+
+        if batch and not self.drop_last:
+            yield batch
+
+    def _features_file(self) -> "pq.ParquetFile | PartitionedParquet":
+        """
+        Return the Parquet handle owned by the calling thread, opening it on first use.
+
+        Returns:
+            pq.ParquetFile | PartitionedParquet: Thread-local handle to the features file(s).
+        """
+        if (handle := getattr(self._local, "features_file", None)) is None:
+            handle = self._data.open_features_file()
+            self._local.features_file = handle
+        return handle
+
+    def _load_batch(self, indices: list[int]) -> tuple[Any, int, int]:
+        """
+        Read and decode all events of one batch. Runs on a reader thread.
+
+        Args:
+            indices (list[int]): Dataset indices of the batch.
+
+        Returns:
+            tuple[Any, int, int]: Output of `collate_fn` for the batch, number of events, and bytes read.
+        """
+        row_groups = self._data.row_groups_for_indices(indices)
+        table = self._data.read_row_groups(self._features_file(), row_groups)
+
+        samples = [self._data.sample_from_table(table, idx) for idx in indices]
+
+        with Profiler.stage("prefetch.collate"):
+            return self.collate_fn(samples), len(indices), table.nbytes
@@ -3,13 +3,15 @@
 
 from icegraph.console import Console
 from icegraph.data.cache import IGConversionCache
-from icegraph.data.converter import HDF5ToParquet
-from icegraph.data.extractor import FeatureExtractor
 from icegraph.config import IGConfig
+from icegraph.profiling import Profiler
 from icegraph.data import TrainingDataset, ValidationDataset, TestDataset
 
 from pathlib import Path
-from typing import Self, Type, TYPE_CHECKING
+from typing import Optional, Sequence, Self, Type, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from icegraph.data.sharding import RowGroupSharding
 
 
 class DatasetRegistry:
@@ -70,39 +72,101 @@ class DatasetRegistry:
         assert self._test_dataset.subset == "test"
 
     @classmethod
-    def from_config(cls, config: IGConfig) -> Self:
+    def from_config(cls, config: IGConfig, sharding: Optional["RowGroupSharding"] = None) -> Self:
         """
         Factory method to construct a DatasetRegistry from a configuration.
 
         Checks for a cached conversion; if none is found, it triggers full feature
-        extraction and conversion from raw input data.
+        extraction and conversion from raw input data. If the config lists `sources`,
+        the registry is instead composed from those already converted datasets.
+
+        Under data-parallel training, pass the sharding of this rank (e.g. RowGroupSharding.from_distributed())
+        so each split only loads the events of this rank's row groups.
 
         Args:
             config (IGConfig): IceGraph configuration object containing user settings.
+            sharding (Optional[RowGroupSharding]): Row group sharding of this rank. Not supported with `sources`.
 
         Returns:
             DatasetRegistry: A fully-initialized registry containing training, validation, and test datasets.
+
+        Raises:
+            ValueError: If sharding is requested for a dataset composed from `sources`.
         """
-        # check the cache for a pre-converted file before running
-        Console.out(f"Looking for cached conversion of: {config.user_config.input_dir}")
+        # enable instrumentation if requested in the config
+        Profiler.configure(config)
+
+        if config.compiled.sources:
+            if sharding is not None:
+                raise ValueError("Row group sharding is not supported for datasets composed from 'sources'")
+            return cls.from_sources(config)
+
+        with Profiler.stage("registry.from_config"):
+            # check the cache for a pre-converted file before running
+            Console.out(f"Looking for cached conversion of: {config.compiled.input_dir}")
+
+            # initialize the cache handler
+            cache_handler = IGConversionCache(config)
+
+            with Profiler.stage("registry.cache_query"):
+                cached = cache_handler.query()
+
+            if cached:
+                Console.out(f"Cached data found: {cached}")
+                data = cached
+            else:
+                Console.out("No cached data found, running conversion")
+                data = cls._generate_from_config(config, cache_handler)
+
+            Console.out(f"Constructing dataset registry...")
+            with Profiler.stage("registry.build_splits"):
+                return cls(*(
+                    dataset_cls(data, config, sharding)
+                    for dataset_cls in (TrainingDataset, ValidationDataset, TestDataset)
+                ))
 
-        # initialize the cache handler
-        cache_handler = IGConversionCache(config)
+    @classmethod
+    def from_sources(
+        cls,
+        config: IGConfig,
+        sources: Optional[Sequence[Union[str, Path]]] = None,
+        weights: Optional[Sequence[float]] = None
+    ) -> Self:
+        """
+        Factory method to construct a DatasetRegistry whose splits span several converted datasets.
 
-        if cached := cache_handler.query():
-            Console.out(f"Cached data found: {cached}")
-            data = cached
-        else:
-            Console.out("No cached data found, running conversion")
-            data = cls._generate_from_config(config, cache_handler)
+        Args:
+            config (IGConfig): IceGraph configuration object containing user settings.
+            sources (Optional[Sequence[Union[str, Path]]]): Converted directories or cached input state hashes.
+                Defaults to the `sources` list of the config.
+            weights (Optional[Sequence[float]]): Per-source sampling weights. Defaults to the weights in the
+                config, or equal weights when `sources` is given explicitly.
+
+        Returns:
+            DatasetRegistry: A registry whose datasets are CompositeDataset instances.
+        """
+        from icegraph.data.composite import CompositeDataset
+
+        if sources is None:
+            sources = [source.location for source in config.compiled.sources]
+            weights = weights or [source.weight for source in config.compiled.sources]
 
-        Console.out(f"Constructing dataset registry...")
-        return cls(TrainingDataset(data, config), ValidationDataset(data, config), TestDataset(data, config))
+        Console.out(f"Constructing dataset registry from {len(sources)} sources...")
+        with Profiler.stage("registry.build_splits"):
+            return cls(*(
+                CompositeDataset(dataset_cls, sources, config, weights)
+                for dataset_cls in (TrainingDataset, ValidationDataset, TestDataset)
+            ))
 
     @classmethod
     def _generate_from_config(cls, config: IGConfig, cache: IGConversionCache) -> Path:
         """
-        Perform feature extraction and convert the resulting HDF5 file into Parquet format.
+        Perform feature extraction and convert the resulting HDF5 files into Parquet format.
+        With `extraction.output: arrow`, extraction writes the Parquet files directly.
+
+        Both steps are checkpointed per input file, so a build interrupted part way resumes
+        from the first incomplete file when run again. Jobs starting on the same data at once build
+        it one at a time, and the others wait for the published output (see ShardCheckpoint.lock).
 
         This is called only when no cached data is available.
 
@@ -113,13 +177,11 @@ class DatasetRegistry:
         Returns:
             Path: The path to the converted Parquet dataset directory.
         """
-        # extract features to HDF5
-        extractor = FeatureExtractor(config)
-        extracted_file = extractor.extract()
+        # imported here so that opening cached data never loads IceTray
+        from icegraph.data.builder import DatasetBuilder
 
-        # convert HDF5 to Parquet for fast data queries
-        converter = HDF5ToParquet(config, extracted_file)
-        converted_files = converter.convert()
+        # extract features, and convert HDF5 to Parquet for fast data queries
+        converted_files = DatasetBuilder(config).run(("extract", "convert"))
 
         # cache the result for future reuse
         cache.register(converted_files)
@@ -0,0 +1,170 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+from typing import Iterator, Optional, Union, TYPE_CHECKING
+
+import numpy as np
+import torch.distributed as dist
+from torch.utils.data import Sampler
+
+if TYPE_CHECKING:
+    from icegraph.data.base import IGData
+    from icegraph.data.composite import CompositeDataset
+
+
+__all__ = ["DomBucketBatchSampler"]
+
+class DomBucketBatchSampler(Sampler[list[int]]):
+    """
+    Groups events of similar size into batches capped by their total number of DOMs rather than by event count.
+
+    Every epoch, the dataset indices are shuffled and cut into pools of `pool_size` events. Each pool is sorted by
+    DOM count and greedily packed into batches whose DOM total (or padded size, see `padded`) stays within
+    `max_doms`, so events sharing a batch have similar sizes and each batch costs about the same. An event larger
+    than the budget on its own forms a single-event batch. The batch order is then shuffled.
+
+    The batches only depend on the seed, the epoch and the DOM counts. Under torch.distributed every rank builds the
+    same batches and keeps every `num_replicas`-th one, padding with batches from the start of the epoch so all ranks
+    step the same number of times.
+    """
+
+    def __init__(
+        self,
+        data: Union["IGData", "CompositeDataset"],
+        max_doms: int,
+        max_events: Optional[int] = None,
+        pool_size: int = 4096,
+        padded: bool = False,
+        shuffle: bool = True,
+        drop_last: bool = False,
+        seed: int = 0,
+        num_replicas: Optional[int] = None,
+        rank: Optional[int] = None
+    ) -> None:
+        """
+        Initialize the batch sampler.
+
+        Args:
+            data (Union[IGData, CompositeDataset]): Dataset to sample from.
+            max_doms (int): Maximum number of DOMs per batch.
+            max_events (Optional[int]): Maximum number of events per batch. Unlimited by default.
+            pool_size (int): Number of events sorted together. Larger pools give tighter buckets, smaller pools
+                more randomness in which events meet in a batch.
+            padded (bool): Count a batch as its number of events times its largest event, as it costs once padded
+                to a dense tensor, rather than as its DOM total.
+            shuffle (bool): Whether to shuffle events and batches. If False, events are packed in index order.
+            drop_last (bool): Whether to drop trailing batches to even out the ranks, rather than repeating batches.
+            seed (int): Base random seed, shared by all ranks.
+            num_replicas (Optional[int]): Number of distributed ranks. Defaults to the torch.distributed world size.
+            rank (Optional[int]): Rank of this process. Defaults to the torch.distributed rank.
+
+        Raises:
+            ValueError: If a limit is not positive, or the rank is out of range.
+        """
+        if max_doms < 1 or pool_size < 1 or (max_events is not None and max_events < 1):
+            raise ValueError(f"max_doms, max_events and pool_size must be positive, got {max_doms}, {max_events} and {pool_size}")
+
+        distributed = dist.is_available() and dist.is_initialized()
+        self.num_replicas = num_replicas or (dist.get_world_size() if distributed else 1)
+        self.rank = rank if rank is not None else (dist.get_rank() if distributed else 0)
+        if not 0 <= self.rank < self.num_replicas:
+            raise ValueError(f"Invalid rank {self.rank} for {self.num_replicas} replicas")
+
+        self.dom_counts = np.asarray(data.dom_counts, dtype=np.int64)
+        self.max_doms = max_doms
+        self.max_events = max_events
+        self.pool_size = pool_size
+        self.padded = padded
+        self.shuffle = shuffle
+        self.drop_last = drop_last
+        self.seed = seed
+        self.epoch = 0
+
+        self._batches: Optional[list[list[int]]] = None
+
+    def set_epoch(self, epoch: int) -> None:
+        """
+        Set the epoch, so each epoch draws different but reproducible batches.
+
+        Args:
+            epoch (int): Epoch number.
+        """
+        if epoch != self.epoch:
+            self.epoch = epoch
+            self._batches = None
+
+    def __len__(self) -> int:
+        return len(self._rank_batches())
+
+    def __iter__(self) -> Iterator[list[int]]:
+        return iter(self._rank_batches())
+
+    def _rank_batches(self) -> list[list[int]]:
+        """
+        Batches of this rank for the current epoch.
+
+        Returns:
+            list[list[int]]: Dataset indices of each batch.
+        """
+        if self._batches is None:
+            self._batches = self.build_batches()
+
+        batches = self._batches
+        if self.num_replicas == 1:
+            return batches
+
+        if self.drop_last:
+            per_rank = len(batches) // self.num_replicas
+        else:
+            per_rank = -(-len(batches) // self.num_replicas)
+            padding = per_rank * self.num_replicas - len(batches)
+            batches = batches + (batches * (padding // max(len(batches), 1) + 1))[:padding]
+        return batches[self.rank:per_rank * self.num_replicas:self.num_replicas]
+
+    def build_batches(self) -> list[list[int]]:
+        """
+        Pack all events into batches for the current epoch, as seen by every rank.
+
+        Returns:
+            list[list[int]]: Dataset indices of each batch.
+        """
+        rng = np.random.default_rng((self.seed, self.epoch))
+        order = rng.permutation(len(self.dom_counts)) if self.shuffle else np.arange(len(self.dom_counts))
+
+        batches: list[list[int]] = []
+        for start in range(0, len(order), self.pool_size):
+            pool = order[start:start + self.pool_size]
+            # stable sort, so the packing only depends on the shuffled order
+            pool = pool[np.argsort(self.dom_counts[pool], kind="stable")]
+            batches.extend(self._pack(pool))
+
+        if self.shuffle:
+            batches = [batches[i] for i in rng.permutation(len(batches))]
+        return batches
+
+    def _pack(self, indices: np.ndarray) -> list[list[int]]:
+        """
+        Greedily pack indices, sorted by DOM count, into batches within the budget.
+
+        Args:
+            indices (np.ndarray): Dataset indices in ascending DOM count order.
+
+        Returns:
+            list[list[int]]: Dataset indices of each batch.
+        """
+        batches: list[list[int]] = []
+        batch: list[int] = []
+        total = 0
+        for idx, count in zip(indices.tolist(), self.dom_counts[indices].tolist()):
+            # ascending order, so the newest event is the largest of the batch
+            cost = (len(batch) + 1) * count if self.padded else total + count
+            full = self.max_events is not None and len(batch) >= self.max_events
+            if batch and (cost > self.max_doms or full):
+                batches.append(batch)
+                batch, total = [], 0
+            batch.append(idx)
+            total += count
+
+        if batch:
+            batches.append(batch)
+        return batches
@@ -0,0 +1,135 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+import torch
+import torch.distributed as dist
+
+
+__all__ = ["RowGroupSharding"]
+
+@dataclass(frozen=True)
+class RowGroupSharding:
+    """
+    Assigns every distributed rank a contiguous run of row groups, so each rank reads its own region of the
+    features files sequentially and only loads the truth rows of the events in it.
+
+    Row groups are laid out on a ring in file order, each weighted by the number of events starting in it, and the
+    ring is cut into `num_replicas` arcs of equal weight. Every epoch the cuts are rotated by an offset drawn from
+    (seed, epoch), so all ranks agree on the shards without communicating and each rank sees different data from
+    epoch to epoch. Cuts are snapped to row group boundaries, so shards are balanced up to one row group.
+
+    Attributes:
+        num_replicas (int): Number of distributed ranks.
+        rank (int): Rank of this process.
+        seed (int): Base random seed of the rotation, shared by all ranks.
+        drop_last (bool): Whether to even out the ranks by dropping events of the larger shards, rather than
+            repeating events of the smaller ones.
+        even (Optional[bool]): Whether to even out the ranks, so they all step the same number of times. Defaults
+            to the training split only: validation and test shards hold every event exactly once, and may differ
+            in length by up to a row group.
+    """
+    num_replicas: int
+    rank: int
+    seed: int = 0
+    drop_last: bool = False
+    even: Optional[bool] = None
+
+    def __post_init__(self) -> None:
+        if not 0 <= self.rank < self.num_replicas:
+            raise ValueError(f"Invalid rank {self.rank} for {self.num_replicas} replicas")
+
+    @classmethod
+    def from_distributed(cls, seed: int = 0, drop_last: bool = False, even: Optional[bool] = None) -> "RowGroupSharding":
+        """
+        Shard over the ranks of the initialized torch.distributed process group.
+
+        Args:
+            seed (int): Base random seed of the rotation, shared by all ranks.
+            drop_last (bool): Whether to drop events rather than repeat them to even out the ranks.
+            even (Optional[bool]): Whether to even out the ranks. Defaults to the training split only.
+
+        Returns:
+            RowGroupSharding: Sharding of this rank.
+
+        Raises:
+            RuntimeError: If torch.distributed is not initialized.
+        """
+        if not (dist.is_available() and dist.is_initialized()):
+            raise RuntimeError("torch.distributed must be initialized to shard over its ranks")
+        return cls(dist.get_world_size(), dist.get_rank(), seed, drop_last, even)
+
+    def owners(self, weights: np.ndarray, epoch: int = 0) -> np.ndarray:
+        """
+        Rank owning each row group in the given epoch.
+
+        Args:
+            weights (np.ndarray): Weight (e.g. number of events) of each row group, in file order.
+            epoch (int): Epoch number.
+
+        Returns:
+            np.ndarray: Rank of each row group.
+        """
+        weights = np.asarray(weights, dtype=np.float64)
+        total = weights.sum()
+        if not len(weights) or total <= 0:
+            return np.zeros(len(weights), dtype=np.int64)
+
+        offset = np.random.default_rng((self.seed, epoch)).random() * total
+        # position of the middle of each row group on the rotated ring
+        centers = (np.cumsum(weights) - weights / 2 - offset) % total
+        return np.minimum((centers * self.num_replicas / total).astype(np.int64), self.num_replicas - 1)
+
+    def select(self, weights: np.ndarray, epoch: int = 0) -> np.ndarray:
+        """
+        Row groups of this rank in the given epoch, in ring order from the rotated cut.
+
+        Args:
+            weights (np.ndarray): Weight (e.g. number of events) of each row group, in file order.
+            epoch (int): Epoch number.
+
+        Returns:
+            np.ndarray: Row group indices of this rank.
+        """
+        selected = np.flatnonzero(self.owners(weights, epoch) == self.rank)
+        # an arc crossing the end of the files continues at their start
+        if len(selected) and (gaps := np.flatnonzero(np.diff(selected) > 1)).size:
+            selected = np.roll(selected, -(gaps[0] + 1))
+        return selected
+
+    def is_even(self, subset: str) -> bool:
+        """
+        Whether the ranks are evened out for a split, see `even`.
+
+        Args:
+            subset (str): Split name, e.g. 'train'.
+
+        Returns:
+            bool: True if every rank should step the same number of times.
+        """
+        return subset == "train" if self.even is None else self.even
+
+    def equalize(self, length: int) -> int:
+        """
+        Dataset length shared by all ranks, so every rank steps the same number of times: the largest shard length,
+        or the smallest with `drop_last`.
+
+        Requires an initialized torch.distributed process group; otherwise the given length is returned.
+
+        Args:
+            length (int): Dataset length of this rank.
+
+        Returns:
+            int: Length every rank should have.
+        """
+        if not (dist.is_available() and dist.is_initialized()):
+            return length
+
+        value = torch.tensor([length], dtype=torch.int64)
+        if dist.get_backend() == "nccl":
+            value = value.cuda()
+        dist.all_reduce(value, op=dist.ReduceOp.MIN if self.drop_last else dist.ReduceOp.MAX)
+        return int(value.item())
@@ -0,0 +1,333 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+import atexit
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional, Union, TYPE_CHECKING
+
+import xxhash
+from filelock import FileLock, Timeout
+
+from icegraph.config import IGConfig
+from icegraph.console import Console
+from icegraph.profiling import Profiler
+from icegraph.data.checkpoint import atomic_path
+
+if TYPE_CHECKING:
+    from fsspec import AbstractFileSystem
+
+
+__all__ = ["StagingCache"]
+
+class StagingCache:
+    """
+    Copies converted datasets from shared storage to node-local scratch on first use, so the random reads
+    of DataLoader workers hit local disk.
+
+    Every dataset is staged once per node into '<directory>/<key>', keyed by a hash of its source path, and
+    is shared by all jobs on the node. Files are streamed to scratch while hashing them, and the copy is
+    published atomically with a manifest of the size, modification time and xxhash checksum of every file.
+    A staged copy is reused while the sizes and modification times of its source still match the manifest.
+
+    Jobs hold a lease on each dataset they use, released at exit. When staging a dataset would exceed
+    `staging.max_size_gb` or the free space of the scratch disk, the least recently used datasets without
+    a lease are evicted. A dataset that still does not fit is read from shared storage, through an fsspec
+    block cache on scratch with `staging.fallback: blockcache`.
+
+    Attributes:
+        root (Path): Staging directory.
+        max_bytes (int): Total size of the staged datasets kept on the node.
+    """
+
+    MANIFEST_SUFFIX = ".json"
+    BLOCKS_SUFFIX = ".blocks"
+    LEASES_SUFFIX = ".leases"
+
+    # bytes read per copy and hash step
+    CHUNK_BYTES = 16 * 1024 * 1024
+
+    def __init__(self, config: IGConfig) -> None:
+        """
+        Initialize the staging cache of this node.
+
+        Args:
+            config (IGConfig): IceGraph configuration object containing user settings.
+        """
+        self.settings = config.compiled.staging
+        root = self.settings.directory or Path(tempfile.gettempdir()) / "icegraph-staging"
+        root.mkdir(parents=True, exist_ok=True)
+        self.root = root.resolve()
+        self.max_bytes = int(self.settings.max_size_gb * 1024 ** 3)
+
+    @staticmethod
+    def key(source: Union[str, Path]) -> str:
+        """
+        Key of a dataset in the staging directory.
+
+        Args:
+            source (Union[str, Path]): Converted directory on shared storage.
+
+        Returns:
+            str: Hash of the resolved source path.
+        """
+        return xxhash.xxh64(str(Path(source).resolve()).encode()).hexdigest()
+
+    def _lock(self, name: str) -> FileLock:
+        return FileLock(self.root / f"{name}.lock")
+
+    def stage(self, source: Union[str, Path]) -> Path:
+        """
+        Stage a converted dataset to scratch, or reuse its staged copy.
+
+        Args:
+            source (Union[str, Path]): Converted directory on shared storage.
+
+        Returns:
+            Path: The staged copy, or the source if it cannot be staged.
+        """
+        source = Path(source).resolve()
+        if source.is_relative_to(self.root):
+            return source
+        key = self.key(source)
+        staged = self.root / key
+
+        files = self._source_files(source)
+        size = sum(stat[0] for stat in files.values())
+
+        with Profiler.stage("staging.stage"), self._lock(key):
+            self._lease(key)
+            if self._is_current(key, files):
+                os.utime(self._manifest(key))
+                Profiler.count("staging.hits")
+                return staged
+
+            Profiler.count("staging.misses")
+            self._remove(key)
+            # copies are serialized on the node, so the space made for one is not taken by another
+            with self._lock(".staging"):
+                if not self._make_room(size, keep=key):
+                    Console.out(
+                        f"Not enough scratch space to stage {source} ({size / 1024 ** 3:.1f} GB), "
+                        f"reading it from shared storage",
+                        severity=2
+                    )
+                    if (blocks := self.root / f"{key}{self.BLOCKS_SUFFIX}").is_dir():
+                        os.utime(blocks)
+                    return source
+
+                # a block cache from earlier reads is superseded by the staged copy
+                self._remove(key, blocks=True)
+                Console.out(f"Staging {source} to {staged}")
+                manifest = self._copy(source, staged, files)
+                with atomic_path(self._manifest(key)) as tmp:
+                    tmp.write_text(json.dumps(manifest, indent=2))
+
+        return staged
+
+    def filesystem(self, data_dir: Union[str, Path]) -> Optional["AbstractFileSystem"]:
+        """
+        Filesystem to read a dataset through: an fsspec block cache on scratch for a dataset that could not be
+        staged, so blocks read once are read from scratch afterwards.
+
+        Args:
+            data_dir (Union[str, Path]): Directory returned by StagingCache.stage.
+
+        Returns:
+            Optional[AbstractFileSystem]: Caching filesystem, or None to read the directory directly.
+        """
+        data_dir = Path(data_dir)
+        if self.settings.fallback == "none" or data_dir.is_relative_to(self.root):
+            return None
+
+        import fsspec
+
+        return fsspec.filesystem(
+            "blockcache",
+            target_protocol="file",
+            cache_storage=str(self.root / f"{self.key(data_dir)}{self.BLOCKS_SUFFIX}")
+        )
+
+    def _manifest(self, key: str) -> Path:
+        return self.root / f"{key}{self.MANIFEST_SUFFIX}"
+
+    @staticmethod
+    def _source_files(source: Path) -> dict[str, tuple[int, int]]:
+        """
+        Size and modification time of every file of a dataset, by path relative to it.
+        """
+        files = {}
+        for path in sorted(source.rglob("*")):
+            if path.is_file():
+                stat = path.stat()
+                files[path.relative_to(source).as_posix()] = (stat.st_size, stat.st_mtime_ns)
+        return files
+
+    def _is_current(self, key: str, files: dict[str, tuple[int, int]]) -> bool:
+        """
+        Whether a complete staged copy of the given source files exists.
+        """
+        try:
+            manifest = json.loads(self._manifest(key).read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return False
+
+        staged = {name: (entry["size"], entry["mtime_ns"]) for name, entry in manifest["files"].items()}
+        if staged != files:
+            return False
+        # catch staged files truncated or removed by scratch cleanup
+        return all(
+            (path := self.root / key / name).is_file() and path.stat().st_size == size
+            for name, (size, _) in files.items()
+        )
+
+    def _copy(self, source: Path, staged: Path, files: dict[str, tuple[int, int]]) -> dict:
+        """
+        Stream every file of a dataset to scratch, hashing it on the way, and publish the copy atomically.
+
+        Returns:
+            dict: Manifest of the staged copy.
+
+        Raises:
+            OSError: If a staged file does not match its source.
+        """
+        manifest = {"source": str(source), "timestamp": time.time(), "files": {}}
+        progress = Console.progress(f"Staging {source.name}", total=len(files), unit="files")
+
+        with progress, atomic_path(staged) as tmp:
+            for name, (size, mtime_ns) in files.items():
+                target = tmp / name
+                target.parent.mkdir(parents=True, exist_ok=True)
+
+                digest = xxhash.xxh64()
+                with open(source / name, "rb") as src, open(target, "wb") as dst:
+                    while chunk := src.read(self.CHUNK_BYTES):
+                        digest.update(chunk)
+                        dst.write(chunk)
+
+                checksum = digest.hexdigest()
+                if target.stat().st_size != size:
+                    raise OSError(f"Staged size of {source / name} does not match its source")
+                if self.settings.checksum and self._checksum(target) != checksum:
+                    raise OSError(f"Staged checksum of {source / name} does not match its source")
+
+                manifest["files"][name] = {"size": size, "mtime_ns": mtime_ns, "xxh64": checksum}
+                Profiler.count("staging.stage.bytes", size)
+                progress.update(1, nbytes=size)
+
+        return manifest
+
+    def _checksum(self, path: Path) -> str:
+        """
+        xxhash checksum of a file.
+        """
+        digest = xxhash.xxh64()
+        with open(path, "rb") as f:
+            while chunk := f.read(self.CHUNK_BYTES):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _lease(self, key: str) -> None:
+        """
+        Record that this process uses a dataset, so it is not evicted until the process exits.
+        """
+        lease = self.root / f"{key}{self.LEASES_SUFFIX}" / str(os.getpid())
+        if lease.exists():
+            return
+        lease.parent.mkdir(exist_ok=True)
+        lease.touch()
+        atexit.register(lease.unlink, missing_ok=True)
+
+    def _leased(self, key: str) -> bool:
+        """
+        Whether any live process holds a lease on a dataset. Leases of processes that died are removed.
+        """
+        leased = False
+        for lease in (self.root / f"{key}{self.LEASES_SUFFIX}").glob("*"):
+            try:
+                os.kill(int(lease.name), 0)
+                leased = True
+            except ProcessLookupError:
+                lease.unlink(missing_ok=True)
+            except (PermissionError, ValueError):
+                # a process of another user, or not a lease
+                leased = True
+        return leased
+
+    def _entries(self) -> list[tuple[float, int, str]]:
+        """
+        Staged datasets and block caches, least recently used first.
+
+        Returns:
+            list[tuple[float, int, str]]: Last use, size on disk and key of every dataset.
+        """
+        keys = {
+            path.name.removesuffix(suffix)
+            for suffix in (self.MANIFEST_SUFFIX, self.BLOCKS_SUFFIX)
+            for path in self.root.glob(f"*{suffix}")
+        }
+        entries = []
+        for key in keys:
+            paths = [self._manifest(key), self.root / f"{key}{self.BLOCKS_SUFFIX}"]
+            last_used = max((p.stat().st_mtime for p in paths if p.exists()), default=0.0)
+            size = sum(self._disk_usage(path) for path in (self.root / key, paths[1]))
+            entries.append((last_used, size, key))
+        return sorted(entries)
+
+    @staticmethod
+    def _disk_usage(path: Path) -> int:
+        """
+        Bytes allocated to a directory, counting sparse block cache files at their allocated size.
+        """
+        if not path.is_dir():
+            return 0
+        return sum(p.stat().st_blocks * 512 for p in path.rglob("*") if p.is_file())
+
+    def _make_room(self, size: int, keep: str) -> bool:
+        """
+        Evict the least recently used datasets without a lease until `size` bytes fit on scratch.
+
+        Args:
+            size (int): Bytes to make room for.
+            keep (str): Key of the dataset being staged, which is never evicted.
+
+        Returns:
+            bool: Whether the bytes fit.
+        """
+        entries = [entry for entry in self._entries() if entry[2] != keep]
+        used = sum(entry[1] for entry in entries)
+
+        def fits() -> bool:
+            return used + size <= self.max_bytes and shutil.disk_usage(self.root).free >= size
+
+        for _, entry_size, key in entries:
+            if fits():
+                break
+            try:
+                # skip datasets another job is checking out or staging
+                with self._lock(key).acquire(timeout=0):
+                    if self._leased(key):
+                        continue
+                    Console.out(f"Evicting staged dataset {key} ({entry_size / 1024 ** 3:.1f} GB)")
+                    self._remove(key, blocks=True)
+                    shutil.rmtree(self.root / f"{key}{self.LEASES_SUFFIX}", ignore_errors=True)
+                    used -= entry_size
+                    Profiler.count("staging.evictions")
+            except Timeout:
+                continue
+
+        return fits()
+
+    def _remove(self, key: str, blocks: bool = False) -> None:
+        """
+        Remove the staged copy and manifest of a dataset, and optionally its block cache.
+        """
+        self._manifest(key).unlink(missing_ok=True)
+        paths = [self.root / key] + ([self.root / f"{key}{self.BLOCKS_SUFFIX}"] if blocks else [])
+        for path in paths:
+            if path.is_dir():
+                shutil.rmtree(path)
@@ -0,0 +1,153 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+from pathlib import Path
+from typing import Any, Optional, Union, TYPE_CHECKING
+
+import dask
+import dask.dataframe as dd
+import pandas as pd
+
+from icegraph.config import IGConfig
+from icegraph.profiling import Profiler
+from icegraph.data.checkpoint import atomic_path
+
+if TYPE_CHECKING:
+    from distributed import Client
+
+
+__all__ = ["DatasetStatistics"]
+
+class DatasetStatistics:
+    """
+    Dataset-wide reductions over converted features, computed with Dask.
+
+    Every file and row group of the features data is read in parallel, in either output layout.
+    Reductions run on the cluster configured in `dask` when the Dask backend is enabled (or on the given
+    client), and otherwise on Dask's local threaded scheduler.
+
+    Feature statistics can be stored in the converted directory ('feature_statistics.json'), e.g. by
+    `python -m icegraph build`, and read back without touching the features with DatasetStatistics.load.
+    """
+
+    STATISTICS_FILE = "feature_statistics.json"
+
+    def __init__(self, data_dir: Union[str, Path], config: IGConfig, client: Optional["Client"] = None) -> None:
+        """
+        Initialize the statistics over a converted dataset.
+
+        Args:
+            data_dir (Union[str, Path]): Converted directory, as passed to IGData.
+            config (IGConfig): IceGraph configuration object containing user settings.
+            client (Optional[Client]): Dask client to compute on.
+        """
+        self.data_dir = Path(data_dir)
+        self._config: IGConfig = config
+        self._client = client
+
+        features_dir = self.data_dir / "features"
+        self.features_path = features_dir if features_dir.is_dir() else self.data_dir / "features.parquet"
+        self.feature_columns = list(config.compiled.feature_columns)
+
+    def read(self, columns: list[str]) -> dd.DataFrame:
+        """
+        Lazily read columns of the features data.
+
+        Args:
+            columns (list[str]): Columns to read.
+
+        Returns:
+            dd.DataFrame: Dask DataFrame with one partition per row group.
+        """
+        return dd.read_parquet(self.features_path, columns=columns, split_row_groups=True)
+
+    def compute(self, *collections: Any) -> tuple:
+        """
+        Compute Dask collections on the configured scheduler.
+
+        Args:
+            *collections (Any): Dask collections to compute together, sharing the reads they have in common.
+
+        Returns:
+            tuple: Computed results, in the order given.
+        """
+        if self._client is None and not self._config.compiled.dask.enabled:
+            return dask.compute(*collections)
+
+        from icegraph.cluster import DaskCluster
+
+        with DaskCluster(self._config, self._client) as client:
+            return tuple(client.compute(list(collections), sync=True))
+
+    def feature_statistics(self, columns: Optional[list[str]] = None) -> pd.DataFrame:
+        """
+        Count, mean, standard deviation, minimum and maximum of each feature, over all DOMs.
+
+        Args:
+            columns (Optional[list[str]]): Feature columns to summarize. Defaults to all features.
+
+        Returns:
+            pd.DataFrame: One row per feature, with columns 'count', 'mean', 'std', 'min' and 'max'.
+        """
+        features = self.read(columns or self.feature_columns)
+
+        with Profiler.stage("statistics.features"):
+            count, mean, std, minimum, maximum = self.compute(
+                features.count(), features.mean(), features.std(), features.min(), features.max()
+            )
+
+        return pd.DataFrame({"count": count, "mean": mean, "std": std, "min": minimum, "max": maximum})
+
+    def event_summaries(self, columns: Optional[list[str]] = None) -> pd.DataFrame:
+        """
+        Number of hit DOMs and the sum of each feature, per event.
+
+        Args:
+            columns (Optional[list[str]]): Feature columns to sum. Defaults to all features.
+
+        Returns:
+            pd.DataFrame: One row per event, indexed by event_id, with 'num_doms' and the summed features.
+        """
+        columns = columns or self.feature_columns
+        features = self.read(["event_id", "dom_id"] + columns)
+
+        summaries = features.groupby("event_id").agg({"dom_id": "count", **{col: "sum" for col in columns}})
+
+        with Profiler.stage("statistics.events"):
+            (summaries,) = self.compute(summaries)
+
+        return summaries.rename(columns={"dom_id": "num_doms"})
+
+    def write(self, columns: Optional[list[str]] = None) -> Path:
+        """
+        Compute the feature statistics and store them in the converted directory.
+
+        Args:
+            columns (Optional[list[str]]): Feature columns to summarize. Defaults to all features.
+
+        Returns:
+            Path: Path to the statistics file.
+        """
+        statistics = self.feature_statistics(columns)
+
+        output_path = self.data_dir / self.STATISTICS_FILE
+        with atomic_path(output_path) as tmp:
+            tmp.write_text(statistics.to_json(orient="index", indent=2))
+        return output_path
+
+    @classmethod
+    def load(cls, data_dir: Union[str, Path]) -> Optional[pd.DataFrame]:
+        """
+        Read the feature statistics stored in a converted directory.
+
+        Args:
+            data_dir (Union[str, Path]): Converted directory.
+
+        Returns:
+            Optional[pd.DataFrame]: Statistics as returned by DatasetStatistics.feature_statistics, or None if
+                none were stored.
+        """
+        path = Path(data_dir) / cls.STATISTICS_FILE
+        if not path.exists():
+            return None
+        return pd.read_json(path, orient="index")
@@ -0,0 +1,236 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+from abc import ABC, abstractmethod
+from typing import Optional, Sequence, TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from icegraph.config import IGConfig
+from icegraph.config.schemas import TransformSpec
+
+if TYPE_CHECKING:
+    import torch
+
+
+__all__ = ["Transform", "Log1p", "Log10", "Clip", "Affine", "TransformPipeline", "TRANSFORMS"]
+
+class Transform(ABC):
+    """
+    An element-wise transform, applied in place to a column of a whole batch, as a NumPy array or a torch tensor
+    on any device.
+    """
+
+    @abstractmethod
+    def numpy(self, values: np.ndarray) -> None:
+        """
+        Transform a NumPy array in place.
+        """
+
+    @abstractmethod
+    def torch(self, values: "torch.Tensor") -> None:
+        """
+        Transform a torch tensor in place.
+        """
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(f'{k}={v!r}' for k, v in vars(self).items())})"
+
+
+class Log1p(Transform):
+    """
+    log(1 + x), e.g. for charges.
+    """
+
+    def numpy(self, values: np.ndarray) -> None:
+        np.log1p(values, out=values)
+
+    def torch(self, values: "torch.Tensor") -> None:
+        values.log1p_()
+
+
+class Log10(Transform):
+    """
+    log10(x + offset), e.g. for energies.
+    """
+
+    def __init__(self, offset: float = 0.0) -> None:
+        self.offset = offset
+
+    def numpy(self, values: np.ndarray) -> None:
+        if self.offset:
+            np.add(values, self.offset, out=values)
+        np.log10(values, out=values)
+
+    def torch(self, values: "torch.Tensor") -> None:
+        if self.offset:
+            values.add_(self.offset)
+        values.log10_()
+
+
+class Clip(Transform):
+    """
+    Clip values to [min, max], e.g. for times. Either bound may be left out.
+    """
+
+    def __init__(self, min: Optional[float] = None, max: Optional[float] = None) -> None:
+        self.min = min
+        self.max = max
+
+    def numpy(self, values: np.ndarray) -> None:
+        np.clip(values, self.min, self.max, out=values)
+
+    def torch(self, values: "torch.Tensor") -> None:
+        values.clamp_(self.min, self.max)
+
+
+class Affine(Transform):
+    """
+    x * scale + shift, e.g. to standardize with known statistics.
+    """
+
+    def __init__(self, scale: float = 1.0, shift: float = 0.0) -> None:
+        self.scale = scale
+        self.shift = shift
+
+    def numpy(self, values: np.ndarray) -> None:
+        np.multiply(values, self.scale, out=values)
+        np.add(values, self.shift, out=values)
+
+    def torch(self, values: "torch.Tensor") -> None:
+        values.mul_(self.scale).add_(self.shift)
+
+
+# transforms by the class name used in the `transforms` config section
+TRANSFORMS: dict[str, type[Transform]] = {cls.__name__: cls for cls in (Log1p, Log10, Clip, Affine)}
+
+
+class TransformPipeline:
+    """
+    The feature and label transforms of the `transforms` config section, applied in order to whole batches.
+
+    Each transform runs once per configured column over every row of the batch, in place, with NumPy on arrays
+    and with torch on tensors, so there is no per-sample Python work. Pass the pipeline to collate_events
+    (or use IGData.collate) to transform every batch after collation.
+
+    With `transforms.at_conversion`, the converter applies the same transforms to the data before it is
+    written, and the transforms of the loading stage are empty.
+
+    Attributes:
+        features (list[tuple[str, int, Transform]]): Column name, column index and transform of every feature step.
+        labels (list[tuple[str, int, Transform]]): Column name, column index and transform of every label step.
+    """
+
+    def __init__(
+        self,
+        features: Sequence[TransformSpec],
+        labels: Sequence[TransformSpec],
+        feature_columns: Sequence[str],
+        target_labels: Sequence[str]
+    ) -> None:
+        """
+        Build a pipeline from transform specifications.
+
+        Args:
+            features (Sequence[TransformSpec]): Feature transforms, in order.
+            labels (Sequence[TransformSpec]): Label transforms, in order.
+            feature_columns (Sequence[str]): Feature columns, in feature vector order.
+            target_labels (Sequence[str]): Label columns, in label vector order.
+        """
+        self.features = self._steps(features, feature_columns)
+        self.labels = self._steps(labels, target_labels)
+
+    @classmethod
+    def from_config(cls, config: IGConfig, at_conversion: bool = False) -> "TransformPipeline":
+        """
+        Build the pipeline of the configured transforms for one stage.
+
+        Args:
+            config (IGConfig): IceGraph configuration object containing user settings.
+            at_conversion (bool): Whether to build the transforms applied at conversion, rather than after collation.
+
+        Returns:
+            TransformPipeline: The pipeline, empty if the transforms run at the other stage.
+        """
+        compiled = config.compiled
+        settings = compiled.transforms
+        if settings.at_conversion != at_conversion:
+            return cls((), (), compiled.feature_columns, compiled.target_labels)
+        return cls(settings.features, settings.labels, compiled.feature_columns, compiled.target_labels)
+
+    @staticmethod
+    def _steps(specs: Sequence[TransformSpec], columns: Sequence[str]) -> list[tuple[str, int, Transform]]:
+        """
+        Resolve transform specifications to one step per column.
+        """
+        index = {col: i for i, col in enumerate(columns)}
+        return [
+            (col, index[col], TRANSFORMS[spec.name](**spec.kwargs))
+            for spec in specs
+            for col in spec.columns
+        ]
+
+    def __bool__(self) -> bool:
+        return bool(self.features or self.labels)
+
+    def __call__(
+        self,
+        features: "np.ndarray | torch.Tensor",
+        labels: "np.ndarray | torch.Tensor"
+    ) -> tuple["np.ndarray | torch.Tensor", "np.ndarray | torch.Tensor"]:
+        """
+        Transform a collated batch in place.
+
+        Args:
+            features (np.ndarray | torch.Tensor): Features of shape (num_DOMs, num_features).
+            labels (np.ndarray | torch.Tensor): Labels of shape (num_events, num_labels).
+
+        Returns:
+            tuple[np.ndarray | torch.Tensor, np.ndarray | torch.Tensor]: The transformed features and labels.
+        """
+        return self._apply(self.features, features), self._apply(self.labels, labels)
+
+    def transform_features(self, features: "np.ndarray | torch.Tensor") -> "np.ndarray | torch.Tensor":
+        """
+        Transform features of shape (num_DOMs, num_features) in place.
+        """
+        return self._apply(self.features, features)
+
+    def transform_labels(self, labels: "np.ndarray | torch.Tensor") -> "np.ndarray | torch.Tensor":
+        """
+        Transform labels of shape (num_events, num_labels) in place.
+        """
+        return self._apply(self.labels, labels)
+
+    @staticmethod
+    def _apply(steps: list[tuple[str, int, Transform]], values: "np.ndarray | torch.Tensor") -> "np.ndarray | torch.Tensor":
+        """
+        Apply steps to the columns of a 2D array or tensor, in place.
+        """
+        is_numpy = isinstance(values, np.ndarray)
+        for _, i, transform in steps:
+            if is_numpy:
+                transform.numpy(values[:, i])
+            else:
+                transform.torch(values[:, i])
+        return values
+
+    def transform_frame(self, frame: pd.DataFrame, target: str) -> pd.DataFrame:
+        """
+        Transform the columns of a DataFrame, e.g. a features or truth table before it is written. Transformed
+        columns are computed in float64.
+
+        Args:
+            frame (pd.DataFrame): Table holding some of the transformed columns.
+            target (str): Steps to apply, 'features' or 'labels'.
+
+        Returns:
+            pd.DataFrame: The same DataFrame, with transformed columns replaced.
+        """
+        for col, _, transform in getattr(self, target):
+            if col in frame.columns:
+                values = frame[col].to_numpy(np.float64, copy=True)
+                transform.numpy(values)
+                frame[col] = values
+        return frame
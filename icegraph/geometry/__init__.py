@@ -1,4 +1,12 @@
 # Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
 # Developed by Taylor St Jean
 
-from .models import Detector
+from typing import TYPE_CHECKING
+
+from icegraph.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, attributes={"Detector": ".models", "DetectorGrid": ".grid"})
+
+if TYPE_CHECKING:
+    from .models import Detector
+    from .grid import DetectorGrid
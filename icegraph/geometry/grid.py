@@ -0,0 +1,196 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import torch
+
+from icegraph.config import IGConfig
+from icegraph.console import Console
+from icegraph.profiling import Profiler
+
+
+__all__ = ["DetectorGrid"]
+
+class DetectorGrid:
+    """
+    A fixed (string, om) grid of the detector, for models which take events as dense detector tensors of shape
+    (num_strings, num_oms, num_features) rather than lists of hit DOMs.
+
+    Rows are the strings of the geometry and columns its OM numbers, both in increasing order. A lookup table from
+    (string, om) to the flat grid cell is built once, so the DOMs of a whole batch are placed with a single
+    vectorized lookup and a single scatter. DOMs outside of the grid (e.g. IceTop DOMs) are left out and counted,
+    and the PMTs of a multi-PMT module share its cell, their features summed, so that the dense and the (coalesced)
+    sparse grids agree.
+
+    Attributes:
+        strings (np.ndarray): String number of each row.
+        oms (np.ndarray): OM number of each column.
+        dropped_doms (int): Number of DOMs left out of the grids built so far, also counted by the profiler as
+            'grid.dropped_doms'.
+    """
+
+    # IceCube in-ice geometry, used without a readable GCD file
+    ICECUBE_STRINGS = 86
+    ICECUBE_OMS = 60
+
+    def __init__(self, doms: np.ndarray) -> None:
+        """
+        Build the grid spanning the given DOMs.
+
+        Args:
+            doms (np.ndarray): (string, om) of each DOM of the geometry, of shape (num_DOMs, 2). Further
+                columns (e.g. PMT) are ignored.
+        """
+        doms = np.asarray(doms, dtype=np.int64).reshape(len(doms), -1)
+        self.strings = np.unique(doms[:, 0])
+        self.oms = np.unique(doms[:, 1])
+
+        # dense (string, om) -> cell table, -1 outside of the grid
+        self._table = np.full((self.strings.max() + 1, self.oms.max() + 1), -1, dtype=np.int64)
+        rows = np.searchsorted(self.strings, doms[:, 0])
+        columns = np.searchsorted(self.oms, doms[:, 1])
+        self._table[doms[:, 0], doms[:, 1]] = rows * len(self.oms) + columns
+        self.dropped_doms = 0
+
+    @classmethod
+    def icecube(cls) -> "DetectorGrid":
+        """
+        The grid of the IceCube in-ice DOMs: strings 1 to 86, OMs 1 to 60.
+
+        Returns:
+            DetectorGrid: The 86 x 60 grid.
+        """
+        strings, oms = np.meshgrid(np.arange(1, cls.ICECUBE_STRINGS + 1), np.arange(1, cls.ICECUBE_OMS + 1), indexing="ij")
+        return cls(np.column_stack([strings.ravel(), oms.ravel()]))
+
+    @classmethod
+    def from_config(cls, config: IGConfig, max_om: int = ICECUBE_OMS) -> "DetectorGrid":
+        """
+        The grid of the geometry in the configured GCD file, or of the IceCube in-ice DOMs if the GCD file
+        cannot be read here (e.g. without IceTray), with a warning. DOMs of the data outside of the fallback grid
+        are then reported as they are left out.
+
+        Args:
+            config (IGConfig): IceGraph configuration object containing user settings.
+            max_om (int): Highest OM number of the grid. Defaults to the in-ice DOMs.
+
+        Returns:
+            DetectorGrid: The detector grid.
+        """
+        from icegraph.geometry.models import Detector, dataio
+
+        if dataio is None or not Path(config.compiled.gcd_path).is_file():
+            Console.out(
+                f"GCD file {config.compiled.gcd_path} not readable here, using the IceCube in-ice detector grid "
+                f"({cls.ICECUBE_STRINGS} strings x {cls.ICECUBE_OMS} OMs) instead of the configured geometry",
+                severity=2
+            )
+            return cls.icecube()
+        return Detector(config).grid(max_om)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """
+        Number of strings and OMs of the grid.
+        """
+        return len(self.strings), len(self.oms)
+
+    @property
+    def num_cells(self) -> int:
+        """
+        Number of cells of the grid.
+        """
+        return len(self.strings) * len(self.oms)
+
+    def cells(self, doms: np.ndarray) -> np.ndarray:
+        """
+        Flat grid cell of many DOMs at once.
+
+        Args:
+            doms (np.ndarray): (string, om) of each DOM, of shape (num_DOMs, 2).
+
+        Returns:
+            np.ndarray: Cell index (string row * num_oms + om column) of each DOM, -1 for DOMs outside of the grid.
+        """
+        doms = np.asarray(doms, dtype=np.int64).reshape(len(doms), -1)
+        strings, oms = doms[:, 0], doms[:, 1]
+        inside = (strings >= 0) & (strings < self._table.shape[0]) & (oms >= 0) & (oms < self._table.shape[1])
+
+        cells = np.full(len(doms), -1, dtype=np.int64)
+        cells[inside] = self._table[strings[inside], oms[inside]]
+        return cells
+
+    def scatter(
+        self,
+        features: torch.Tensor,
+        cells: torch.Tensor,
+        batch: torch.Tensor,
+        num_events: int,
+        out: Optional[torch.Tensor] = None
+    ) -> torch.Tensor:
+        """
+        Scatter the DOM features of a batch into a dense grid, in one indexed add. DOMs sharing a cell are summed.
+
+        Args:
+            features (torch.Tensor): Features of all DOMs, of shape (total_DOMs, num_features).
+            cells (torch.Tensor): Grid cell of each DOM, of shape (total_DOMs,), -1 for DOMs left out.
+            batch (torch.Tensor): Index of the event each DOM belongs to, of shape (total_DOMs,).
+            num_events (int): Number of events of the batch.
+            out (Optional[torch.Tensor]): Preallocated grid to reuse, of at least num_events * num_cells * num_features
+                elements and the dtype of the features. Allocated when not given.
+
+        Returns:
+            torch.Tensor: Grid of shape (num_events, num_strings, num_oms, num_features), zero where no DOM was hit.
+        """
+        size = (num_events, self.num_cells, features.shape[1])
+        if out is None:
+            grid = features.new_zeros(size)
+        else:
+            grid = out.view(-1)[:num_events * self.num_cells * features.shape[1]].view(size).zero_()
+
+        keep = self._keep(cells)
+        # an indexed add rather than an indexed write, whose result is undefined for duplicate cells
+        grid.view(-1, features.shape[1]).index_add_(0, batch[keep] * self.num_cells + cells[keep], features[keep])
+        return grid.view(num_events, *self.shape, features.shape[1])
+
+    def sparse(self, features: torch.Tensor, cells: torch.Tensor, batch: torch.Tensor, num_events: int) -> torch.Tensor:
+        """
+        The grid of a batch as a sparse COO tensor, storing only the hit cells. The feature dimension is dense.
+        DOMs sharing a cell are separate entries, summed on coalescing.
+
+        Args:
+            features (torch.Tensor): Features of all DOMs, of shape (total_DOMs, num_features).
+            cells (torch.Tensor): Grid cell of each DOM, of shape (total_DOMs,), -1 for DOMs left out.
+            batch (torch.Tensor): Index of the event each DOM belongs to, of shape (total_DOMs,).
+            num_events (int): Number of events of the batch.
+
+        Returns:
+            torch.Tensor: Uncoalesced sparse tensor of shape (num_events, num_strings, num_oms, num_features).
+        """
+        keep = self._keep(cells)
+        cells = cells[keep]
+        num_oms = len(self.oms)
+        indices = torch.stack([batch[keep], cells // num_oms, cells % num_oms])
+        return torch.sparse_coo_tensor(
+            indices, features[keep], size=(num_events, *self.shape, features.shape[1]), check_invariants=False
+        )
+
+    def _keep(self, cells: torch.Tensor) -> torch.Tensor:
+        """
+        Mask of the DOMs inside of the grid, counting the others and reporting the first ones left out.
+        """
+        keep = cells >= 0
+        dropped = len(cells) - int(keep.sum())
+        if dropped:
+            if not self.dropped_doms:
+                Console.out(
+                    f"{dropped} DOMs outside of the {self.shape[0]} x {self.shape[1]} detector grid left out of a "
+                    "batch (e.g. IceTop DOMs), further ones are counted as 'grid.dropped_doms'",
+                    severity=2
+                )
+            self.dropped_doms += dropped
+            Profiler.count("grid.dropped_doms", dropped)
+        return keep
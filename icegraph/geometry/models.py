@@ -1,13 +1,23 @@
 # Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
 # Developed by Taylor St Jean
 
-from typing import Any
+import threading
+from pathlib import Path
+from typing import Any, TYPE_CHECKING
+
+import numpy as np
 
 from icegraph.config import IGConfig
 from .exceptions import GeometryFrameNotFound
 
-from icecube.icetray import OMKey
-from icecube import dataio
+if TYPE_CHECKING:
+    from .grid import DetectorGrid
+
+# have to wrap in try/except block so sphinx can properly generate docs
+try:
+    from icecube import dataio
+except ImportError:
+    dataio = None
 
 
 class Detector:
@@ -17,8 +27,16 @@ class Detector:
 
     This class loads the I3Geometry frame from a GCD file and provides
     utility methods for retrieving DOM positions using string/OM/PMT info.
+
+    Each GCD file is read once per process: the geometry and a sorted table of DOM keys and
+    positions are shared by every Detector built for the same file, so positions of many DOMs
+    can be looked up with a single vectorized call.
     """
 
+    # gcd path -> (OMGeo map, sorted packed DOM keys, DOM positions)
+    _cache: dict[Path, tuple[Any, np.ndarray, np.ndarray]] = {}
+    _cache_lock = threading.Lock()
+
     def __init__(self, config: IGConfig) -> None:
         """
         Initialize the Detector object with IceGraph configuration.
@@ -30,11 +48,54 @@ class Detector:
 
         # initialize gcd geometry frame cache and load to memory
         self._gcd_geometry: Any | None = None
+        self._dom_keys: np.ndarray = np.empty(0, dtype=np.int64)
+        self._positions: np.ndarray = np.empty((0, 3), dtype=np.float64)
         self._load_gcd()
 
+    @classmethod
+    def from_positions(cls, config: IGConfig, doms: np.ndarray, positions: np.ndarray) -> "Detector":
+        """
+        Build a detector from a known table of DOM positions instead of a GCD file.
+
+        Args:
+            config (IGConfig): IceGraph configuration object containing user settings.
+            doms (np.ndarray): (string, om, pmt) of each DOM, of shape (num_DOMs, 3).
+            positions (np.ndarray): (x, y, z) of each DOM, of shape (num_DOMs, 3).
+
+        Returns:
+            Detector: Detector without an OMGeo map, supporting position lookups only.
+        """
+        detector = cls.__new__(cls)
+        detector._config = config
+        detector._gcd_geometry = None
+        detector._dom_keys, detector._positions = cls._position_table(doms, positions)
+        return detector
+
     def _load_gcd(self) -> None:
         """
-        Load the I3Geometry frame from the GCD file and store the OMGeo map.
+        Load the I3Geometry frame from the GCD file and store the OMGeo map and position table.
+
+        Raises:
+            GeometryFrameNotFound: If the I3Geometry frame cannot be found in the file.
+        """
+        path = Path(self._config.gcd_path).resolve()
+        with self._cache_lock:
+            if path not in self._cache:
+                omgeo = self._read_geometry()
+                doms = np.array([(key.string, key.om, key.pmt) for key in omgeo.keys()], dtype=np.int64)
+                positions = np.array(
+                    [(geo.position.x, geo.position.y, geo.position.z) for geo in omgeo.values()], dtype=np.float64
+                )
+                self._cache[path] = (omgeo, *self._position_table(doms, positions))
+
+        self._gcd_geometry, self._dom_keys, self._positions = self._cache[path]
+
+    def _read_geometry(self) -> Any:
+        """
+        Read the OMGeo map of the I3Geometry frame of the GCD file.
+
+        Returns:
+            I3OMGeoMap: Geometry of every DOM.
 
         Raises:
             GeometryFrameNotFound: If the I3Geometry frame cannot be found in the file.
@@ -52,7 +113,63 @@ class Detector:
         if not geometry:
             raise(GeometryFrameNotFound(f"I3Geometry does not exist in GCD file: {self._config.gcd_path}"))
 
-        self._gcd_geometry = geometry.omgeo
+        return geometry.omgeo
+
+    @staticmethod
+    def _pack_keys(doms: np.ndarray) -> np.ndarray:
+        """
+        Pack (string, om[, pmt]) rows into single sortable integers. A missing PMT column is taken as PMT 0.
+        """
+        doms = np.asarray(doms, dtype=np.int64).reshape(len(doms), -1)
+        pmt = doms[:, 2] if doms.shape[1] > 2 else 0
+        return (doms[:, 0] << 32) | (doms[:, 1] << 12) | pmt
+
+    @classmethod
+    def _position_table(cls, doms: np.ndarray, positions: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Sort DOM positions by packed key, for lookups with np.searchsorted.
+        """
+        keys = cls._pack_keys(doms)
+        order = np.argsort(keys)
+        return keys[order], np.asarray(positions, dtype=np.float64)[order]
+
+    def dom_positions(self, doms: np.ndarray) -> np.ndarray:
+        """
+        Get the (x, y, z) coordinates of many DOMs at once.
+
+        Args:
+            doms (np.ndarray): (string, om, pmt) of each DOM, of shape (num_DOMs, 3). With only
+                (string, om) columns, PMT 0 is assumed.
+
+        Returns:
+            np.ndarray: (x, y, z) of each DOM, of shape (num_DOMs, 3).
+
+        Raises:
+            KeyError: If a DOM is not part of the geometry.
+        """
+        keys = self._pack_keys(doms)
+        idx = np.minimum(np.searchsorted(self._dom_keys, keys), max(len(self._dom_keys) - 1, 0))
+        found = self._dom_keys[idx] == keys if len(self._dom_keys) else np.zeros(len(keys), dtype=bool)
+        if not found.all():
+            missing = np.asarray(doms)[~found][0].tolist()
+            raise KeyError(f"{(~found).sum()} DOMs not found in the geometry, e.g. {missing}")
+        return self._positions[idx]
+
+    def grid(self, max_om: int = 60) -> "DetectorGrid":
+        """
+        The (string, om) grid of the geometry, see DetectorGrid.
+
+        Args:
+            max_om (int): Highest OM number of the grid. Defaults to the in-ice DOMs, leaving out IceTop.
+
+        Returns:
+            DetectorGrid: Grid of the DOMs of the geometry.
+        """
+        from .grid import DetectorGrid
+
+        strings, oms = self._dom_keys >> 32, (self._dom_keys >> 12) & 0xFFFFF
+        in_grid = oms <= max_om
+        return DetectorGrid(np.column_stack([strings[in_grid], oms[in_grid]]))
 
     def get_dom_coords(self, string: int, om: int, pmt: int) -> tuple[float, float, float]:
         """
@@ -66,6 +183,5 @@ class Detector:
         Returns:
             tuple[float, float, float]: The (x, y, z) position of the specified DOM.
         """
-        omkey = OMKey(int(string), int(om), int(pmt))
-        position = self._gcd_geometry[omkey].position
-        return position.x, position.y, position.z
+        x, y, z = self.dom_positions(np.array([[string, om, pmt]]))[0]
+        return float(x), float(y), float(z)
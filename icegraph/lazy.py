@@ -0,0 +1,51 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+import importlib
+from typing import Callable, Iterable, Optional
+
+
+__all__ = ["attach"]
+
+def attach(
+    package_name: str,
+    submodules: Optional[Iterable[str]] = None,
+    attributes: Optional[dict[str, str]] = None
+) -> tuple[Callable[[str], object], Callable[[], list[str]], list[str]]:
+    """
+    Build module-level `__getattr__` and `__dir__` functions which import submodules and their
+    attributes on first access (PEP 562), so importing a package does not pull in heavy dependencies
+    (torch, pandas, pyarrow, matplotlib, IceTray) until they are actually used.
+
+    Usage, in a package's `__init__.py`:
+        __getattr__, __dir__, __all__ = attach(__name__, submodules=["render"], attributes={"IGData": ".base"})
+
+    Args:
+        package_name (str): The `__name__` of the package.
+        submodules (Optional[Iterable[str]]): Names of submodules to expose lazily as attributes.
+        attributes (Optional[dict[str, str]]): Mapping from attribute name to the (relative) module defining it.
+
+    Returns:
+        tuple: The package's `__getattr__`, `__dir__` and `__all__`.
+    """
+    submodules = list(submodules or [])
+    attributes = dict(attributes or {})
+    names = submodules + list(attributes)
+
+    def __getattr__(name: str) -> object:
+        if name in attributes:
+            module = importlib.import_module(attributes[name], package_name)
+            value = getattr(module, name)
+        elif name in submodules:
+            value = importlib.import_module(f".{name}", package_name)
+        else:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+
+        # cache on the package so later lookups don't go through __getattr__ again
+        setattr(importlib.import_module(package_name), name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(importlib.import_module(package_name))) | set(names))
+
+    return __getattr__, __dir__, names
@@ -0,0 +1,6 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+from .models import Profiler
+
+__all__ = ["Profiler"]
@@ -0,0 +1,202 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+import os
+import json
+import time
+import atexit
+import threading
+from pathlib import Path
+from contextlib import contextmanager, nullcontext
+from typing import Union, Optional, Iterator, ContextManager
+
+from .objects import Histogram, StageStats
+
+
+__all__ = ["Profiler"]
+
+class Profiler:
+    """
+    Class to collect pipeline instrumentation across the application.
+
+    Records wall time per pipeline stage, named counters (bytes and rows read, cache hits and misses, ...)
+    and latency histograms. Instrumentation is disabled by default; every recording method returns
+    immediately when disabled, and `stage` hands out a shared no-op context manager, so instrumented
+    code paths pay a single attribute check.
+
+    Enable it through the `instrumentation` section of the user config, the `ICEGRAPH_PROFILE`
+    environment variable, or by calling `Profiler.enable()` directly.
+    """
+
+    enabled: bool = os.environ.get("ICEGRAPH_PROFILE", "0") not in ("", "0")
+    report_path: Optional[Path] = None
+
+    _lock = threading.Lock()
+    _null_stage = nullcontext()
+    _stages: dict[str, StageStats] = {}
+    _counters: dict[str, float] = {}
+    _histograms: dict[str, Histogram] = {}
+    _start_time: float = time.time()
+    _atexit_registered: bool = False
+
+    @classmethod
+    def configure(cls, config) -> None:
+        """
+        Enable or disable instrumentation from the `instrumentation` section of the user config.
+
+        Args:
+            config (IGConfig): IceGraph configuration object containing user settings.
+        """
+        settings = config.compiled.instrumentation
+        if settings.enabled:
+            cls.enable(settings.report)
+
+    @classmethod
+    def enable(cls, report_path: Optional[Union[str, Path]] = None) -> None:
+        """
+        Enable instrumentation.
+
+        Args:
+            report_path (Optional[Union[str, Path]]): If given, the JSON report is written here at program exit.
+        """
+        cls.enabled = True
+        if report_path:
+            cls.report_path = Path(report_path)
+        if cls.report_path and not cls._atexit_registered:
+            atexit.register(cls._write_at_exit)
+            cls._atexit_registered = True
+
+    @classmethod
+    def disable(cls) -> None:
+        """
+        Disable instrumentation. Data recorded so far is kept until `reset` is called.
+        """
+        cls.enabled = False
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        Discard all recorded data.
+        """
+        with cls._lock:
+            cls._stages = {}
+            cls._counters = {}
+            cls._histograms = {}
+            cls._start_time = time.time()
+
+    @classmethod
+    def stage(cls, name: str) -> ContextManager:
+        """
+        Time a pipeline stage.
+
+        Usage:
+            with Profiler.stage("converter.read_hdf5"):
+                ...
+
+        Args:
+            name (str): Stage name, dot-separated by component.
+
+        Returns:
+            ContextManager: Context manager recording the wall time of its body.
+        """
+        if not cls.enabled:
+            return cls._null_stage
+        return cls._timed_stage(name)
+
+    @classmethod
+    @contextmanager
+    def _timed_stage(cls, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with cls._lock:
+                cls._stages.setdefault(name, StageStats()).add(elapsed)
+
+    @classmethod
+    def count(cls, name: str, value: float = 1) -> None:
+        """
+        Increment a named counter.
+
+        Args:
+            name (str): Counter name (e.g. 'igdata.read.bytes', 'cache.hits'). Counters
+                prefixed with the name of a timed stage are also reported as a throughput.
+            value (float): Amount to add.
+        """
+        if not cls.enabled:
+            return
+        with cls._lock:
+            cls._counters[name] = cls._counters.get(name, 0) + value
+
+    @classmethod
+    def observe(cls, name: str, seconds: float) -> None:
+        """
+        Add an observation to a named latency histogram.
+
+        Args:
+            name (str): Histogram name (e.g. 'igdata.sample_latency').
+            seconds (float): Observed latency.
+        """
+        if not cls.enabled:
+            return
+        with cls._lock:
+            cls._histograms.setdefault(name, Histogram()).observe(seconds)
+
+    @classmethod
+    def report(cls) -> dict:
+        """
+        Build a report of everything recorded so far.
+
+        Returns:
+            dict: JSON-compatible report with stages, counters, histograms and derived throughputs.
+        """
+        with cls._lock:
+            stages = {name: stats.to_dict() for name, stats in cls._stages.items()}
+            counters = dict(cls._counters)
+            histograms = {name: hist.to_dict() for name, hist in cls._histograms.items()}
+
+        # derive throughputs for counters that share a prefix with a timed stage
+        throughput = {}
+        for name, value in counters.items():
+            prefix = name.rpartition(".")[0]
+            if prefix in stages and stages[prefix]["total_s"] > 0:
+                throughput[f"{name}_per_s"] = value / stages[prefix]["total_s"]
+
+        hits, misses = counters.get("cache.hits", 0), counters.get("cache.misses", 0)
+        if hits + misses:
+            counters["cache.hit_rate"] = hits / (hits + misses)
+
+        return {
+            "pid": os.getpid(),
+            "start_time": cls._start_time,
+            "elapsed_s": time.time() - cls._start_time,
+            "stages": stages,
+            "counters": counters,
+            "throughput": throughput,
+            "histograms": histograms,
+        }
+
+    @classmethod
+    def write_report(cls, path: Optional[Union[str, Path]] = None) -> Path:
+        """
+        Write the report as JSON.
+
+        Args:
+            path (Optional[Union[str, Path]]): Output path. Defaults to the configured report path.
+
+        Returns:
+            Path: Path to the written report.
+        """
+        path = Path(path or cls.report_path or "icegraph_profile.json")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(cls.report(), indent=2))
+        return path
+
+    @classmethod
+    def _write_at_exit(cls) -> None:
+        """
+        Write the report to the configured report path at program exit.
+        """
+        if cls.report_path:
+            cls.write_report(cls.report_path)
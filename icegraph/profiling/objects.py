@@ -0,0 +1,123 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+import bisect
+import math
+
+
+__all__ = ["Histogram", "StageStats"]
+
+class Histogram:
+    """
+    A fixed-bucket latency histogram with logarithmically spaced bucket edges.
+
+    Buckets are fixed up front so that observing a value is a single bisect and two additions,
+    and so that histograms from different processes can be merged by adding bucket counts.
+    """
+
+    # 1 microsecond to 100 seconds, four buckets per decade
+    EDGES: list[float] = [10 ** (exp / 4) for exp in range(-24, 9)]
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty histogram.
+        """
+        self.counts: list[int] = [0] * (len(self.EDGES) + 1)
+        self.total: float = 0.0
+        self.n: int = 0
+        self.min: float = math.inf
+        self.max: float = 0.0
+
+    def observe(self, value: float) -> None:
+        """
+        Add a single observation.
+
+        Args:
+            value (float): Observed value, in seconds.
+        """
+        self.counts[bisect.bisect_left(self.EDGES, value)] += 1
+        self.total += value
+        self.n += 1
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile from the bucket counts.
+
+        Args:
+            q (float): Quantile between 0 and 1.
+
+        Returns:
+            float: Upper edge of the bucket containing the quantile.
+        """
+        if not self.n:
+            return 0.0
+
+        target = q * self.n
+        cumulative = 0
+        for i, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= target:
+                return self.EDGES[i] if i < len(self.EDGES) else self.max
+        return self.max
+
+    def to_dict(self) -> dict:
+        """
+        Serialize the histogram for the JSON report.
+
+        Returns:
+            dict: Summary statistics, bucket edges and non-empty bucket counts.
+        """
+        return {
+            "count": self.n,
+            "mean": self.total / self.n if self.n else 0.0,
+            "min": self.min if self.n else 0.0,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "buckets": {
+                f"<={self.EDGES[i]:.3g}" if i < len(self.EDGES) else f">{self.EDGES[-1]:.3g}": count
+                for i, count in enumerate(self.counts) if count
+            },
+        }
+
+
+class StageStats:
+    """
+    Accumulated wall time of a named pipeline stage.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize empty stage statistics.
+        """
+        self.calls: int = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+
+    def add(self, seconds: float) -> None:
+        """
+        Record one completed run of the stage.
+
+        Args:
+            seconds (float): Wall time of the run.
+        """
+        self.calls += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def to_dict(self) -> dict:
+        """
+        Serialize the stage statistics for the JSON report.
+
+        Returns:
+            dict: Call count, total, mean and max wall time in seconds.
+        """
+        return {
+            "calls": self.calls,
+            "total_s": self.total,
+            "mean_s": self.total / self.calls if self.calls else 0.0,
+            "max_s": self.max,
+        }
@@ -1,4 +1,20 @@
 # Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
 # Developed by Taylor St Jean
 
-from .models import FeaturePlot
+from typing import TYPE_CHECKING
+
+from icegraph.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "FeaturePlot": ".models",
+        "DistributionPlot": ".models",
+        "FeaturePage": ".objects",
+        "FeatureHistogram": ".objects",
+    }
+)
+
+if TYPE_CHECKING:
+    from .models import FeaturePlot, DistributionPlot
+    from .objects import FeaturePage, FeatureHistogram
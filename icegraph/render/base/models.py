@@ -2,6 +2,7 @@
 # Developed by Taylor St Jean
 
 from abc import ABC, abstractmethod
+from functools import cached_property
 import matplotlib.pyplot as plt
 from pathlib import Path
 
@@ -17,14 +18,17 @@ class IGPlot(ABC):
         self._data: IGData = data
         self._config: IGConfig = config
 
-        # init detector object to convert om keys to coords
-        self._detector = Detector(self._config)
-
         # initialize figure
         self._ax: plt.Axes
         self._fig: plt.Figure
         self._fig, self._ax = plt.subplots(1, 1)
 
+    @cached_property
+    def _detector(self) -> Detector:
+        # detector object to convert om keys to coords, only built by plots which need the geometry,
+        # and the geometry is only read once per GCD file
+        return Detector(self._config)
+
     def save(self, path: Path):
         Console.out(f"Saving feature plot: {path}")
         self._fig.savefig(path)
@@ -2,11 +2,18 @@
 # Developed by Taylor St Jean
 
 from .base import IGPlot
-from icegraph.geometry import Detector
-from icegraph.data.converter import generate_vector_mapping
+from .objects import FeaturePage, FeatureHistogram, use_agg_backend, render_to_file, render_to_rgba
+from icegraph.console import Console
+from icegraph.profiling import Profiler
 
+import os
 import numpy as np
+import pandas as pd
 from pathlib import Path
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Iterator, Optional, Sequence
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_pdf import PdfPages
 
 
 class FeaturePlot(IGPlot):
@@ -24,22 +31,300 @@ class FeaturePlot(IGPlot):
             save_path (Path): Path to save the plot.
         """
         if not save_path:
-            save_path = Path(self._config.user_config.output_dir) / f"feature_plot_{feature}.png"
+            save_path = Path(self._config.compiled.output_dir) / f"feature_plot_{feature}.png"
 
         # determine the vector index of the feature to plot
-        inverted_vector_map: dict[str, int] = generate_vector_mapping(self._config, invert=True)
+        inverted_vector_map: dict[str, int] = self._config.compiled.inverse_vector_mapping
         feature_idx = inverted_vector_map[feature]
 
-        # pull features from data
+        # pull features from data, and convert OM keys to xyz coords in one lookup
         features, labels, dom_ids = self._data.get_with_dom_id(event_idx)
-        values: list[float] = list(features[:, feature_idx])
+        page = FeaturePage(
+            event_idx=event_idx,
+            event_id=self._data.event_ids[event_idx],
+            feature=feature,
+            positions=self._detector.dom_positions(dom_ids),
+            values=features[:, feature_idx]
+        )
 
-        # convert OM keys to xyz coords
-        dom_coords = [self._detector.get_dom_coords(*_id) for _id in dom_ids]
+        # replaces any previous plot
+        page.draw(self._fig)
+        self.save(save_path)
+
+    def render_batch(
+        self,
+        event_indices: Sequence[int],
+        features: Sequence[str],
+        output: Path | None = None,
+        fmt: str = "png",
+        dpi: int = 100,
+        num_workers: Optional[int] = None,
+        chunk_events: int = 64
+    ) -> list[Path]:
+        """
+        Plot every combination of the given events and features.
 
-        data = list(zip(dom_coords, values))
-        data = np.array([list(coord) + [value] for coord, value in data])
+        Feature rows of each chunk of events are read with a single row group read, DOM positions are looked up
+        with one vectorized call per event, and figures are rendered on a process pool with the Agg backend.
 
-        # add to plot
-        self._ax.scatter(data[:, 2], data[:, 3])
-        self.save(save_path)
+        Args:
+            event_indices (Sequence[int]): Dataset indices of the events to plot.
+            features (Sequence[str]): Names of the DOM-level features to plot.
+            output (Path | None): A '.pdf' file to write all plots to as a multi-page PDF, or a directory to write one
+                '{feature}_{event_idx}.{fmt}' file per plot to. Defaults to 'feature_plots' in the output directory.
+            fmt (str): Image format of individual files (e.g. "png", "pdf", "svg").
+            dpi (int): Resolution in dots per inch. Multi-page PDF pages are rasterized at this resolution.
+            num_workers (Optional[int]): Number of rendering processes. Defaults to the number of CPUs; 0 renders
+                in this process.
+            chunk_events (int): Number of events loaded at once.
+
+        Returns:
+            list[Path]: Written files, in event-major order, or the single multi-page PDF.
+
+        Raises:
+            KeyError: If a feature is not part of the configured feature vector.
+        """
+        if output is None:
+            output = Path(self._config.compiled.output_dir) / "feature_plots"
+        output = Path(output)
+
+        feature_map: dict[str, int] = self._config.compiled.inverse_vector_mapping
+        unknown = [feature for feature in features if feature not in feature_map]
+        if unknown:
+            raise KeyError(f"Unknown features {unknown}, expected any of {list(feature_map)}")
+
+        multipage = output.suffix.lower() == ".pdf"
+        (output.parent if multipage else output).mkdir(parents=True, exist_ok=True)
+
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        num_pages = len(event_indices) * len(features)
+
+        executor: Executor | None = None
+        if num_workers > 0:
+            executor = ProcessPoolExecutor(
+                max_workers=num_workers,
+                initializer=use_agg_backend
+            )
+
+        written: list[Path] = []
+        progress = Console.progress("Rendering feature plots", total=num_pages, unit="plots")
+        try:
+            pdf = PdfPages(output) if multipage else None
+            try:
+                for pages in self._pages(event_indices, features, chunk_events):
+                    with Profiler.stage("render.draw"):
+                        if pdf is not None:
+                            images = self._map(executor, num_workers, render_to_rgba, pages, [dpi] * len(pages))
+                            for image in images:
+                                self._add_pdf_page(pdf, image, dpi)
+                                progress.update(1)
+                        else:
+                            paths = [output / f"{page.feature}_{page.event_idx}.{fmt}" for page in pages]
+                            for path in self._map(executor, num_workers, render_to_file, pages, paths, [dpi] * len(pages)):
+                                written.append(path)
+                                progress.update(1)
+            finally:
+                if pdf is not None:
+                    pdf.close()
+                    written.append(output)
+        finally:
+            progress.close()
+            if executor is not None:
+                executor.shutdown()
+
+        Console.out(f"Rendered {num_pages} feature plots to {output}")
+        return written
+
+    def _pages(self, event_indices: Sequence[int], features: Sequence[str], chunk_events: int) -> Iterator[list[FeaturePage]]:
+        """
+        Load the events in chunks and build the pages to render, event-major.
+
+        Yields:
+            list[FeaturePage]: Pages of one chunk of events.
+        """
+        feature_map: dict[str, int] = self._config.compiled.inverse_vector_mapping
+        features_file = self._data.open_features_file()
+
+        for start in range(0, len(event_indices), chunk_events):
+            chunk = [int(idx) for idx in event_indices[start:start + chunk_events]]
+
+            with Profiler.stage("render.load"):
+                table = self._data.read_row_groups(features_file, self._data.row_groups_for_indices(chunk))
+
+            pages = []
+            for idx in chunk:
+                event_id = self._data.event_ids[idx]
+                values, dom_ids = self._data.event_from_table(table, event_id)
+                positions = self._detector.dom_positions(dom_ids)
+                for feature in features:
+                    pages.append(FeaturePage(idx, event_id, feature, positions, values[:, feature_map[feature]]))
+            yield pages
+
+    @staticmethod
+    def _map(executor: Executor | None, num_workers: int, fn, *iterables) -> Iterator:
+        """
+        Map a function over the pages in order, on the executor if there is one.
+        """
+        if executor is None:
+            return map(fn, *iterables)
+        return executor.map(fn, *iterables, chunksize=max(1, len(iterables[0]) // (4 * num_workers)))
+
+    @staticmethod
+    def _add_pdf_page(pdf: PdfPages, image: np.ndarray, dpi: int) -> None:
+        """
+        Add a rasterized plot to a multi-page PDF as a page of the same size.
+        """
+        height, width = image.shape[:2]
+        fig = Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+        fig.figimage(image)
+        pdf.savefig(fig, dpi=dpi)
+
+
+class DistributionPlot(IGPlot):
+    """
+    A plotting utility for visualizing the distribution of DOM-level features over a whole dataset split.
+
+    The features file is streamed one row group at a time and only rows of the split's events are counted,
+    so memory use does not grow with the size of the dataset.
+    """
+
+    def accumulate(
+        self,
+        features: Sequence[str],
+        bins: int | Sequence[float] = 100,
+        ranges: Optional[dict[str, tuple[float, float]]] = None,
+        log: bool | Sequence[str] = False,
+        by: Optional[str] = None,
+        label_bins: int | Sequence[float] = 4
+    ) -> tuple[dict[str, FeatureHistogram], Optional[np.ndarray]]:
+        """
+        Fill one histogram per feature over all DOMs of the split's events.
+
+        Args:
+            features (Sequence[str]): Names of the DOM-level features.
+            bins (int | Sequence[float]): Number of bins, or explicit bin edges shared by all features.
+            ranges (Optional[dict[str, tuple[float, float]]]): Fixed range per feature. Features without a range
+                or explicit edges get adaptive bins.
+            log (bool | Sequence[str]): Whether to bin the base-10 logarithm of all features, or the features to do so for.
+            by (Optional[str]): Truth column to split each histogram by, e.g. an energy label.
+            label_bins (int | Sequence[float]): Edges of the truth column bins, or a number of bins with equal
+                numbers of events.
+
+        Returns:
+            tuple[dict[str, FeatureHistogram], Optional[np.ndarray]]: Histogram of each feature, and the truth
+                column bin edges when splitting by a truth column.
+
+        Raises:
+            KeyError: If a feature or the truth column does not exist.
+        """
+        columns = list(self._config.compiled.feature_columns)
+        unknown = [feature for feature in features if feature not in columns]
+        if unknown:
+            raise KeyError(f"Unknown features {unknown}, expected any of {columns}")
+
+        # group of each event of the split, by truth column bin
+        label_edges = None
+        event_groups = np.zeros(len(self._data), dtype=np.int64)
+        if by is not None:
+            if by not in self._data.truth_df.columns:
+                raise KeyError(f"Truth column {by!r} does not exist")
+            labels = self._data.truth_df[by].to_numpy(dtype=np.float64)
+            if np.ndim(label_bins):
+                label_edges = np.asarray(label_bins, dtype=np.float64)
+            else:
+                label_edges = np.unique(np.nanquantile(labels, np.linspace(0, 1, int(label_bins) + 1)))
+            # events outside the edges are skipped (-1), the last edge is inclusive
+            event_groups = np.searchsorted(label_edges, labels, side="right") - 1
+            event_groups[labels == label_edges[-1]] = len(label_edges) - 2
+            event_groups[(event_groups < 0) | (event_groups >= len(label_edges) - 1)] = -1
+
+        num_groups = len(label_edges) - 1 if label_edges is not None else 1
+        ranges = ranges or {}
+        log_features = set(features if log is True else (log or ()))
+        histograms = {
+            feature: FeatureHistogram(
+                feature,
+                bins=bins,
+                range=ranges.get(feature),
+                log=feature in log_features,
+                num_groups=num_groups
+            )
+            for feature in features
+        }
+
+        event_index = pd.Index(self._data.event_ids)
+        features_file = self._data.open_features_file()
+        progress = Console.progress(f"Histogramming {self._data.subset}", total=features_file.num_row_groups, unit="row groups")
+        with progress:
+            for rg in range(features_file.num_row_groups):
+                with Profiler.stage("render.read"):
+                    table = features_file.read_row_group(rg, columns=["event_id"] + list(features), use_threads=False)
+
+                with Profiler.stage("render.histogram"):
+                    # position of each row's event in the split, -1 for events outside the split
+                    positions = event_index.get_indexer(table.column("event_id").to_numpy(zero_copy_only=False))
+                    groups = np.where(positions >= 0, event_groups[positions], -1)
+                    keep = groups >= 0
+                    for feature, histogram in histograms.items():
+                        values = table.column(feature).to_numpy(zero_copy_only=False)
+                        histogram.fill(values[keep], groups[keep])
+
+                progress.update(1, nbytes=table.nbytes)
+
+        return histograms, label_edges
+
+    def plot_distributions(
+        self,
+        features: Sequence[str],
+        output: Path | None = None,
+        fmt: str = "png",
+        density: bool = False,
+        **kwargs
+    ) -> list[Path]:
+        """
+        Plot the distribution of each feature over the split, one page per feature.
+
+        Args:
+            features (Sequence[str]): Names of the DOM-level features.
+            output (Path | None): A '.pdf' file to write all plots to as a multi-page PDF, or a directory to write one
+                'distribution_{feature}.{fmt}' file per feature to. Defaults to 'distributions' in the output directory.
+            fmt (str): Image format of individual files.
+            density (bool): Whether to normalize each histogram (and each truth column bin) to unit area.
+            **kwargs: Binning arguments to pass to DistributionPlot.accumulate.
+
+        Returns:
+            list[Path]: Written files, or the single multi-page PDF.
+        """
+        if output is None:
+            output = Path(self._config.compiled.output_dir) / "distributions"
+        output = Path(output)
+
+        histograms, label_edges = self.accumulate(features, **kwargs)
+
+        group_labels = None
+        if label_edges is not None:
+            by = kwargs["by"]
+            group_labels = [f"{by} in [{lo:.3g}, {hi:.3g}]" for lo, hi in zip(label_edges[:-1], label_edges[1:])]
+
+        multipage = output.suffix.lower() == ".pdf"
+        (output.parent if multipage else output).mkdir(parents=True, exist_ok=True)
+
+        fig = Figure()
+        written: list[Path] = []
+        with Profiler.stage("render.draw"):
+            if multipage:
+                with PdfPages(output) as pdf:
+                    for histogram in histograms.values():
+                        histogram.draw(fig, group_labels, density)
+                        pdf.savefig(fig)
+                written.append(output)
+            else:
+                for feature, histogram in histograms.items():
+                    path = output / f"distribution_{feature}.{fmt}"
+                    histogram.draw(fig, group_labels, density)
+                    fig.savefig(path)
+                    written.append(path)
+
+        Console.out(f"Plotted distributions of {len(histograms)} features to {output}")
+        return written
@@ -0,0 +1,278 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Sequence
+
+import numpy as np
+import matplotlib
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+
+__all__ = ["FeaturePage", "FeatureHistogram", "use_agg_backend", "render_to_file", "render_to_rgba"]
+
+@dataclass
+class FeaturePage:
+    """
+    Everything needed to draw one feature of one event, detached from the dataset and geometry
+    so it can be sent to a rendering process.
+
+    Attributes:
+        event_idx (int): Dataset index of the event.
+        event_id (str): Composite event ID.
+        feature (str): Name of the DOM-level feature.
+        positions (np.ndarray): (x, y, z) of each hit DOM, of shape (num_DOMs, 3).
+        values (np.ndarray): Feature value of each hit DOM, of shape (num_DOMs,).
+        figsize (tuple[float, float]): Figure size in inches.
+    """
+    event_idx: int
+    event_id: str
+    feature: str
+    positions: np.ndarray
+    values: np.ndarray
+    figsize: tuple[float, float] = (6.4, 4.8)
+
+    def draw(self, fig: Figure) -> None:
+        """
+        Draw the feature value of every hit DOM against its depth.
+
+        Args:
+            fig (Figure): Figure to draw on. Any existing axes are removed.
+        """
+        fig.clf()
+        ax = fig.add_subplot(1, 1, 1)
+        ax.scatter(self.positions[:, 2], self.values, s=8)
+        ax.set_xlabel("z [m]")
+        ax.set_ylabel(self.feature)
+        ax.set_title(f"{self.feature} | {self.event_id}", fontsize="small")
+
+
+class FeatureHistogram:
+    """
+    A histogram of one feature, filled batch by batch with vectorized operations, optionally split into groups
+    (e.g. bins of a truth label). Memory use only depends on the number of bins and groups.
+
+    Bins are either fixed (explicit edges, or a range split into equal bins) or adaptive. Fixed histograms count
+    values outside the edges as under- and overflow. Adaptive histograms start from the range of the first batch
+    and, whenever a value falls outside, merge pairs of neighbouring bins to double the bin width and cover twice
+    the range, so no value is lost and the number of bins stays constant.
+
+    With `log`, the base-10 logarithm of the values is binned; values that are not positive count as underflow.
+
+    Attributes:
+        feature (str): Name of the feature.
+        counts (np.ndarray): Counts per group and bin, of shape (num_groups, num_bins).
+        underflow (np.ndarray): Values below the first edge, per group.
+        overflow (np.ndarray): Values above the last edge, per group.
+        nan (np.ndarray): Values which are not finite, per group.
+    """
+
+    def __init__(
+        self,
+        feature: str,
+        bins: int | Sequence[float] = 100,
+        range: Optional[tuple[float, float]] = None,
+        log: bool = False,
+        num_groups: int = 1
+    ) -> None:
+        """
+        Initialize an empty histogram.
+
+        Args:
+            feature (str): Name of the feature.
+            bins (int | Sequence[float]): Number of bins, or explicit bin edges (in log10 space with `log`).
+            range (Optional[tuple[float, float]]): Range of equal bins (in log10 space with `log`). Bins are adaptive
+                if neither edges nor a range are given.
+            log (bool): Whether to bin the base-10 logarithm of the values.
+            num_groups (int): Number of groups filled separately.
+
+        Raises:
+            ValueError: If the edges are not increasing, or an adaptive histogram is given an odd number of bins.
+        """
+        self.feature = feature
+        self.log = log
+        self.adaptive = range is None and np.ndim(bins) == 0
+
+        self._edges: Optional[np.ndarray] = None
+        self._lo: Optional[float] = None
+        self._width: Optional[float] = None
+
+        if np.ndim(bins):
+            self._edges = np.asarray(bins, dtype=np.float64)
+            if len(self._edges) < 2 or np.any(np.diff(self._edges) <= 0):
+                raise ValueError(f"Bin edges of {feature} must be increasing, got {bins}")
+            num_bins = len(self._edges) - 1
+        elif range is not None:
+            num_bins = int(bins)
+            self._lo, self._width = float(range[0]), (float(range[1]) - float(range[0])) / num_bins
+        else:
+            num_bins = int(bins)
+            if num_bins < 2 or num_bins % 2:
+                raise ValueError(f"Adaptive histograms need an even number of bins, got {num_bins} for {feature}")
+
+        self.counts = np.zeros((num_groups, num_bins), dtype=np.int64)
+        self.underflow = np.zeros(num_groups, dtype=np.int64)
+        self.overflow = np.zeros(num_groups, dtype=np.int64)
+        self.nan = np.zeros(num_groups, dtype=np.int64)
+
+    @property
+    def edges(self) -> np.ndarray:
+        """
+        Bin edges (in log10 space with `log`). Empty until an adaptive histogram receives its first value.
+
+        Returns:
+            np.ndarray: Array of num_bins + 1 edges.
+        """
+        if self._edges is not None:
+            return self._edges
+        if self._lo is None:
+            return np.empty(0)
+        return self._lo + self._width * np.arange(self.counts.shape[1] + 1)
+
+    def fill(self, values: np.ndarray, groups: Optional[np.ndarray] = None) -> None:
+        """
+        Add a batch of values.
+
+        Args:
+            values (np.ndarray): Feature values.
+            groups (Optional[np.ndarray]): Group index of each value. Defaults to group 0.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        groups = np.zeros(len(values), dtype=np.int64) if groups is None else np.asarray(groups, dtype=np.int64)
+        num_groups, num_bins = self.counts.shape
+
+        if self.log:
+            not_positive = values <= 0
+            self.underflow += np.bincount(groups[not_positive], minlength=num_groups)
+            values = np.log10(values, where=values > 0, out=np.full(len(values), np.nan))
+            finite = np.isfinite(values)
+            self.nan += np.bincount(groups[~finite & ~not_positive], minlength=num_groups)
+        else:
+            finite = np.isfinite(values)
+            self.nan += np.bincount(groups[~finite], minlength=num_groups)
+
+        values, groups = values[finite], groups[finite]
+        if not len(values):
+            return
+
+        if self._edges is not None:
+            idx = np.searchsorted(self._edges, values, side="right") - 1
+            # the last edge is inclusive
+            idx[values == self._edges[-1]] = num_bins - 1
+        else:
+            if self.adaptive:
+                self._extend(values.min(), values.max())
+            idx = np.floor((values - self._lo) / self._width).astype(np.int64)
+            if self.adaptive:
+                idx = np.clip(idx, 0, num_bins - 1)
+            else:
+                idx[values == self._lo + self._width * num_bins] = num_bins - 1
+
+        under, over = idx < 0, idx >= num_bins
+        self.underflow += np.bincount(groups[under], minlength=num_groups)
+        self.overflow += np.bincount(groups[over], minlength=num_groups)
+
+        inside = ~(under | over)
+        flat = groups[inside] * num_bins + idx[inside]
+        self.counts += np.bincount(flat, minlength=num_groups * num_bins).reshape(num_groups, num_bins)
+
+    def _extend(self, vmin: float, vmax: float) -> None:
+        """
+        Grow the range of an adaptive histogram until it covers [vmin, vmax].
+        """
+        num_bins = self.counts.shape[1]
+        if self._lo is None:
+            span = vmax - vmin
+            self._lo = vmin
+            self._width = span / num_bins * (1 + 1e-9) if span > 0 else max(abs(vmin), 1.0) * 1e-6
+            return
+
+        while vmin < self._lo or vmax >= self._lo + self._width * num_bins:
+            merged = self.counts.reshape(len(self.counts), num_bins // 2, 2).sum(axis=2)
+            empty = np.zeros_like(merged)
+            if vmin < self._lo:
+                self._lo -= self._width * num_bins
+                self.counts = np.concatenate([empty, merged], axis=1)
+            else:
+                self.counts = np.concatenate([merged, empty], axis=1)
+            self._width *= 2
+
+    def draw(self, fig: Figure, group_labels: Optional[Sequence[str]] = None, density: bool = False) -> None:
+        """
+        Draw the histogram of every group as a step line.
+
+        Args:
+            fig (Figure): Figure to draw on. Any existing axes are removed.
+            group_labels (Optional[Sequence[str]]): Legend label of each group.
+            density (bool): Whether to normalize each group to unit area.
+        """
+        fig.clf()
+        ax = fig.add_subplot(1, 1, 1)
+
+        edges = self.edges
+        if len(edges):
+            widths = np.diff(edges)
+            for group, counts in enumerate(self.counts):
+                heights = counts / max(counts.sum(), 1) / widths if density else counts
+                label = group_labels[group] if group_labels else None
+                ax.stairs(heights, edges, label=label)
+
+        ax.set_xlabel(f"log10({self.feature})" if self.log else self.feature)
+        ax.set_ylabel("density" if density else "DOMs")
+        if group_labels:
+            ax.legend(fontsize="small")
+
+        outside = int(self.underflow.sum() + self.overflow.sum() + self.nan.sum())
+        title = f"{self.feature} | {int(self.counts.sum())} DOMs"
+        ax.set_title(f"{title}, {outside} outside the bins" if outside else title, fontsize="small")
+
+
+def use_agg_backend() -> None:
+    """
+    Select the non-interactive Agg backend. Used as the initializer of rendering processes.
+    """
+    matplotlib.use("Agg")
+
+
+def _figure(page: FeaturePage, dpi: int) -> Figure:
+    """
+    Draw a page on a new figure attached to an Agg canvas, without going through pyplot.
+    """
+    fig = Figure(figsize=page.figsize, dpi=dpi)
+    FigureCanvasAgg(fig)
+    page.draw(fig)
+    return fig
+
+
+def render_to_file(page: FeaturePage, path: Path, dpi: int) -> Path:
+    """
+    Render a page to an image file. The format is taken from the file extension.
+
+    Args:
+        page (FeaturePage): Page to render.
+        path (Path): Output file.
+        dpi (int): Resolution in dots per inch.
+
+    Returns:
+        Path: The output file.
+    """
+    _figure(page, dpi).savefig(path, dpi=dpi)
+    return path
+
+
+def render_to_rgba(page: FeaturePage, dpi: int) -> np.ndarray:
+    """
+    Rasterize a page, so it can be assembled into a document by another process.
+
+    Args:
+        page (FeaturePage): Page to render.
+        dpi (int): Resolution in dots per inch.
+
+    Returns:
+        np.ndarray: RGBA pixels of shape (height, width, 4).
+    """
+    fig = _figure(page, dpi)
+    fig.canvas.draw()
+    return np.array(fig.canvas.buffer_rgba())
@@ -0,0 +1,195 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+import os
+import time
+from typing import Optional
+
+import psutil
+
+from icegraph.config import IGConfig
+
+
+__all__ = ["ResourceGovernor"]
+
+GB = 1024 ** 3
+
+class ResourceGovernor:
+    """
+    Picks worker counts and chunk sizes from the cores and memory available on the node, and tells running
+    stages when to hold back new work.
+
+    Memory is governed against a ceiling, `resources.max_rss_gb` or `resources.memory_fraction` of the node's
+    memory, which covers this process and all of its children (extraction workers, Dask workers of a local
+    cluster, DataLoader workers). Worker counts and chunk sizes are picked so the expected peak memory fits
+    in what is left under the ceiling and free on the node, and stages stop starting new work while the
+    resident memory is above `resources.pressure` of the ceiling.
+
+    Cores already busy with other work on the node, as measured by the load average, are not counted,
+    so jobs started together on a node do not each claim every core.
+
+    Attributes:
+        ceiling (int): Memory ceiling in bytes.
+    """
+
+    # peak memory of a single-process conversion, per byte of HDF5 table rows in memory
+    CONVERSION_MEMORY_FACTOR = 20
+
+    # smallest memory share a worker is started with
+    MIN_WORKER_BYTES = GB // 2
+
+    MIN_CHUNK_ROWS = 10_000
+
+    # seconds a memory pressure reading is reused for, so hot loops can poll it
+    PRESSURE_INTERVAL = 0.5
+
+    def __init__(self, config: IGConfig) -> None:
+        """
+        Initialize the governor.
+
+        Args:
+            config (IGConfig): IceGraph configuration object containing user settings.
+        """
+        self.settings = config.compiled.resources
+        total = psutil.virtual_memory().total
+        if self.settings.max_rss_gb is not None:
+            self.ceiling = min(int(self.settings.max_rss_gb * GB), total)
+        else:
+            self.ceiling = int(self.settings.memory_fraction * total)
+
+        self._pressure_checked = 0.0
+        self._under_pressure = False
+
+    def cores(self) -> int:
+        """
+        Cores available to this job: the cores it may run on, less reserved cores and cores busy with other
+        work (the 1-minute load average beyond this process).
+
+        Returns:
+            int: Number of usable cores, at least 1.
+        """
+        cores = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else psutil.cpu_count()
+        busy = max(0, round(psutil.getloadavg()[0]) - 1)
+        return max(1, min(cores, psutil.cpu_count() - busy) - self.settings.reserve_cores)
+
+    def rss(self) -> int:
+        """
+        Resident memory of this process and all of its children.
+
+        Returns:
+            int: Resident memory in bytes.
+        """
+        process = psutil.Process()
+        total = process.memory_info().rss
+        for child in process.children(recursive=True):
+            try:
+                total += child.memory_info().rss
+            except psutil.Error:
+                # exited since listing the children
+                continue
+        return total
+
+    def available_memory(self) -> int:
+        """
+        Memory new work may use: what is left under the ceiling, and free on the node.
+
+        Returns:
+            int: Available memory in bytes.
+        """
+        return max(0, min(self.ceiling - self.rss(), psutil.virtual_memory().available))
+
+    def under_pressure(self) -> bool:
+        """
+        Whether memory is close to running out: the resident memory of this process tree is above
+        `resources.pressure` of the ceiling, or the node has less than that share of its memory free.
+        Readings are reused for PRESSURE_INTERVAL seconds.
+
+        Returns:
+            bool: True if stages should hold back new work.
+        """
+        now = time.monotonic()
+        if now - self._pressure_checked >= self.PRESSURE_INTERVAL:
+            memory = psutil.virtual_memory()
+            self._under_pressure = (
+                self.rss() >= self.settings.pressure * self.ceiling
+                or memory.available < (1 - self.settings.pressure) * memory.total
+            )
+            self._pressure_checked = now
+        return self._under_pressure
+
+    def workers(self, worker_bytes: int, limit: Optional[int] = None) -> int:
+        """
+        Number of workers that fit on the available cores and memory.
+
+        Args:
+            worker_bytes (int): Expected peak memory of one worker.
+            limit (Optional[int]): Most workers that can be used (e.g. the number of tasks).
+
+        Returns:
+            int: Number of workers, at least 1.
+        """
+        workers = min(self.cores(), self.available_memory() // max(1, worker_bytes))
+        if limit is not None:
+            workers = min(workers, limit)
+        return max(1, workers)
+
+    def extraction_workers(self, num_files: Optional[int] = None) -> int:
+        """
+        Number of input files to extract in parallel, each by an IceTray process using up to
+        `resources.extraction_worker_gb`.
+
+        Args:
+            num_files (Optional[int]): Number of files to extract.
+
+        Returns:
+            int: Number of extraction workers.
+        """
+        return self.workers(int(self.settings.extraction_worker_gb * GB), num_files)
+
+    def conversion_workers(self) -> int:
+        """
+        Number of workers of a local Dask cluster for conversion and statistics.
+
+        Returns:
+            int: Number of Dask workers.
+        """
+        return self.workers(self.MIN_WORKER_BYTES)
+
+    def worker_memory(self, num_workers: int) -> int:
+        """
+        Memory limit of each of `num_workers` workers sharing the available memory.
+
+        Args:
+            num_workers (int): Number of workers.
+
+        Returns:
+            int: Memory limit in bytes, at least MIN_WORKER_BYTES.
+        """
+        return max(self.MIN_WORKER_BYTES, self.available_memory() // max(1, num_workers))
+
+    def chunk_rows(self, row_bytes: int, memory: Optional[int] = None) -> int:
+        """
+        Number of HDF5 rows a conversion task can reshape within a memory budget.
+
+        Args:
+            row_bytes (int): Size of one table row in memory.
+            memory (Optional[int]): Memory budget of the task. Defaults to the available memory.
+
+        Returns:
+            int: Rows per chunk, at least MIN_CHUNK_ROWS.
+        """
+        memory = self.available_memory() if memory is None else memory
+        return max(self.MIN_CHUNK_ROWS, memory // max(1, row_bytes * self.CONVERSION_MEMORY_FACTOR))
+
+    def dataloader_workers(self) -> int:
+        """
+        Number of DataLoader worker processes. Each worker starts as a copy of this process, so it is
+        expected to grow to the resident memory of this process.
+
+        Returns:
+            int: Number of DataLoader workers, 0 to load in the main process.
+        """
+        cores = self.cores() - 1
+        if cores < 1:
+            return 0
+        return min(cores, self.available_memory() // psutil.Process().memory_info().rss)
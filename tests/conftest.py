@@ -0,0 +1,46 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from icegraph.benchmark.synthetic import SyntheticDataset
+from icegraph.config import IGConfig
+
+
+# Level2-style input names, which differ only after their first dot
+SHARD_NAMES = (
+    "Level2_IC86.2016_data_Run00127991_Subrun00000000_00000000",
+    "Level2_IC86.2016_data_Run00127991_Subrun00000000_00000001",
+)
+
+
+@pytest.fixture(scope="session")
+def synthetic(tmp_path_factory) -> SyntheticDataset:
+    """
+    A small synthetic dataset, with its HDF5 extraction and converted Parquet files.
+    """
+    synthetic = SyntheticDataset(tmp_path_factory.mktemp("synthetic"), num_events=50, mean_doms=8.0, num_input_files=2)
+    synthetic.generate()
+    return synthetic
+
+
+@pytest.fixture(scope="session")
+def config(synthetic: SyntheticDataset) -> IGConfig:
+    """
+    Configuration of the synthetic dataset.
+    """
+    return IGConfig(synthetic.config_path)
+
+
+@pytest.fixture(scope="session")
+def shard_dir(synthetic: SyntheticDataset, tmp_path_factory) -> Path:
+    """
+    A directory of HDF5 shards, as written by FeatureExtractor.extract, with one file per input name.
+    """
+    shard_dir = tmp_path_factory.mktemp("shards")
+    for name in SHARD_NAMES:
+        shutil.copy(synthetic.hdf5_path, shard_dir / f"{name}.hdf5")
+    return shard_dir
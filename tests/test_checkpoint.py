@@ -0,0 +1,163 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+import json
+import multiprocessing
+import os
+import signal
+import time
+from pathlib import Path
+
+import pyarrow.dataset as ds
+import pytest
+from filelock import FileLock, Timeout
+
+from icegraph.config import IGConfig
+from icegraph.data.checkpoint import ShardCheckpoint, atomic_path, is_temporary
+from icegraph.data.converter import HDF5ToParquet
+from icegraph.data.extractor.models import FeatureExtractor
+
+from conftest import SHARD_NAMES
+
+
+def _convert_until_killed(config_path: Path, shard_dir: Path, output_dir: Path) -> None:
+    """
+    Convert the shards, killing this process part way through writing the second one.
+    """
+    converter = HDF5ToParquet(IGConfig(config_path), shard_dir, output_dir=output_dir)
+    convert_file = converter._convert_file
+
+    def convert_then_die(shard: Path) -> int:
+        if converter.checkpoint.done():
+            features_dir = converter.checkpoint.work_dir / "features"
+            features_dir.mkdir(parents=True, exist_ok=True)
+            with atomic_path(features_dir / f"{shard.stem}-0.parquet") as tmp:
+                tmp.write_bytes(b"partial")
+                os.kill(os.getpid(), signal.SIGKILL)
+        return convert_file(shard)
+
+    converter._convert_file = convert_then_die
+    converter.convert(resume=False)
+
+
+def _convert_concurrently(config_path: Path, input_file: Path, output_dir: Path, first: bool, events: tuple) -> None:
+    """
+    Convert the input in one of two processes building the same output, recording whether this one converted it.
+    """
+    started, waiting = events
+    converter = HDF5ToParquet(IGConfig(config_path), input_file, output_dir=output_dir)
+    convert_file = converter._convert_file
+    converted = []
+
+    def record(shard: Path) -> int:
+        converted.append(shard.name)
+        if first:
+            # keep the lock until the other process is waiting for it
+            started.set()
+            waiting.wait(timeout=60)
+            time.sleep(0.5)
+        return convert_file(shard)
+
+    if not first:
+        started.wait(timeout=60)
+        with pytest.raises(Timeout):
+            FileLock(converter.checkpoint.lock_path).acquire(timeout=0)
+        waiting.set()
+
+    converter._convert_file = record
+    result = converter.convert()
+    (output_dir / f"{'first' if first else 'second'}.json").write_text(
+        json.dumps({"output": str(result), "converted": converted})
+    )
+
+
+def _rows(output_dir: Path, table: str) -> int:
+    return ds.dataset(output_dir / table, format="parquet", partitioning="hive").count_rows()
+
+
+def test_shard_names_keep_dots():
+    paths = [Path(f"/data/{name}.i3.zst") for name in SHARD_NAMES]
+
+    assert list(FeatureExtractor._shard_names(paths)) == list(SHARD_NAMES)
+    assert [HDF5ToParquet._basename(Path(f"{name}.hdf5")) for name in SHARD_NAMES] == list(SHARD_NAMES)
+
+
+def test_shard_names_must_be_unique():
+    with pytest.raises(ValueError, match="same shard name"):
+        FeatureExtractor._shard_names([Path("a/run.i3.zst"), Path("b/run.i3.zst")])
+
+
+def test_shards_skip_temporary_files(config, tmp_path):
+    for name in (f".{SHARD_NAMES[0]}.tmp-123.hdf5", ".hidden.hdf5"):
+        (tmp_path / name).touch()
+    for name in SHARD_NAMES:
+        (tmp_path / f"{name}.hdf5").touch()
+
+    shards = HDF5ToParquet(config, tmp_path, output_dir=tmp_path / "out").shards
+
+    assert [shard.stem for shard in shards] == list(SHARD_NAMES)
+    assert not any(is_temporary(shard) for shard in shards)
+
+
+def test_killed_conversion_resumes(config, shard_dir, tmp_path):
+    process = multiprocessing.get_context("fork").Process(
+        target=_convert_until_killed, args=(config.user_config_path, shard_dir, tmp_path / "killed")
+    )
+    process.start()
+    process.join(timeout=300)
+    assert process.exitcode == -signal.SIGKILL
+
+    converter = HDF5ToParquet(config, shard_dir, output_dir=tmp_path / "killed")
+    checkpoint = converter.checkpoint
+    assert not checkpoint.complete
+    assert checkpoint.done() == [SHARD_NAMES[0]]
+    assert any(is_temporary(path) for path in checkpoint.work_dir.rglob("*"))
+
+    output_dir = converter.convert()
+
+    assert output_dir == checkpoint.final_dir and checkpoint.complete
+    assert not checkpoint.work_dir.exists()
+    assert not any(is_temporary(path) for path in output_dir.rglob("*"))
+
+    fresh = HDF5ToParquet(config, shard_dir, output_dir=tmp_path / "fresh").convert(resume=False)
+    for table in ("features", "truth"):
+        assert _rows(output_dir, table) == _rows(fresh, table) > 0
+    for name in SHARD_NAMES:
+        assert list(output_dir.rglob(f"{name}-*.parquet"))
+
+
+def test_start_removes_stale_temporary_files(tmp_path):
+    checkpoint = ShardCheckpoint(tmp_path / "build")
+    work_dir = checkpoint.start()
+    checkpoint.mark_done("a", events=1)
+    stale = [work_dir / ".b.tmp-1.hdf5", work_dir / ".shards" / ".b.tmp-1.json", work_dir / "features" / ".c.tmp-1"]
+    for path in stale:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+
+    checkpoint.start(resume=True)
+
+    assert checkpoint.done() == ["a"]
+    assert not any(path.exists() for path in stale)
+
+
+def test_concurrent_builds_share_one_output(config, synthetic, tmp_path):
+    context = multiprocessing.get_context("fork")
+    events = (context.Event(), context.Event())
+    processes = [
+        context.Process(
+            target=_convert_concurrently, args=(config.user_config_path, synthetic.hdf5_path, tmp_path, first, events)
+        )
+        for first in (True, False)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=300)
+    assert [process.exitcode for process in processes] == [0, 0]
+
+    first, second = (json.loads((tmp_path / f"{name}.json").read_text()) for name in ("first", "second"))
+    assert first["converted"] == [synthetic.hdf5_path.name]
+    assert second["converted"] == []
+    assert first["output"] == second["output"]
+    assert Path(first["output"]).is_dir() and not Path(f"{first['output']}.partial").exists()
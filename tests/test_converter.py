@@ -0,0 +1,26 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+import pyarrow.parquet as pq
+
+from icegraph.data.converter import HDF5ToParquet
+from icegraph.resources import ResourceGovernor
+
+
+def test_chunked_conversion_keeps_the_file_layout(config, synthetic, tmp_path, monkeypatch):
+    whole = HDF5ToParquet(config, synthetic.hdf5_path, output_dir=tmp_path / "whole").convert(resume=False)
+
+    # as if the node had memory for a few hundred rows only
+    monkeypatch.setattr(ResourceGovernor, "chunk_rows", lambda self, row_bytes, memory=None: 500)
+    chunked = HDF5ToParquet(config, synthetic.hdf5_path, output_dir=tmp_path / "chunked").convert(resume=False)
+
+    for name in ("features", "truth"):
+        assert (chunked / f"{name}.parquet").is_file()
+        assert not (chunked / name).exists()
+
+        expected = pq.read_table(whole / f"{name}.parquet")
+        keys = [(col, "ascending") for col in ("event_id", "dom_id") if col in expected.column_names]
+        actual = pq.read_table(chunked / f"{name}.parquet")
+        assert actual.sort_by(keys).equals(expected.sort_by(keys))
+
+    assert pq.ParquetFile(chunked / "features.parquet").num_row_groups > 1
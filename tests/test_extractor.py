@@ -0,0 +1,97 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pyarrow.parquet as pq
+import pytest
+import yaml
+
+from icegraph.config import IGConfig
+from icegraph.data import models
+from icegraph.data.extractor import FeatureExtractor
+from icegraph.data.extractor.objects import ExtractedEvent
+from icegraph.data.extractor.sources import FrameSource
+
+
+BATCH_EVENTS = 4
+
+
+class ListSource(FrameSource):
+    """
+    Produces a fixed list of events, standing in for the IceTray pipeline.
+    """
+
+    def __init__(self, events: list[ExtractedEvent]) -> None:
+        self.events = events
+
+    def stream(self, sink: Callable[[ExtractedEvent], None]) -> int:
+        for event in self.events:
+            sink(event)
+        return len(self.events)
+
+
+def _events(config: IGConfig, num_events: int = 14) -> list[ExtractedEvent]:
+    rng = np.random.default_rng(0)
+    num_features = len(config.compiled.feature_columns)
+    events = []
+    for i in range(num_events):
+        num_doms = int(rng.integers(1, 6))
+        events.append(ExtractedEvent(
+            # two runs, so that the partitioned layout splits some of the batches
+            ids={"Run": 1 + i * 2 // num_events, "Event": i, "SubEvent": 0, "SubEventStream": 0, "exists": 1},
+            doms=np.column_stack([rng.integers(1, 87, num_doms), np.arange(1, num_doms + 1), np.zeros(num_doms, int)]),
+            features=rng.random((num_doms, num_features)),
+            truth={"PrimaryNeutrinoEnergy": float(rng.uniform(10, 1000))}
+        ))
+    return events
+
+
+def _with_layout(config: IGConfig, path: Path, layout: str) -> IGConfig:
+    user_config = config.user_config.toDict()
+    user_config["storage"]["layout"] = layout
+    user_config["extraction"]["batch_events"] = BATCH_EVENTS
+    path.write_text(yaml.safe_dump(user_config))
+    return IGConfig(path)
+
+
+@pytest.mark.parametrize("layout", ["file", "partitioned"])
+def test_written_events_round_trip(config, tmp_path, layout):
+    config = _with_layout(config, tmp_path / "config.yaml", layout)
+    events = _events(config)
+    output_dir = FeatureExtractor(config, tmp_path / "input").extract_to_parquet(
+        ListSource(events), output_dir=tmp_path / "data", num_workers=1
+    )
+
+    event_columns = list(config.compiled.event_id_columns)
+    expected = {event.event_key(event_columns): event for event in events}
+    loaded = set()
+    for subset in (models.TrainingDataset, models.ValidationDataset, models.TestDataset):
+        data = subset(output_dir, config)
+        assert data.partitioned == (layout == "partitioned")
+        for idx, event_id in enumerate(data.event_ids):
+            features, labels = data[idx]
+            event = expected[event_id]
+            np.testing.assert_allclose(features.numpy(), event.features, rtol=1e-6)
+            np.testing.assert_allclose(labels.numpy(), [event.truth["PrimaryNeutrinoEnergy"]])
+            loaded.add(event_id)
+    assert loaded == set(expected)
+
+    # one row group per batch, or per partition of a batch
+    batches = [events[i:i + BATCH_EVENTS] for i in range(0, len(events), BATCH_EVENTS)]
+    files = sorted(output_dir.glob("features/**/*.parquet")) if layout == "partitioned" else [output_dir / "features.parquet"]
+    for path in files:
+        run = int(path.parent.name.split("=")[1]) if layout == "partitioned" else None
+        row_groups = [
+            [event.event_key(event_columns) for event in batch if run is None or event.ids["Run"] == run]
+            for batch in batches
+        ]
+        row_groups = [set(group) for group in row_groups if group]
+
+        file = pq.ParquetFile(path)
+        assert [
+            set(file.read_row_group(i, columns=["event_id"]).column("event_id").to_pylist())
+            for i in range(file.num_row_groups)
+        ] == row_groups
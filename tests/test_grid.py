@@ -0,0 +1,27 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+import numpy as np
+import torch
+
+from icegraph.geometry import DetectorGrid
+
+
+def test_dense_and_sparse_grids_agree_on_shared_cells():
+    grid = DetectorGrid(np.array([[1, 1], [1, 2], [2, 1], [2, 2]]))
+    # two PMTs of (1, 2) in the first event, and an IceTop DOM left out of the second
+    doms = np.array([[1, 2], [1, 2], [2, 1], [2, 2], [1, 61]])
+    cells = torch.from_numpy(grid.cells(doms))
+    batch = torch.tensor([0, 0, 0, 1, 1])
+    features = torch.arange(10, dtype=torch.float32).view(5, 2)
+
+    dense = grid.scatter(features, cells, batch, 2)
+    sparse = grid.sparse(features, cells, batch, 2)
+
+    assert torch.equal(dense, sparse.to_dense())
+    assert torch.equal(dense[0, 0, 1], features[0] + features[1])
+    assert grid.dropped_doms == 2
+
+    # a reused buffer holding another batch gives the same grid
+    out = torch.full((3 * grid.num_cells * 2,), 7.0)
+    assert torch.equal(grid.scatter(features, cells, batch, 2, out=out), dense)
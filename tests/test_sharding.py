@@ -0,0 +1,110 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+import json
+import os
+import socket
+from pathlib import Path
+
+import numpy as np
+import pytest
+import torch.distributed as dist
+import torch.multiprocessing as mp
+
+from icegraph.benchmark.synthetic import SyntheticDataset
+from icegraph.config import IGConfig
+from icegraph.data import RowGroupSharding, TrainingDataset, ValidationDataset
+
+
+WORLD_SIZE = 3
+EPOCHS = (0, 1, 2)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _record_shards(rank: int, data_dir: Path, config_path: Path, port: int, output: Path) -> None:
+    """
+    Open every split sharded over a gloo process group, and record the shards of this rank in each epoch.
+    """
+    os.environ["MASTER_ADDR"] = "127.0.0.1"
+    os.environ["MASTER_PORT"] = str(port)
+    dist.init_process_group("gloo", rank=rank, world_size=WORLD_SIZE)
+    try:
+        config = IGConfig(config_path)
+        shards = {}
+        for split in (TrainingDataset, ValidationDataset):
+            data = split(data_dir, config, RowGroupSharding.from_distributed(seed=7))
+            weights = np.array([len(events) for events in data._row_group_events])
+            shards[split.subset] = []
+            for epoch in EPOCHS:
+                data.set_epoch(epoch)
+                shards[split.subset].append({
+                    "row_groups": data.sharding.select(weights, epoch).tolist(),
+                    "event_ids": list(data.event_ids),
+                })
+        (output / f"{rank}.json").write_text(json.dumps(shards))
+    finally:
+        dist.destroy_process_group()
+
+
+@pytest.fixture(scope="module")
+def sharded(tmp_path_factory) -> tuple[SyntheticDataset, IGConfig, list[dict]]:
+    """
+    A synthetic dataset of many row groups, and the shards of every rank of a 3-process gloo group.
+    """
+    synthetic = SyntheticDataset(tmp_path_factory.mktemp("sharded"), num_events=300, mean_doms=8.0, row_group_size=100)
+    config = synthetic.generate(hdf5=False)
+    output = tmp_path_factory.mktemp("shards")
+
+    mp.spawn(
+        _record_shards,
+        args=(synthetic.parquet_dir, synthetic.config_path, _free_port(), output),
+        nprocs=WORLD_SIZE,
+        join=True
+    )
+    return synthetic, config, [json.loads((output / f"{rank}.json").read_text()) for rank in range(WORLD_SIZE)]
+
+
+def test_row_groups_are_disjoint_and_covered(sharded):
+    synthetic, config, shards = sharded
+    num_row_groups = TrainingDataset(synthetic.parquet_dir, config).features_file.num_row_groups
+    assert num_row_groups > WORLD_SIZE
+
+    for subset in ("train", "validation"):
+        for epoch in range(len(EPOCHS)):
+            row_groups = [rg for rank in shards for rg in rank[subset][epoch]["row_groups"]]
+            assert len(row_groups) == len(set(row_groups))
+            assert set(row_groups) == set(range(num_row_groups))
+
+
+def test_training_shards_are_even_and_rotate(sharded):
+    synthetic, config, shards = sharded
+    events = set(TrainingDataset(synthetic.parquet_dir, config).event_ids)
+
+    for epoch in range(len(EPOCHS)):
+        event_ids = [rank["train"][epoch]["event_ids"] for rank in shards]
+        assert len({len(ids) for ids in event_ids}) == 1
+        assert set().union(*map(set, event_ids)) == events
+
+    assert any(
+        rank["train"][0]["row_groups"] != rank["train"][epoch]["row_groups"]
+        for rank in shards for epoch in range(1, len(EPOCHS))
+    )
+
+
+def test_evaluation_shards_are_not_padded(sharded):
+    synthetic, config, shards = sharded
+    events = ValidationDataset(synthetic.parquet_dir, config).event_ids
+
+    for epoch in range(len(EPOCHS)):
+        event_ids = [event_id for rank in shards for event_id in rank["validation"][epoch]["event_ids"]]
+        assert sorted(event_ids) == sorted(events)
+
+
+def test_invalid_rank():
+    with pytest.raises(ValueError):
+        RowGroupSharding(num_replicas=2, rank=2)
@@ -0,0 +1,36 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+import shutil
+
+import torch
+import yaml
+
+from icegraph.config import IGConfig
+from icegraph.data import RowGroupSharding, StagingCache, TrainingDataset
+
+
+def test_unstaged_dataset_is_read_through_the_block_cache(config, synthetic, tmp_path):
+    data_dir = shutil.copytree(synthetic.parquet_dir, tmp_path / "data")
+    TrainingDataset.write_event_index(data_dir)
+
+    user_config = config.user_config.toDict()
+    # too small to stage anything
+    user_config["staging"].update(enabled=True, directory=str(tmp_path / "scratch"), max_size_gb=1e-9)
+    (tmp_path / "config.yaml").write_text(yaml.safe_dump(user_config))
+    staging_config = IGConfig(tmp_path / "config.yaml")
+
+    expected = TrainingDataset(data_dir, config)
+    for sharding in (None, RowGroupSharding(num_replicas=1, rank=0)):
+        data = TrainingDataset(data_dir, staging_config, sharding)
+        assert data.data_dir == data_dir.resolve() and data.filesystem is not None
+        assert sorted(data.event_ids) == sorted(expected.event_ids)
+        assert data.row_group_index == expected.row_group_index
+
+        event_id = expected.event_ids[0]
+        features, labels = data[data.event_ids.index(event_id)]
+        assert torch.equal(features, expected[0][0]) and torch.equal(labels, expected[0][1])
+
+    # features, truth and event index
+    blocks = tmp_path / "scratch" / f"{StagingCache.key(data_dir)}{StagingCache.BLOCKS_SUFFIX}"
+    assert len([path for path in blocks.iterdir() if path.name != "cache"]) == 3
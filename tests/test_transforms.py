@@ -0,0 +1,57 @@
+# Copyright (c) 2025 University of Maryland and the IceCube Collaboration.
+# Developed by Taylor St Jean
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+import torch
+import yaml
+
+from icegraph.config import IGConfig
+from icegraph.data import CompositeDataset, TrainingDataset
+from icegraph.data.converter import HDF5ToParquet
+
+
+TRANSFORMS = {
+    "features": [
+        {"class": "Log1p", "columns": ["total_charge"]},
+        {"class": "Clip", "columns": ["t_first_pulse"], "kwargs": {"min": 0.0, "max": 1.0}},
+    ],
+    "labels": [{"class": "Log10", "columns": ["PrimaryNeutrinoEnergy"]}],
+}
+
+
+def _with_transforms(config: IGConfig, path: Path, at_conversion: bool) -> IGConfig:
+    user_config = config.user_config.toDict()
+    user_config["transforms"] = {"at_conversion": at_conversion, **TRANSFORMS}
+    path.write_text(yaml.safe_dump(user_config))
+    return IGConfig(path)
+
+
+def _expected(features: torch.Tensor, labels: torch.Tensor, config: IGConfig) -> tuple[np.ndarray, np.ndarray]:
+    columns = list(config.compiled.feature_columns)
+    features, labels = features.numpy().astype(np.float64), labels.numpy().astype(np.float64)
+    features[:, columns.index("total_charge")] = np.log1p(features[:, columns.index("total_charge")])
+    features[:, columns.index("t_first_pulse")] = np.clip(features[:, columns.index("t_first_pulse")], 0.0, 1.0)
+    labels[:, 0] = np.log10(labels[:, 0])
+    return features, labels
+
+
+@pytest.mark.parametrize("at_conversion", [False, True])
+def test_dataloaders_apply_transforms(config, synthetic, tmp_path, at_conversion):
+    raw_dir = HDF5ToParquet(config, synthetic.hdf5_path, output_dir=tmp_path / "raw").convert()
+    raw_features, _, raw_labels = next(iter(TrainingDataset(raw_dir, config).dataloader(batch_size=16)))
+
+    transformed = _with_transforms(config, tmp_path / "config.yaml", at_conversion)
+    data_dir = HDF5ToParquet(transformed, synthetic.hdf5_path, output_dir=tmp_path / "transformed").convert()
+
+    data = TrainingDataset(data_dir, transformed)
+    assert bool(data.transforms) != at_conversion
+
+    composite = CompositeDataset(TrainingDataset, [data_dir], transformed)
+    expected_features, expected_labels = _expected(raw_features, raw_labels, config)
+    for loader in (data.dataloader(batch_size=16), composite.dataloader(weighted=False, batch_size=16)):
+        features, _, labels = next(iter(loader))
+        np.testing.assert_allclose(features.numpy(), expected_features, rtol=1e-5, atol=1e-6)
+        np.testing.assert_allclose(labels.numpy(), expected_labels, rtol=1e-6)